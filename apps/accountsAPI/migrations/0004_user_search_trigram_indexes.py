@@ -0,0 +1,49 @@
+from django.db import migrations
+
+
+# Case-insensitive lookups ('icontains', 'istartswith') compile to 'UPPER(column::text) LIKE'
+# on PostgreSQL, the trigram indexes are built on the same expression.
+INDEXES: list = [
+    ("auth.User", "username", "auth_user_username_upper_trgm"),
+    ("accountsAPI.UserProfile", "name", "accountsapi_userprofile_name_upper_trgm"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Creates the pg_trgm GIN indexes of the user search, PostgreSQL only.
+
+    Other databases (SQLite in development) run the same queries without these indexes.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for model_name, field, name in INDEXES:
+        table: str = apps.get_model(model_name)._meta.db_table
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {schema_editor.quote_name(table)} "
+            f"USING gin ((UPPER({schema_editor.quote_name(field)}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for _, _, name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('accountsAPI', '0003_rename_profile_name_userprofile_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+INDEX_NAME: str = "auth_user_date_joined_id_desc"
+
+
+def create_keyset_index(apps, schema_editor):
+    """
+    Creates the (date_joined, id) index of the user directory keyset.
+
+    'auth_user' belongs to django.contrib.auth, the index is created with SQL on the databases
+    that support 'CREATE INDEX IF NOT EXISTS' (PostgreSQL, SQLite).
+    """
+    if schema_editor.connection.vendor not in ("postgresql", "sqlite"):
+        return
+
+    table: str = apps.get_model("auth.User")._meta.db_table
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(INDEX_NAME)} "
+        f"ON {schema_editor.quote_name(table)} (date_joined DESC, id DESC)"
+    )
+
+
+def drop_keyset_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in ("postgresql", "sqlite"):
+        return
+
+    schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(INDEX_NAME)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('accountsAPI', '0004_user_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_keyset_index, drop_keyset_index),
+    ]
@@ -1,4 +1,8 @@
 from django.contrib.auth.models import User
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from apps.accountsAPI.models.user_profile_model import UserProfile
+from apps.accountsAPI.repositories.user_profile_repository import UserProfileRepository
 
 
 class UserListRepository:
@@ -6,31 +10,89 @@ class UserListRepository:
     Repository class for retrieving user lists based on different criteria.
 
     This class interacts with the 'User' model to retrieve user lists.
+
+    Methods prefixed with 'a' are the async versions, evaluated with async iteration.
     """
 
-    def get_all(self):
+    def get_all(self, after: tuple | None = None, limit: int | None = None, skip: int = 0):
         """
-        Retrieves a list of all users ordered by date joined.
+        Retrieves all users with their owner details, newest first.
+
+        If limit is provided the query stops at limit rows, continuing after the cursor in
+        keyset mode or skipping 'skip' rows in offset mode.
+
+        Args:
+            after (tuple): The (date_joined, id) pair of the last user of the previous page.
+            limit (int): The maximum number of users, all of them if not provided.
+            skip (int): The number of users skipped, for offset pages.
 
         Returns:
-            list: A list of user IDs.
+            list: Rows of 'UserProfileRepository.owner_fields' values and 'date_joined'.
         """
-        users: list = User.objects.all().order_by("-date_joined").values("id")
+        users = User.objects.order_by("-date_joined", "-id")
+
+        if after is not None:
+            date_joined, id = after
+            users = users.filter(
+                Q(date_joined__lt=date_joined) | Q(date_joined=date_joined, id__lt=id)
+            )
+
+        users = users.values(*UserProfileRepository.owner_fields, "date_joined")
+
+        if limit is not None:
+            users = users[skip : skip + limit]
+
+        return users
+
+    async def aget_all(self, after: tuple | None = None, limit: int | None = None, skip: int = 0):
+        users: list = [user async for user in self.get_all(after=after, limit=limit, skip=skip)]
 
         return users
 
+    async def acount_all(self) -> int:
+        count: int = await User.objects.acount()
+
+        return count
+
     def get_by_keyword(self, keyword: str):
         """
-        Retrieves a list of users based on a keyword search.
+        Retrieves the users whose username or name contains a keyword, with their owner details.
+
+        Exact usernames come first, then usernames and names starting with the keyword, then
+        the other matches, newest first within each group. On PostgreSQL the lookups are
+        served by the trigram indexes of migration 0004: the matching IDs are selected by a
+        UNION of one query per table, an OR across the join could use neither index.
 
         Args:
             keyword (str): The keyword for the user search.
 
         Returns:
-            list: A list of user IDs matching the keyword.
+            list: Rows of 'UserProfileRepository.owner_fields' values.
         """
+        rank = Case(
+            When(username__iexact=keyword, then=Value(0)),
+            When(username__istartswith=keyword, then=Value(1)),
+            When(userprofile__name__istartswith=keyword, then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField(),
+        )
+
+        ids = (
+            User.objects.filter(username__icontains=keyword)
+            .values("id")
+            .union(UserProfile.objects.filter(name__icontains=keyword).values("user_id"))
+        )
+
         users: list = (
-            User.objects.filter(username__icontains=keyword).order_by("-date_joined").values("id")
+            User.objects.filter(id__in=ids)
+            .annotate(rank=rank)
+            .order_by("rank", "-date_joined", "-id")
+            .values(*UserProfileRepository.owner_fields)
         )
 
         return users
+
+    async def aget_by_keyword(self, keyword: str):
+        users: list = [user async for user in self.get_by_keyword(keyword=keyword)]
+
+        return users
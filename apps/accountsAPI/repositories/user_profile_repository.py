@@ -3,14 +3,24 @@ from django.contrib.auth.models import User
 from apps.accountsAPI.models.user_profile_model import UserProfile
 from apps.accountsAPI.serializers.user_profile_serializers import UserProfileSerializer
 
+from utils.cache import get_region
+
 
 class UserProfileRepository:
     """
     Repository class for user profile-related database operations.
 
     This class encapsulates database interactions related to user profiles.
+    Owner details are cached in the 'owners' cache region.
+
+    Methods prefixed with 'a' are the async versions, built on the async ORM API, for the
+    async views and services.
     """
 
+    owners_cache = get_region("owners")
+
+    owner_fields: list = ["id", "username", "userprofile__profile_picture", "userprofile__name"]
+
     def create(self, user: int, name: str, **kwargs):
         """
         Creates a user profile.
@@ -25,6 +35,10 @@ class UserProfileRepository:
         instance: UserProfile = UserProfile.objects.get(user=id)
         return instance
 
+    async def aget_by_user_id(self, id: int):
+        instance: UserProfile = await UserProfile.objects.aget(user=id)
+        return instance
+
     def get_by_username(self, username: str):
         """
         Retrieves a user profile by username.
@@ -32,6 +46,10 @@ class UserProfileRepository:
         instance: UserProfile = UserProfile.objects.get(user__username=username)
         return instance
 
+    async def aget_by_username(self, username: str):
+        instance: UserProfile = await UserProfile.objects.aget(user__username=username)
+        return instance
+
     def update(self, serializer: UserProfileSerializer):
         """
         Updates a user profile.
@@ -39,13 +57,10 @@ class UserProfileRepository:
         instance: UserProfile = serializer.save()
         return instance
 
-    def get_owner(self, user_id: int):
+    def format_owner(self, result: dict):
         """
-        Retrieves owner details based on user ID.
+        Formats the owner details from a row of 'owner_fields' values.
         """
-        f = ["username", "userprofile__profile_picture", "userprofile__name"]
-        result: dict = User.objects.filter(id=user_id).values(*f).first()
-
         data: dict = {
             "username": result["username"],
             "profile_picture": result["userprofile__profile_picture"],
@@ -53,3 +68,83 @@ class UserProfileRepository:
         }
 
         return data
+
+    def get_owner(self, user_id: int):
+        """
+        Retrieves owner details based on user ID.
+        """
+        data: dict = self.owners_cache.get(user_id)
+        if data is not None:
+            return data
+
+        result: dict = User.objects.filter(id=user_id).values(*self.owner_fields).first()
+
+        data: dict = self.format_owner(result=result)
+
+        self.owners_cache.set(user_id, data)
+        return data
+
+    async def aget_owner(self, user_id: int):
+        """
+        Async version of 'get_owner', cache hits are served without leaving the event loop.
+        """
+        data: dict = await self.owners_cache.aget(user_id)
+        if data is not None:
+            return data
+
+        result: dict = await User.objects.filter(id=user_id).values(*self.owner_fields).afirst()
+
+        data: dict = self.format_owner(result=result)
+
+        await self.owners_cache.aset(user_id, data)
+        return data
+
+    def get_owners(self, user_ids: list[int]):
+        """
+        Retrieves owner details for several users in a single query.
+
+        Returns a dictionary mapping each found user ID to its owner details.
+        """
+        user_ids: set = set(user_ids)
+        data: dict = self.owners_cache.get_many(list(user_ids))
+
+        missing: set = user_ids - data.keys()
+        if not missing:
+            return data
+
+        results: list[dict] = User.objects.filter(id__in=missing).values(*self.owner_fields)
+
+        found: dict = {}
+        for result in results:
+            found[result["id"]] = self.format_owner(result=result)
+
+        self.owners_cache.set_many(found)
+        data.update(found)
+
+        return data
+
+    async def aget_owners(self, user_ids: list[int]):
+        """
+        Async version of 'get_owners', cache hits are served without leaving the event loop.
+        """
+        user_ids: set = set(user_ids)
+        data: dict = await self.owners_cache.aget_many(list(user_ids))
+
+        missing: set = user_ids - data.keys()
+        if not missing:
+            return data
+
+        found: dict = {}
+        async for result in User.objects.filter(id__in=missing).values(*self.owner_fields):
+            found[result["id"]] = self.format_owner(result=result)
+
+        await self.owners_cache.aset_many(found)
+        data.update(found)
+
+        return data
+
+    def invalidate_owner(self, user_id: int):
+        """
+        Removes the cached owner details of a user.
+        """
+        self.owners_cache.delete(user_id)
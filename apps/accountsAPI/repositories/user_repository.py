@@ -6,6 +6,8 @@ class UserRepository:
     Repository class for user-related database operations.
 
     This class encapsulates database interactions related to users.
+
+    Methods prefixed with 'a' are the async versions, built on the async ORM API.
     """
 
     def create_user(self, username: str, password: str):
@@ -22,6 +24,10 @@ class UserRepository:
         instance: User = User.objects.get(id=id)
         return instance
 
+    async def aget_by_id(self, id: int):
+        instance: User = await User.objects.aget(id=id)
+        return instance
+
     def get_by_username(self, username: str):
         """
         Retrieves a user by username.
@@ -29,6 +35,10 @@ class UserRepository:
         instance: User = User.objects.get(username=username)
         return instance
 
+    async def aget_by_username(self, username: str):
+        instance: User = await User.objects.aget(username=username)
+        return instance
+
     def get_by_email(self, email: str):
         """
         Retrieves a user by email.
@@ -36,6 +46,10 @@ class UserRepository:
         instance: User = User.objects.get(email=email)
         return instance
 
+    async def aget_by_email(self, email: str):
+        instance: User = await User.objects.aget(email=email)
+        return instance
+
     def username_exists(self, username: str):
         """
         Checks if a username exists.
@@ -43,6 +57,10 @@ class UserRepository:
         exists: bool = User.objects.filter(username=username).exists()
         return exists
 
+    async def ausername_exists(self, username: str):
+        exists: bool = await User.objects.filter(username=username).aexists()
+        return exists
+
     def email_exists(self, email: str):
         """
         Checks if an email exists.
@@ -50,6 +68,10 @@ class UserRepository:
         exists: bool = User.objects.filter(email=email).exists()
         return exists
 
+    async def aemail_exists(self, email: str):
+        exists: bool = await User.objects.filter(email=email).aexists()
+        return exists
+
     def check_password(self, instance: User, password: str):
         """
         Checks if a password is valid for a user.
@@ -1,3 +1,9 @@
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+
+from rest_framework.exceptions import ValidationError
+
 from apps.accountsAPI.repositories.user_list_repository import UserListRepository
 from apps.accountsAPI.repositories.user_profile_repository import UserProfileRepository
 from utils.pagination import Pagination
@@ -15,41 +21,114 @@ class UserListService:
     def get_by_keyword(self, keyword: str, page: int, page_size: int):
         """
         Retrieves a paginated user list based on a keyword search.
+
+        The owner details come with the matching users, no query is made per user.
         """
 
-        user_id_list: list[dict] = self.repository.get_by_keyword(keyword=keyword)
+        users: list[dict] = self.repository.get_by_keyword(keyword=keyword)
 
-        data: dict = self.pagination.paginate(
-            object_list=user_id_list, page=page, page_size=page_size
-        )
+        data: dict = self.pagination.paginate(object_list=users, page=page, page_size=page_size)
 
         items: list[dict] = []
         for user in data["items"]:
             item: dict = {}
-            item["user"] = self.user_profile_repository.get_owner(user_id=user["id"])
+            item["user"] = self.user_profile_repository.format_owner(result=user)
             items.append(item)
 
         data["items"] = items
 
         return data
 
-    def get_all(self, page: int, page_size: int, user_id: int | None = None):
+    def paginate_all(self, page: int, page_size: int):
         """
-        Retrieves a paginated list of all users.
+        Builds an exact offset page of all users, evaluated in the calling thread.
         """
-
-        user_id_list: list[dict] = self.repository.get_all()
-
         data: dict = self.pagination.paginate(
-            object_list=user_id_list, page=page, page_size=page_size
+            object_list=self.repository.get_all(), page=page, page_size=page_size
         )
+        data["items"] = list(data["items"])
+
+        return data
+
+    async def get_all(
+        self,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str | None = None,
+    ):
+        """
+        Retrieves a paginated list of all users, newest first.
+
+        With a cursor the users are paginated on the (date_joined, id) keyset and the totals
+        are only added when 'count' is 'exact' or 'cached'. Offset pages are exact by default,
+        see 'Pagination' for the count modes. The owner details come with the users.
+        """
+        if cursor is not None:
+            after: tuple | None = self.pagination.decode_cursor(cursor=cursor)
+            if after is not None:
+                after = (self.decode_date(value=after[0]), after[1])
+
+            users: list[dict] = await self.repository.aget_all(after=after, limit=page_size + 1)
+
+            # Cursors keep the microseconds of the join dates.
+            for user in users:
+                user["date_joined"] = user["date_joined"].isoformat()
+
+            data: dict = self.pagination.paginate_keyset(
+                object_list=users,
+                page_size=page_size,
+                cursor=cursor,
+                key="date_joined",
+                id_key="id",
+            )
+
+            if count is not None:
+                self.pagination.validate_count_mode(count=count, page=1)
+                data["paginator"]["total_items"] = await self.get_total(count=count)
+
+        else:
+            count = count or "exact"
+            self.pagination.validate_count_mode(count=count, page=page)
+
+            if count == "exact":
+                data: dict = await sync_to_async(self.paginate_all)(page=page, page_size=page_size)
+            else:
+                data: dict = await self.pagination.a_paginate_offset(
+                    fetch=self.repository.aget_all,
+                    page=page,
+                    page_size=page_size,
+                    count=count,
+                    count_key="users:all",
+                    count_query=self.repository.acount_all,
+                )
 
         items: list[dict] = []
         for user in data["items"]:
             item: dict = {}
-            item["user"] = self.user_profile_repository.get_owner(user_id=user["id"])
+            item["user"] = self.user_profile_repository.format_owner(result=user)
             items.append(item)
 
         data["items"] = items
 
         return data
+
+    def decode_date(self, value) -> datetime:
+        try:
+            return datetime.fromisoformat(value)
+
+        except (TypeError, ValueError):
+            message: str = "Invalid cursor"
+            raise ValidationError(detail={"message": message})
+
+    async def get_total(self, count: str) -> int | None:
+        if count == "exact":
+            return await self.repository.acount_all()
+
+        if count == "cached":
+            return await self.pagination.counts.get(
+                key="users:all", count=self.repository.acount_all
+            )
+
+        return None
@@ -1,7 +1,5 @@
 from rest_framework.exceptions import NotFound
 
-from asgiref.sync import sync_to_async
-
 from apps.accountsAPI.repositories.user_profile_repository import UserProfileRepository
 from apps.accountsAPI.models.user_profile_model import UserProfile
 from apps.accountsAPI.serializers.user_profile_serializers import UserProfileSerializer
@@ -28,6 +26,7 @@ class UserProfileService:
 
         fields: dict = serializer.validated_data
         instance: UserProfile = self.repository.create(**fields)
+        self.repository.invalidate_owner(user_id=instance.user_id)
 
         return instance
 
@@ -74,6 +73,7 @@ class UserProfileService:
             return None
 
         instance: UserProfile = self.repository.update(serializer=serializer)
+        self.repository.invalidate_owner(user_id=instance.user_id)
 
         return instance
 
@@ -94,4 +94,26 @@ class UserProfileService:
         return data
 
     async def a_get_owner(self, user_id: int):
-        return await sync_to_async(self.get_owner)(user_id=user_id)
+        data: dict = await self.repository.aget_owner(user_id=user_id)
+
+        return data
+
+    def get_owners(self, user_ids: list[int]):
+        """
+        Retrieves and formats information about the owners of several objects at once.
+
+        Args:
+            user_ids (list[int]): The IDs of the users (owners) for whom to retrieve information.
+
+        Returns:
+            dict: A dictionary mapping each user ID to its formatted user data.
+        """
+
+        data: dict = self.repository.get_owners(user_ids=user_ids)
+
+        return data
+
+    async def a_get_owners(self, user_ids: list[int]):
+        data: dict = await self.repository.aget_owners(user_ids=user_ids)
+
+        return data
@@ -9,6 +9,7 @@ from apps.accountsAPI.serializers.user_serialziers import (
 )
 
 from apps.accountsAPI.repositories.user_repository import UserRepository
+from apps.accountsAPI.repositories.user_profile_repository import UserProfileRepository
 
 
 class UserService:
@@ -19,6 +20,7 @@ class UserService:
     """
 
     repository = UserRepository()
+    user_profile_repository = UserProfileRepository()
 
     def create_user(self, data: dict, raise_exception: bool = True):
         """
@@ -100,6 +102,7 @@ class UserService:
             return None
 
         instance: User = self.repository.update_username(instance=instance, username=new_username)
+        self.user_profile_repository.invalidate_owner(user_id=instance.id)
 
         return instance
 
@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.accountsAPI.services.user_list_service import UserListService
@@ -24,6 +25,10 @@ class UserListAllAPIView(APIView):
     Request Query Parameters:
     - page (int): The page number for paginated results (default: 1).
     - page_size (int): The number of items per page in the result set (default: 4).
+    - cursor (str, optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (str, optional): How totals are computed, 'exact', 'none' or 'cached'. Offset pages
+      default to 'exact', cursor pages only include 'total_items' when it is provided.
 
     Response:
     - A JSON response containing the paginated list of all users.
@@ -35,6 +40,10 @@ class UserListAllAPIView(APIView):
 
     # Retrieve a paginated list of all users with custom pagination settings (page=2, page_size=10)
     GET /users/all?query=john&page=2&page_size=10
+
+    # Retrieve users with cursor pagination (first page, then the returned 'next_cursor')
+    GET /users/all?cursor=
+    GET /users/all?cursor=<next_cursor>
     ```
 
     Note: This endpoint allows any user to retrieve a paginated list of all users.
@@ -44,11 +53,19 @@ class UserListAllAPIView(APIView):
 
     service = UserListService()
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str | None = request.GET.get("count")
         user_id: int = request.user.id
 
-        data: dict = self.service.get_all(user_id=user_id, page=page, page_size=page_size)
+        try:
+            data: dict = await self.service.get_all(
+                user_id=user_id, page=page, page_size=page_size, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
         return Response(data=data, status=status.HTTP_200_OK)
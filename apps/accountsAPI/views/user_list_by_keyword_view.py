@@ -11,7 +11,7 @@ class UserListByKeywordAPIView(APIView):
     """
     API view for retrieving a list of users based on a keyword search.
 
-    This view allows any user, authenticated or not, to retrieve a list of users whose usernames contain the specified keyword.
+    This view allows any user, authenticated or not, to retrieve a list of users whose usernames or names contain the specified keyword.
 
     Endpoint:
     - GET /users/search: Retrieve a list of users based on a keyword search.
@@ -42,6 +42,7 @@ class UserListByKeywordAPIView(APIView):
     ```
 
     Note: This endpoint allows any user to search for users by providing a keyword.
+    Exact usernames are listed first, then usernames and names starting with the keyword.
     """
 
     permission_classes = [AllowAny]
@@ -1,6 +1,51 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class PollsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.pollsAPI'
+
+    def ready(self):
+        from utils.change_streams import change_stream_worker, subscribe
+        from utils.lifespan import on_shutdown, on_startup
+        from apps.pollsAPI.repositories.vote_counter_buffer import vote_counter_buffer
+        from apps.pollsAPI.services.front_page_service import front_page_feed
+        from apps.pollsAPI.services.poll_results_service import PollResultsService
+        from apps.pollsAPI.services.poll_results_stream_service import (
+            poll_results_stream_service,
+        )
+        from apps.pollsAPI.services.search_index_service import search_index
+
+        if settings.SEARCH["BACKEND"] not in ("mongo", "memory"):
+            raise ImproperlyConfigured("SEARCH_BACKEND must be 'mongo' or 'memory'.")
+
+        # Each worker holds its own index, the writes of the others come from the change stream.
+        if (
+            settings.SEARCH["BACKEND"] == "memory"
+            and settings.ASGI_SERVER["WORKERS"] > 1
+            and not settings.CHANGE_STREAMS["ENABLED"]
+        ):
+            raise ImproperlyConfigured(
+                "SEARCH_BACKEND 'memory' with several workers requires CHANGE_STREAMS_ENABLED."
+            )
+
+        # Flush the buffered vote counters before the server exits.
+        if vote_counter_buffer.enabled:
+            on_shutdown(vote_counter_buffer.close)
+
+        # Invalidate the cached poll data of every process when polls change.
+        subscribe("polls", PollResultsService().on_poll_change)
+        subscribe("polls", front_page_feed.on_poll_change)
+        subscribe("polls", poll_results_stream_service.on_poll_change)
+        subscribe("polls", search_index.on_poll_change)
+
+        # Build the in-process search index in the background.
+        if search_index.enabled:
+            on_startup(search_index.start)
+            on_shutdown(search_index.close)
+
+        if change_stream_worker.enabled:
+            on_startup(change_stream_worker.start)
+            on_shutdown(change_stream_worker.close)
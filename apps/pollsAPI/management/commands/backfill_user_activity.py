@@ -0,0 +1,84 @@
+from django.core.management.base import BaseCommand
+
+from utils.mongo import get_sync_database
+
+from apps.pollsAPI.repositories.user_activity_repository import UserActivityRepository
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the user activity timeline from the 'user_actions' collection.
+
+    Entries are merged on (user_id, action, poll_id), so the command can run against a live
+    database and repairs entries that failed to be written. Entries of actions that no longer
+    exist are removed with '--prune'.
+
+    Usage:
+    python manage.py backfill_user_activity
+    python manage.py backfill_user_activity --user-id 42
+    python manage.py backfill_user_activity --prune
+    """
+
+    help = "Rebuilds the user activity timeline from the user actions."
+
+    repository = UserActivityRepository()
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="Only rebuild the timeline of this user.")
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Remove the entries of actions that no longer exist.",
+        )
+
+    def handle(self, *args, **options):
+        polls_db = get_sync_database()
+        user_id: int | None = options["user_id"]
+
+        for action in self.repository.ACTIONS:
+            pipeline: list = self.repository.get_backfill_pipeline(action=action, user_id=user_id)
+            polls_db.user_actions.aggregate(pipeline)
+            self.stdout.write(f"Merged {action} entries.")
+
+        if options["prune"]:
+            removed: int = self.prune(polls_db=polls_db, user_id=user_id)
+            self.stdout.write(f"Removed {removed} stale entries.")
+
+        self.stdout.write(self.style.SUCCESS("Done."))
+
+    def prune(self, polls_db, user_id: int | None) -> int:
+        pipeline: list = [
+            {"$match": {} if user_id is None else {"user_id": user_id}},
+            {
+                "$lookup": {
+                    "from": "user_actions",
+                    "let": {"user_id": "$user_id", "poll_id": "$poll_id"},
+                    "pipeline": [
+                        {
+                            "$match": {
+                                "$expr": {
+                                    "$and": [
+                                        {"$eq": ["$poll_id", "$$poll_id"]},
+                                        {"$eq": ["$user_id", "$$user_id"]},
+                                    ]
+                                }
+                            }
+                        },
+                        {"$project": {action: 1 for action in self.repository.ACTIONS}},
+                    ],
+                    "as": "user_actions",
+                }
+            },
+            {"$project": {"action": 1, "user_actions": 1}},
+        ]
+
+        stale: list = []
+        for entry in polls_db.user_activity.aggregate(pipeline):
+            if not any(entry["action"] in actions for actions in entry["user_actions"]):
+                stale.append(entry["_id"])
+
+        if not stale:
+            return 0
+
+        result = polls_db.user_activity.delete_many({"_id": {"$in": stale}})
+        return result.deleted_count
@@ -0,0 +1,94 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+from bson import json_util
+from bson.objectid import ObjectId
+
+from django.core.management.base import BaseCommand, CommandError
+
+from utils.encoders import encode_document
+from utils.pagination import Pagination
+from utils.renderers import APIJSONRenderer
+
+
+class Command(BaseCommand):
+    """
+    Compares the list endpoints encoding paths on synthetic polls.
+
+    - legacy: 'json_util._json_convert' over the whole result, unwrap '$oid' and '$date'
+      on every poll, paginate, then render.
+    - single pass: paginate the raw documents, 'encode_document' on the page items, then render.
+
+    Usage:
+    python manage.py benchmark_encoder --polls 5000 --page-size 10 --rounds 20
+    """
+
+    help = "Benchmarks the BSON to API encoding of poll lists."
+
+    pagination = Pagination()
+    renderer = APIJSONRenderer()
+
+    def add_arguments(self, parser):
+        parser.add_argument("--polls", type=int, default=5000)
+        parser.add_argument("--page-size", type=int, default=10)
+        parser.add_argument("--rounds", type=int, default=20)
+
+    def build_polls(self, count: int) -> list[dict]:
+        now: datetime = datetime.now().replace(microsecond=0)
+
+        return [
+            {
+                "_id": ObjectId(),
+                "user_id": i % 100,
+                "title": f"Poll {i}",
+                "description": "Description " * 10,
+                "category": "Technology",
+                "privacy": "public",
+                "created_at": now - timedelta(minutes=i),
+                "votes_counter": i,
+                "options": [
+                    {"user_id": i % 100, "option_text": f"Option {o}", "votes": o} for o in range(4)
+                ],
+            }
+            for i in range(count)
+        ]
+
+    def legacy(self, polls: list[dict], page_size: int):
+        polls: list[dict] = json_util._json_convert(polls)
+        for poll in polls:
+            poll["id"] = poll["_id"]["$oid"]
+            del poll["_id"]
+            poll["created_at"] = poll["created_at"]["$date"]
+
+        data: dict = self.pagination.paginate(object_list=polls, page=1, page_size=page_size)
+        return self.renderer.render(data)
+
+    def single_pass(self, polls: list[dict], page_size: int):
+        data: dict = self.pagination.paginate(object_list=polls, page=1, page_size=page_size)
+        data["items"] = [encode_document(poll) for poll in data["items"]]
+        return self.renderer.render(data)
+
+    def measure(self, function, polls: list[dict], page_size: int, rounds: int) -> float:
+        start: float = time.perf_counter()
+        for _ in range(rounds):
+            function(polls=polls, page_size=page_size)
+
+        return (time.perf_counter() - start) / rounds * 1000
+
+    def handle(self, *args, **options):
+        polls: list[dict] = self.build_polls(count=options["polls"])
+        page_size: int = options["page_size"]
+        rounds: int = options["rounds"]
+
+        # Both paths must render the same page, key order aside.
+        if json.loads(self.legacy(polls, page_size)) != json.loads(self.single_pass(polls, page_size)):
+            raise CommandError("The single pass output differs from the legacy output.")
+
+        legacy: float = self.measure(self.legacy, polls, page_size, rounds)
+        single_pass: float = self.measure(self.single_pass, polls, page_size, rounds)
+
+        self.stdout.write(f"{options['polls']} polls, page size {page_size}, {rounds} rounds")
+        self.stdout.write(f"  legacy:      {legacy:.2f} ms per request")
+        self.stdout.write(f"  single pass: {single_pass:.2f} ms per request")
+        self.stdout.write(self.style.SUCCESS(f"  speedup:     {legacy / single_pass:.1f}x"))
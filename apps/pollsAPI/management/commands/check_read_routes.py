@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.mongo import get_database, get_read_preference, get_sync_client
+
+
+class Command(BaseCommand):
+    """
+    Shows the replica set member each read route is served from.
+
+    Runs a 'hello' command with the read preference of each route in
+    settings.MONGO["READ_ROUTES"], plus the default one, and prints the member that answered.
+    Against a local replica set the 'feeds' route should answer from a secondary.
+
+    Usage:
+    python manage.py check_read_routes
+    """
+
+    help = "Shows the replica set member each MongoDB read route is served from."
+
+    def handle(self, *args, **options):
+        client = get_sync_client()
+        routes: list = [None, *settings.MONGO["READ_ROUTES"]]
+
+        for route in routes:
+            polls_db = get_database(client=client, read_route=route)
+            hello: dict = polls_db.command("hello", read_preference=polls_db.read_preference)
+
+            role: str = "primary" if hello.get("isWritablePrimary") else "secondary"
+            if "setName" not in hello:
+                role = "standalone"
+
+            name: str = route or "default"
+            preference = get_read_preference(route=route) or client.read_preference
+            self.stdout.write(f"{name}: {hello.get('me', 'unknown')} ({role}) with {preference!r}")
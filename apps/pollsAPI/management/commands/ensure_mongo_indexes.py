@@ -0,0 +1,77 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from pymongo.errors import OperationFailure
+
+from utils.mongo import get_sync_database
+
+from apps.pollsAPI.utils.indexes import (
+    get_missing_indexes,
+    get_query_plans,
+    get_unused_indexes,
+)
+
+
+class Command(BaseCommand):
+    """
+    Creates the indexes declared in 'apps.pollsAPI.utils.indexes' and reports on them.
+
+    Missing indexes are created in the background, then every hot query is explained to
+    show the index it uses, and indexes without accesses since the server started are listed.
+
+    Usage:
+    python manage.py ensure_mongo_indexes
+    python manage.py ensure_mongo_indexes --check
+    """
+
+    help = "Creates missing MongoDB indexes and reports missing or unused ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report, exit with an error if required indexes are missing.",
+        )
+
+    def handle(self, *args, **options):
+        polls_db = get_sync_database()
+        missing: dict = get_missing_indexes(db=polls_db)
+
+        if options["check"]:
+            for collection, indexes in missing.items():
+                for index in indexes:
+                    self.stderr.write(f"Missing index {collection}.{index.document['name']}")
+
+            if missing:
+                raise CommandError("Required indexes are missing.")
+
+        else:
+            failed: bool = False
+            for collection, indexes in missing.items():
+                for index in indexes:
+                    name: str = index.document["name"]
+
+                    try:
+                        polls_db[collection].create_indexes([index])
+                        self.stdout.write(f"Created index {collection}.{name}")
+
+                    except OperationFailure as error:
+                        failed = True
+                        message: str = f"Index {collection}.{name} not created: {error}"
+                        self.stderr.write(self.style.ERROR(message))
+
+            if failed:
+                raise CommandError("Some indexes could not be created.")
+
+        self.stdout.write("\nQuery plans:")
+        for name, plan in get_query_plans(db=polls_db).items():
+            line: str = f"  {name}: {plan}"
+            self.stdout.write(self.style.ERROR(line) if plan == "COLLSCAN" else line)
+
+        unused: dict = get_unused_indexes(db=polls_db)
+        if unused:
+            self.stdout.write("\nUnused indexes since the server started:")
+            for collection, names in unused.items():
+                for name in names:
+                    self.stdout.write(self.style.WARNING(f"  {collection}.{name}"))
+
+        self.stdout.write(self.style.SUCCESS("\nDone."))
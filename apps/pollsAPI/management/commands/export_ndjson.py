@@ -0,0 +1,55 @@
+import asyncio
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from rest_framework.exceptions import ValidationError
+
+from apps.pollsAPI.services.export_service import ExportService
+
+
+class Command(BaseCommand):
+    """
+    Exports polls, user actions or comments as NDJSON, the same output as GET /export/{collection}.
+
+    Only public polls, and the user actions and comments on them, are exported unless
+    '--user-id' is given.
+
+    Usage:
+    python manage.py export_ndjson polls --output polls.ndjson
+    python manage.py export_ndjson comments --gzip --output comments.ndjson.gz
+    python manage.py export_ndjson user_actions --after 6123456789abcdef01234567 >> user_actions.ndjson
+    """
+
+    help = "Exports a collection as NDJSON with constant memory."
+
+    service = ExportService()
+
+    def add_arguments(self, parser):
+        parser.add_argument("collection", choices=ExportService.COLLECTIONS)
+        parser.add_argument("--after", help="Resume after the document with this ID.")
+        parser.add_argument("--user-id", type=int, help="Also export the private polls of this user.")
+        parser.add_argument("--gzip", action="store_true")
+        parser.add_argument("--output", help="Output file, the standard output by default.")
+
+    def handle(self, *args, **options):
+        try:
+            self.service.validate(collection=options["collection"], after=options["after"])
+
+        except ValidationError as error:
+            raise CommandError(error.detail["message"])
+
+        output = open(options["output"], "wb") if options["output"] else sys.stdout.buffer
+
+        try:
+            asyncio.run(self.export(output=output, **options))
+
+        finally:
+            if options["output"]:
+                output.close()
+
+    async def export(self, output, collection: str, after: str, user_id: int, gzip: bool, **options):
+        async for chunk in self.service.stream(
+            collection=collection, user_id=user_id, after=after, gzip=gzip
+        ):
+            output.write(chunk)
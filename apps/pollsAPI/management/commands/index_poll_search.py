@@ -0,0 +1,53 @@
+from pymongo import ReplaceOne
+
+from django.core.management.base import BaseCommand
+
+from utils.mongo import get_sync_database
+
+from apps.pollsAPI.repositories.poll_search_repository import PollSearchRepository
+from apps.pollsAPI.utils.projections import SEARCH_INDEX_PROJECTION
+
+
+class Command(BaseCommand):
+    """
+    Builds the n-gram index of the keyword search from the 'polls' collection.
+
+    Entries are replaced by poll ID, so the command can run against a live database. Polls
+    created or updated afterwards are indexed by PollRepository.
+
+    Usage:
+    python manage.py index_poll_search
+    python manage.py index_poll_search --batch-size 1000
+    """
+
+    help = "Builds the n-gram index of the keyword search."
+
+    repository = PollSearchRepository()
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=500, help="Entries written per batch."
+        )
+
+    def handle(self, *args, **options):
+        polls_db = get_sync_database()
+        batch_size: int = options["batch_size"]
+
+        batch: list = []
+        indexed: int = 0
+
+        for poll in polls_db.polls.find({}, projection=SEARCH_INDEX_PROJECTION):
+            batch.append(
+                ReplaceOne({"_id": poll["_id"]}, self.repository.entry(poll=poll), upsert=True)
+            )
+
+            if len(batch) >= batch_size:
+                polls_db.poll_search.bulk_write(batch, ordered=False)
+                indexed += len(batch)
+                batch = []
+
+        if batch:
+            polls_db.poll_search.bulk_write(batch, ordered=False)
+            indexed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} polls."))
@@ -0,0 +1,45 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from apps.pollsAPI.services.search_index_service import SearchIndexService
+
+
+class Command(BaseCommand):
+    """
+    Builds the in-process search index and reports its size and build time.
+
+    Gives the memory each server process needs with SEARCH_BACKEND = "memory", optionally
+    timing a few queries against the built index.
+
+    Usage:
+    python manage.py search_index_stats
+    python manage.py search_index_stats --query "best movie" --query music
+    """
+
+    help = "Builds the in-process search index and reports its size and build time."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--query", action="append", default=[], help="Query to time.")
+
+    def handle(self, *args, **options):
+        asyncio.run(self.report(queries=options["query"]))
+
+    async def report(self, queries: list[str]):
+        index = SearchIndexService(enabled=True)
+        await index.build()
+
+        stats: dict = index.stats()
+        self.stdout.write(f"Documents: {stats['documents']}")
+        self.stdout.write(f"Terms: {stats['terms']}")
+        self.stdout.write(f"Postings: {stats['postings']}")
+        self.stdout.write(f"Memory: {stats['bytes'] / 1024 / 1024:.1f} MiB")
+        self.stdout.write(f"Build time: {stats['build_seconds']:.2f} s")
+
+        loop = asyncio.get_running_loop()
+        for query in queries:
+            started_at: float = loop.time()
+            ids, total = index.search(keyword=query, skip=0, limit=10)
+            elapsed_ms: float = (loop.time() - started_at) * 1000
+
+            self.stdout.write(f"'{query}': {total} matches in {elapsed_ms:.2f} ms")
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from utils.mongo import get_sync_database
+
+
+class Command(BaseCommand):
+    """
+    Removes the legacy 'voters' array from poll documents.
+
+    Voter membership is stored in the 'user_actions' collection ('has_voted'), backed by a
+    unique (poll_id, user_id) index. This command strips the arrays in batches so it can run
+    against a live database, then makes sure the unique index exists.
+
+    Usage:
+    python manage.py strip_poll_voters --batch-size 500
+    """
+
+    help = "Removes the legacy 'voters' array from poll documents in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size: int = options["batch_size"]
+        polls_db = get_sync_database()
+
+        total: int = 0
+        while True:
+            ids: list = [
+                poll["_id"]
+                for poll in polls_db.polls.find(
+                    {"voters": {"$exists": True}}, projection={"_id": 1}, limit=batch_size
+                )
+            ]
+
+            if not ids:
+                break
+
+            result = polls_db.polls.update_many({"_id": {"$in": ids}}, {"$unset": {"voters": ""}})
+            total += result.modified_count
+            self.stdout.write(f"Stripped voters from {total} polls.")
+
+        try:
+            polls_db.user_actions.create_index(
+                [("poll_id", ASCENDING), ("user_id", ASCENDING)], unique=True
+            )
+
+        except (DuplicateKeyError, OperationFailure) as error:
+            message: str = f"Unique (poll_id, user_id) index not created: {error}"
+            raise CommandError(message) from error
+
+        self.stdout.write(self.style.SUCCESS(f"Done, {total} polls updated."))
@@ -0,0 +1,82 @@
+from bson.objectid import ObjectId
+
+from pymongo import ASCENDING
+
+from utils.mongo import MongoRepository
+
+from apps.pollsAPI.utils.projections import POLL_PROJECTION
+
+
+class ExportRepository(MongoRepository):
+    """
+    Repository for exporting whole collections.
+
+    Every method is an async generator over a cursor sorted by '_id', so documents are read
+    from the server 'batch_size' at a time and an export can resume after the last '_id' seen.
+    """
+
+    read_route = "feeds"
+
+    batch_size: int = 500
+
+    def privacy_filter(self, user_id: int | None, prefix: str = "") -> dict:
+        """
+        Builds the privacy filter of PollListRepository, public polls and those owned by the user.
+        """
+        return {
+            "$or": [
+                {f"{prefix}privacy": "public"},
+                {f"{prefix}privacy": "private", f"{prefix}user_id": user_id},
+            ]
+        }
+
+    def after_filter(self, after: str | None) -> dict:
+        return {"_id": {"$gt": ObjectId(after)}} if after else {}
+
+    async def iter_polls(self, user_id: int | None, after: str | None = None):
+        cursor = self.polls_db.polls.find(
+            {**self.after_filter(after=after), **self.privacy_filter(user_id=user_id)},
+            projection=POLL_PROJECTION,
+            sort=[("_id", ASCENDING)],
+            batch_size=self.batch_size,
+        )
+
+        async for poll in cursor:
+            yield poll
+
+    async def iter_by_poll(self, collection: str, user_id: int | None, after: str | None = None):
+        """
+        Iterates the documents of a collection referencing a poll ('poll_id'),
+        leaving out those of polls the user cannot access.
+        """
+        pipeline: list = [
+            {"$match": self.after_filter(after=after)},
+            {"$sort": {"_id": ASCENDING}},
+            {
+                "$lookup": {
+                    "from": "polls",
+                    "localField": "poll_id",
+                    "foreignField": "_id",
+                    "pipeline": [{"$project": {"_id": 0, "privacy": 1, "user_id": 1}}],
+                    "as": "poll",
+                }
+            },
+            {"$unwind": "$poll"},
+            {"$match": self.privacy_filter(user_id=user_id, prefix="poll.")},
+            {"$project": {"poll": 0}},
+        ]
+
+        cursor = self.polls_db[collection].aggregate(pipeline, batchSize=self.batch_size)
+
+        async for document in cursor:
+            yield document
+
+    async def iter_user_actions(self, user_id: int | None, after: str | None = None):
+        async for user_actions in self.iter_by_poll(
+            collection="user_actions", user_id=user_id, after=after
+        ):
+            yield user_actions
+
+    async def iter_comments(self, user_id: int | None, after: str | None = None):
+        async for comment in self.iter_by_poll(collection="comments", user_id=user_id, after=after):
+            yield comment
@@ -3,17 +3,23 @@ from bson.objectid import ObjectId
 
 from pymongo import DESCENDING
 
-from mdb_singleton import MongoDBSingletonAsync
+from utils.mongo import MongoRepository
 
 
-class PollCommentListRepository:
-    client = MongoDBSingletonAsync().client
-    polls_db = client["polls_db"]
+class PollCommentListRepository(MongoRepository):
+    read_route = "feeds"
 
-    async def get_by_poll_id(self, id: str):
+    async def get_by_poll_id(self, id: str, limit: int | None = None, skip: int = 0):
+        """
+        Retrieves the comments of a poll, newest first.
+
+        If limit is provided only 'limit' comments after the first 'skip' ones are loaded.
+        """
         comments: list[BSON] = await self.polls_db.comments.find(
             {"poll_id": ObjectId(id)},
             sort=[("created_at", DESCENDING)],
-        ).to_list(length=None)
+            skip=skip,
+            limit=limit or 0,
+        ).to_list(length=limit)
 
         return comments
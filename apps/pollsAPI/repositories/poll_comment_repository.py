@@ -5,13 +5,10 @@ from bson.objectid import ObjectId
 
 from rest_framework.exceptions import NotFound
 
-from mdb_singleton import MongoDBSingletonAsync
+from utils.mongo import MongoRepository
 
 
-class PollCommentRepository:
-    client = MongoDBSingletonAsync().client
-    polls_db = client["polls_db"]
-
+class PollCommentRepository(MongoRepository):
     async def create(self, poll_id: str, user_id: int, comment: str):
         """
         Creates a new poll comment.
@@ -32,7 +29,7 @@ class PollCommentRepository:
                 # Add count to comment counter in the poll document.
                 await self.polls_db.polls.update_one(
                     {"_id": ObjectId(poll_id)},
-                    {"$inc": {"comments_counter": 1}},
+                    {"$inc": {"comments_counter": 1, "version": 1}},
                     session=session,
                 )
 
@@ -76,7 +73,7 @@ class PollCommentRepository:
                 # Remove count to comment counter in the poll document.
                 await self.polls_db.polls.update_one(
                     {"_id": ObjectId(poll_id)},
-                    {"$inc": {"comments_counter": -1}},
+                    {"$inc": {"comments_counter": -1, "version": 1}},
                     session=session,
                 )
 
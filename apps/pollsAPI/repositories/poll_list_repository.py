@@ -1,141 +1,123 @@
 from bson import BSON
+from bson.objectid import ObjectId
 
 from pymongo import DESCENDING
 
-from mdb_singleton import MongoDBSingletonAsync
+from utils.mongo import MongoRepository
 
+from apps.pollsAPI.utils.projections import POLL_PROJECTION
 
-class PollListRepository:
-    client = MongoDBSingletonAsync().client
-    polls_db = client["polls_db"]
 
-    async def get_all(self):
-        polls: list = await self.polls_db.polls.find(
-            {"privacy": "public"},
-            sort=[("created_at", DESCENDING)],
-        ).to_list(None)
+class PollListRepository(MongoRepository):
+    # Public feeds and search, a few seconds of staleness is fine.
+    read_route = "feeds"
 
-        return polls
+    def keyset_filter(self, key: str, after: tuple | None, id_key: str = "_id") -> dict:
+        """
+        Builds the range filter that continues a (key, id_key) descending keyset after a cursor.
+
+        Args:
+            key (str): The field the query is sorted by.
+            after (tuple): The (value, id) pair of the last item of the previous page.
+            id_key (str): The unique field used as tiebreaker.
+        """
+        if after is None:
+            return {}
+
+        value, id = after
+        return {"$or": [{key: {"$lt": value}}, {key: value, id_key: {"$lt": id}}]}
 
-    async def get_by_keyword(self, keyword: str, user_id: int) -> list[BSON]:
+    async def find_polls(
+        self, filter: dict, after: tuple | None = None, limit: int | None = None, skip: int = 0
+    ) -> list[BSON]:
+        """
+        Retrieves polls sorted by creation date, newest first.
+
+        If limit is provided the query stops at limit rows instead of loading the whole result,
+        continuing after the cursor in keyset mode or skipping 'skip' rows in offset mode.
+        """
+        if limit is None:
+            polls: list = await self.polls_db.polls.find(
+                filter, projection=POLL_PROJECTION, sort=[("created_at", DESCENDING)]
+            ).to_list(length=None)
+
+            return polls
+
+        keyset: dict = self.keyset_filter(key="created_at", after=after)
         polls: list = await self.polls_db.polls.find(
-            {
-                "$text": {"$search": keyword},
-                "$or": [{"privacy": "public"}, {"privacy": "private", "user_id": user_id}],
-            },
-            sort=[("votes", DESCENDING)],
-        ).to_list(None)
+            {"$and": [filter, keyset]} if keyset else filter,
+            projection=POLL_PROJECTION,
+            sort=[("created_at", DESCENDING), ("_id", DESCENDING)],
+            skip=skip,
+            limit=limit,
+        ).to_list(length=limit)
 
         return polls
 
-    async def get_by_user_id(self, id: int, user_id: int) -> list[BSON]:
+    async def get_by_ids(self, ids: list[ObjectId]) -> list[BSON]:
+        """
+        Retrieves polls by their IDs, in the order of the IDs. Missing polls are left out.
+        """
         polls: list = await self.polls_db.polls.find(
-            {
-                "user_id": id,
-                "$or": [
-                    {"privacy": "public"},
-                    {"privacy": "private", "user_id": user_id},
-                ],
-            },
-            sort=[("created_at", DESCENDING)],
+            {"_id": {"$in": ids}}, projection=POLL_PROJECTION
         ).to_list(length=None)
 
-        return polls
+        polls_by_id: dict = {poll["_id"]: poll for poll in polls}
+        return [polls_by_id[id] for id in ids if id in polls_by_id]
 
-    async def get_by_user_votes(self, id: int, user_id: int) -> list[BSON]:
-        polls: list = await self.polls_db.user_actions.aggregate(
-            [
-                {"$match": {"user_id": id, "has_voted": {"$exists": True}}},
-                {"$project": {"_id": 0, "poll_id": 1, "has_voted": 1}},
-                {"$sort": {"has_voted.voted_at": DESCENDING}},
-                {
-                    "$lookup": {
-                        "from": "polls",
-                        "localField": "poll_id",
-                        "foreignField": "_id",
-                        "as": "poll",
-                    }
-                },
-                {"$unwind": "$poll"},
-                {
-                    "$match": {
-                        "$or": [
-                            {"poll.privacy": "public"},
-                            {"poll.privacy": "private", "poll.user_id": user_id},
-                        ]
-                    }
-                },
-                {"$replaceRoot": {"newRoot": "$poll"}},
-            ]
-        ).to_list(length=None)
+    async def count(self, filter: dict) -> int:
+        count: int = await self.polls_db.polls.count_documents(filter)
+        return count
 
-        return polls
+    def visible_filter(self, user_id: int) -> dict:
+        return {"$or": [{"privacy": "public"}, {"privacy": "private", "user_id": user_id}]}
 
-    async def get_by_user_shares(self, id: int, user_id: int) -> list[BSON]:
-        polls: list = await self.polls_db.user_actions.aggregate(
-            [
-                {"$match": {"user_id": int(id), "has_shared": {"$exists": True}}},
-                {"$project": {"_id": 0, "poll_id": 1, "has_shared": 1}},
-                {"$sort": {"has_shared.shared_at": DESCENDING}},
-                {
-                    "$lookup": {
-                        "from": "polls",
-                        "localField": "poll_id",
-                        "foreignField": "_id",
-                        "as": "poll",
-                    }
-                },
-                {"$unwind": "$poll"},
-                {
-                    "$match": {
-                        "$or": [
-                            {"poll.privacy": "public"},
-                            {"poll.privacy": "private", "poll.user_id": user_id},
-                        ]
-                    }
-                },
-                {"$replaceRoot": {"newRoot": "$poll"}},
-            ]
-        ).to_list(length=None)
+    def user_filter(self, id: int, user_id: int) -> dict:
+        return {"user_id": id, **self.visible_filter(user_id=user_id)}
+
+    def category_filter(self, category: str, user_id: int) -> dict:
+        return {"category": category, **self.visible_filter(user_id=user_id)}
+
+    async def get_all(
+        self, after: tuple | None = None, limit: int | None = None, skip: int = 0
+    ):
+        polls: list = await self.find_polls(
+            filter={"privacy": "public"}, after=after, limit=limit, skip=skip
+        )
 
         return polls
 
-    async def get_by_user_bookmarks(self, id: int, user_id: int) -> list[BSON]:
-        polls: list = await self.polls_db.user_actions.aggregate(
-            [
-                {"$match": {"user_id": int(id), "has_bookmarked": {"$exists": True}}},
-                {"$project": {"_id": 0, "poll_id": 1, "has_bookmarked": 1}},
-                {"$sort": {"has_bookmarked.bookmarked_at": DESCENDING}},
-                {
-                    "$lookup": {
-                        "from": "polls",
-                        "localField": "poll_id",
-                        "foreignField": "_id",
-                        "as": "poll",
-                    }
-                },
-                {"$unwind": "$poll"},
-                {
-                    "$match": {
-                        "$or": [
-                            {"poll.privacy": "public"},
-                            {"poll.privacy": "private", "poll.user_id": user_id},
-                        ]
-                    }
-                },
-                {"$replaceRoot": {"newRoot": "$poll"}},
-            ]
-        ).to_list(length=None)
+    async def count_all(self) -> int:
+        count: int = await self.polls_db.polls.count_documents({"privacy": "public"})
+        return count
+
+    async def get_by_user_id(
+        self,
+        id: int,
+        user_id: int,
+        after: tuple | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> list[BSON]:
+        polls: list = await self.find_polls(
+            filter=self.user_filter(id=id, user_id=user_id), after=after, limit=limit, skip=skip
+        )
 
         return polls
 
-    async def get_by_category(self, category: str, user_id: int) -> list[BSON]:
-        polls: list = await self.polls_db.polls.find(
-            {
-                "category": category,
-                "$or": [{"privacy": "public"}, {"privacy": "private", "user_id": user_id}],
-            },
-            sort=[("created_at", DESCENDING)],
-        ).to_list(length=None)
+    async def get_by_category(
+        self,
+        category: str,
+        user_id: int,
+        after: tuple | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> list[BSON]:
+        polls: list = await self.find_polls(
+            filter=self.category_filter(category=category, user_id=user_id),
+            after=after,
+            limit=limit,
+            skip=skip,
+        )
 
         return polls
@@ -3,10 +3,16 @@ from bson.objectid import ObjectId
 
 from rest_framework.exceptions import NotFound
 
-from mdb_singleton import MongoDBSingletonAsync
+from utils.mongo import MongoRepository
 
+from apps.pollsAPI.utils.projections import POLL_PROJECTION, SEARCH_INDEX_PROJECTION
 
-class PollRepository:
+from .poll_results_repository import PollResultsRepository
+from .poll_search_repository import PollSearchRepository
+from .user_activity_repository import UserActivityRepository
+
+
+class PollRepository(MongoRepository):
     """
     A repository class for managing polls in the database.
 
@@ -14,23 +20,46 @@ class PollRepository:
     allowing the application to fetch, create, update, and delete poll data.
     """
 
-    client = MongoDBSingletonAsync().client
-    polls_db = client["polls_db"]
+    results_repository = PollResultsRepository()
+    search_repository = PollSearchRepository()
+    activity_repository = UserActivityRepository()
 
     async def create(self, data: dict) -> ObjectId | None:
         """
-        Creates a new poll.
+        Creates a new poll and its results document.
+
+        Every write to a poll document increments its 'version', the validator of the poll
+        detail responses.
         """
-        result = await self.polls_db.polls.insert_one(data)
+        async with await self.client.start_session() as session:
+            async with session.start_transaction():
+                # The counter is kept out of 'data', which callers reuse as the API poll.
+                result = await self.polls_db.polls.insert_one(
+                    {**data, "version": 1}, session=session
+                )
+                data["_id"] = result.inserted_id
+
+                # Add the results document of the poll.
+                await self.results_repository.create(poll=data, session=session)
+
+                # Add the poll to the search index.
+                await self.search_repository.index(poll=data, session=session)
+
+                await session.commit_transaction()
+            await session.end_session()
 
         id: ObjectId = result.inserted_id
         return id
 
-    async def get_by_id(self, id: str, raise_exception: bool = True) -> BSON | None:
+    async def get_by_id(
+        self, id: str, raise_exception: bool = True, projection: dict = POLL_PROJECTION
+    ) -> BSON | None:
         """
         Retrieves a poll based on its ID.
         """
-        poll: BSON = await self.polls_db.polls.find_one({"_id": ObjectId(id)})
+        poll: BSON = await self.polls_db.polls.find_one(
+            {"_id": ObjectId(id)}, projection=projection
+        )
 
         if not poll:
             if raise_exception:
@@ -40,6 +69,24 @@ class PollRepository:
 
         return poll
 
+    async def get_many(self, ids: list[ObjectId], projection: dict = POLL_PROJECTION) -> list[BSON]:
+        """
+        Retrieves several polls at once, in no particular order.
+        """
+        polls: list = await self.polls_db.polls.find(
+            {"_id": {"$in": ids}}, projection=projection
+        ).to_list(length=None)
+
+        return polls
+
+    def scan_public(self, projection: dict = POLL_PROJECTION, batch_size: int = 1000):
+        """
+        Streams the public polls, for the in-process search index.
+        """
+        return self.polls_db.polls.find(
+            {"privacy": "public"}, projection=projection, batch_size=batch_size
+        )
+
     async def update(self, id: str, data: dict, add_options: list, del_options: list):
         """
         Updates a poll.
@@ -57,7 +104,7 @@ class PollRepository:
                 # Update poll document in polls collection.
                 await self.polls_db.polls.update_one(
                     {"_id": ObjectId(id)},
-                    {"$set": data},
+                    {"$set": data, "$inc": {"version": 1}},
                     session=session,
                 )
 
@@ -77,6 +124,21 @@ class PollRepository:
                         session=session,
                     )
 
+                # Mirror privacy and options in the results document.
+                await self.results_repository.update(
+                    id=id,
+                    privacy=data.get("privacy"),
+                    add_options=add_options,
+                    del_options=del_options,
+                    session=session,
+                )
+
+                # Index the updated texts and privacy.
+                poll: BSON = await self.polls_db.polls.find_one(
+                    {"_id": ObjectId(id)}, projection=SEARCH_INDEX_PROJECTION, session=session
+                )
+                await self.search_repository.index(poll=poll, session=session)
+
                 # Save transaction.
                 await session.commit_transaction()
             await session.end_session()
@@ -101,25 +163,56 @@ class PollRepository:
                         session=session,
                     )
 
+                # Remove the results document of the poll.
+                await self.results_repository.delete(id=id, session=session)
+
+                # Remove the poll from the activity timelines.
+                await self.activity_repository.delete_by_poll(id=id, session=session)
+
+                # Remove the poll from the search index.
+                await self.search_repository.delete(id=id, session=session)
+
                 # Save transaction.
                 await session.commit_transaction()
             await session.end_session()
         return ObjectId(id)
 
     async def add_option(self, id: str, option: dict):
-        # Add the option in the poll document.
-        await self.polls_db.polls.update_one(
-            {"_id": ObjectId(id)},
-            {"$push": {"options": option}},
-        )
+        async with await self.client.start_session() as session:
+            async with session.start_transaction():
+                # Add the option in the poll document.
+                await self.polls_db.polls.update_one(
+                    {"_id": ObjectId(id)},
+                    {"$push": {"options": option}, "$inc": {"version": 1}},
+                    session=session,
+                )
+
+                # Add the option in the results document.
+                await self.results_repository.update(
+                    id=id, add_options=[option], session=session
+                )
+
+                await session.commit_transaction()
+            await session.end_session()
 
         return ObjectId(id)
 
     async def del_option(self, id: str, option: str):
-        # Remove the option from the poll document.
-        await self.polls_db.polls.update_one(
-            {"_id": ObjectId(id)},
-            {"$pull": {"options": {"option_text": option}}},
-        )
+        async with await self.client.start_session() as session:
+            async with session.start_transaction():
+                # Remove the option from the poll document.
+                await self.polls_db.polls.update_one(
+                    {"_id": ObjectId(id)},
+                    {"$pull": {"options": {"option_text": option}}, "$inc": {"version": 1}},
+                    session=session,
+                )
+
+                # Remove the option from the results document.
+                await self.results_repository.update(
+                    id=id, del_options=[option], session=session
+                )
+
+                await session.commit_transaction()
+            await session.end_session()
 
         return ObjectId(id)
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from pymongo import ReturnDocument, UpdateOne
+
+from utils.mongo import MongoRepository
+
+
+class PollResultsRepository(MongoRepository):
+    """
+    Repository for the denormalized vote tallies of polls.
+
+    Each document in the 'poll_results' collection mirrors the options and vote counters of
+    one poll, plus the fields needed to check its privacy, so results can be read without
+    loading the poll document.
+
+    Results document example:
+    { _id: poll_id, user_id: int, privacy: str, votes_counter: int,
+      options: [{ option_text: str, votes: int }], updated_at: datetime }
+    """
+
+    def build(self, poll: dict) -> dict:
+        """
+        Builds a results document from a poll document.
+        """
+        results: dict = {
+            "_id": poll["_id"],
+            "user_id": poll["user_id"],
+            "privacy": poll["privacy"],
+            "votes_counter": poll.get("votes_counter", 0),
+            "options": [
+                {"option_text": o["option_text"], "votes": o["votes"]} for o in poll["options"]
+            ],
+            "updated_at": datetime.now(),
+        }
+
+        return results
+
+    async def create(self, poll: dict, session=None):
+        await self.polls_db.poll_results.insert_one(self.build(poll=poll), session=session)
+
+        return poll["_id"]
+
+    async def get_by_poll_id(self, id: str) -> BSON | None:
+        results: BSON = await self.polls_db.poll_results.find_one({"_id": ObjectId(id)})
+
+        return results
+
+    async def rebuild(self, id: str) -> BSON | None:
+        """
+        Rebuilds the results document of a poll from the poll document.
+
+        Used to backfill polls created before the results collection existed.
+        """
+        projection: dict = {"user_id": 1, "privacy": 1, "votes_counter": 1, "options": 1}
+        poll: BSON = await self.polls_db.polls.find_one({"_id": ObjectId(id)}, projection)
+
+        if not poll:
+            return None
+
+        results: BSON = await self.polls_db.poll_results.find_one_and_replace(
+            {"_id": poll["_id"]},
+            self.build(poll=poll),
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return results
+
+    async def update(
+        self,
+        id: str,
+        privacy: str | None = None,
+        add_options: list = [],
+        del_options: list = [],
+        session=None,
+    ):
+        """
+        Mirrors a poll update (privacy and options) in its results document.
+        """
+        operations: list = []
+
+        if privacy:
+            operations.append(UpdateOne({"_id": ObjectId(id)}, {"$set": {"privacy": privacy}}))
+
+        if add_options:
+            options: list = [{"option_text": o["option_text"], "votes": 0} for o in add_options]
+            operations.append(
+                UpdateOne({"_id": ObjectId(id)}, {"$push": {"options": {"$each": options}}})
+            )
+
+        if del_options:
+            operations.append(
+                UpdateOne(
+                    {"_id": ObjectId(id)},
+                    {"$pull": {"options": {"option_text": {"$in": del_options}}}},
+                )
+            )
+
+        if operations:
+            await self.polls_db.poll_results.bulk_write(operations, session=session)
+
+        return ObjectId(id)
+
+    def build_votes_inc(self, votes: dict, votes_counter: int = 0) -> tuple[dict, list]:
+        """
+        Builds a single '$inc' document, and its array filters, applying vote count deltas.
+
+        Works on both poll and results documents, which share the 'votes_counter' and
+        'options' fields.
+
+        Returns:
+            tuple: The '$inc' document and the array filters, empty if there is nothing to apply.
+        """
+        inc: dict = {}
+        array_filters: list = []
+
+        if votes_counter:
+            inc["votes_counter"] = votes_counter
+
+        for index, (option_text, delta) in enumerate(votes.items()):
+            if delta:
+                inc[f"options.$[o{index}].votes"] = delta
+                array_filters.append({f"o{index}.option_text": option_text})
+
+        return inc, array_filters
+
+    async def inc_votes(self, id: str, votes: dict, votes_counter: int = 0, session=None):
+        """
+        Applies vote count deltas to a results document.
+
+        Args:
+            id (str): The ID of the poll.
+            votes (dict): The delta to apply to each option, keyed by option text.
+            votes_counter (int): The delta to apply to the total votes counter.
+        """
+        inc, array_filters = self.build_votes_inc(votes=votes, votes_counter=votes_counter)
+
+        if inc:
+            await self.polls_db.poll_results.update_one(
+                {"_id": ObjectId(id)},
+                {"$inc": inc, "$set": {"updated_at": datetime.now()}},
+                array_filters=array_filters or None,
+                session=session,
+            )
+
+        return ObjectId(id)
+
+    async def delete(self, id: str, session=None):
+        await self.polls_db.poll_results.delete_one({"_id": ObjectId(id)}, session=session)
+
+        return ObjectId(id)
@@ -0,0 +1,188 @@
+from datetime import datetime
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from django.conf import settings
+
+from utils.mongo import MongoRepository
+
+from apps.pollsAPI.utils.projections import SEARCH_PROJECTION
+from apps.pollsAPI.utils.search_utils import SearchUtils
+
+
+class PollSearchRepository(MongoRepository):
+    """
+    Repository for the keyword search of polls.
+
+    Queries run in two tiers, both ranked by relevance, popularity and recency:
+    - text: the '$text' index of the polls, relevance is the 'textScore'.
+    - n-grams: when no poll matches the words, the 'poll_search' collection matches prefixes
+      and misspelled words, relevance is the share of the query n-grams found in the poll.
+
+    Only the 'candidates' most relevant polls are ranked and paginated, in the database, so
+    the cost of a query does not grow with the number of matches.
+
+    'poll_search' entry example:
+    { _id: ObjectId (poll), grams: [str], user_id: int, privacy: str, created_at: datetime }
+    """
+
+    # Public search, a few seconds of staleness is fine.
+    read_route = "feeds"
+
+    utils = SearchUtils()
+
+    TEXT_WEIGHT: float = 1.0
+    POPULARITY_WEIGHT: float = 0.25
+    RECENCY_WEIGHT: float = 0.5
+    RECENCY_HALF_LIFE_DAYS: float = 30
+
+    # Share of the query n-grams a poll must contain to match.
+    MIN_GRAM_MATCH: float = 0.25
+
+    def __init__(self, candidates: int = settings.SEARCH["CANDIDATES"]):
+        self.candidates = candidates
+
+    def entry(self, poll: dict) -> dict:
+        return {
+            "grams": self.utils.document_grams(poll=poll),
+            "user_id": poll["user_id"],
+            "privacy": poll["privacy"],
+            "created_at": poll["created_at"],
+        }
+
+    async def index(self, poll: dict, session=None):
+        """
+        Adds a poll to the n-gram index, or updates its entry.
+        """
+        await self.polls_db.poll_search.replace_one(
+            {"_id": poll["_id"]}, self.entry(poll=poll), upsert=True, session=session
+        )
+
+    async def delete(self, id: str, session=None):
+        await self.polls_db.poll_search.delete_one({"_id": ObjectId(id)}, session=session)
+
+    def visible_filter(self, user_id: int | None) -> dict:
+        return {"$or": [{"privacy": "public"}, {"privacy": "private", "user_id": user_id}]}
+
+    def rank_stages(self, skip: int, limit: int) -> list:
+        """
+        Scores the candidates and paginates them, with the number of candidates as total.
+
+        score = relevance * TEXT_WEIGHT
+            + ln(1 + votes) * POPULARITY_WEIGHT
+            + RECENCY_WEIGHT / (1 + age / RECENCY_HALF_LIFE_DAYS)
+        """
+        half_life_ms: float = self.RECENCY_HALF_LIFE_DAYS * 24 * 60 * 60 * 1000
+        age: dict = {"$max": [0, {"$subtract": [datetime.now(), "$created_at"]}]}
+
+        score: dict = {
+            "$add": [
+                {"$multiply": ["$relevance", self.TEXT_WEIGHT]},
+                {
+                    "$multiply": [
+                        {"$ln": {"$add": [1, {"$ifNull": ["$votes_counter", 0]}]}},
+                        self.POPULARITY_WEIGHT,
+                    ]
+                },
+                {
+                    "$divide": [
+                        self.RECENCY_WEIGHT,
+                        {"$add": [1, {"$divide": [age, half_life_ms]}]},
+                    ]
+                },
+            ]
+        }
+
+        stages: list = [
+            {"$addFields": {"score": score}},
+            {
+                "$facet": {
+                    "items": [
+                        {"$sort": {"score": -1, "_id": -1}},
+                        {"$skip": skip},
+                        {"$limit": limit},
+                        {"$project": SEARCH_PROJECTION},
+                    ],
+                    "total": [{"$count": "count"}],
+                }
+            },
+        ]
+
+        return stages
+
+    def get_text_pipeline(self, keyword: str, user_id: int | None, skip: int, limit: int) -> list:
+        pipeline: list = [
+            {"$match": {"$text": {"$search": keyword}, **self.visible_filter(user_id=user_id)}},
+            {"$addFields": {"relevance": {"$meta": "textScore"}}},
+            {"$sort": {"relevance": -1}},
+            {"$limit": self.candidates},
+            *self.rank_stages(skip=skip, limit=limit),
+        ]
+
+        return pipeline
+
+    def get_grams_pipeline(
+        self, grams: list[str], user_id: int | None, skip: int, limit: int
+    ) -> list:
+        matched: dict = {"$size": {"$setIntersection": ["$grams", grams]}}
+
+        pipeline: list = [
+            {"$match": {"grams": {"$in": grams}, **self.visible_filter(user_id=user_id)}},
+            {"$project": {"relevance": {"$divide": [matched, len(grams)]}}},
+            {"$match": {"relevance": {"$gte": self.MIN_GRAM_MATCH}}},
+            {"$sort": {"relevance": -1, "_id": -1}},
+            {"$limit": self.candidates},
+            {
+                "$lookup": {
+                    "from": "polls",
+                    "localField": "_id",
+                    "foreignField": "_id",
+                    "as": "poll",
+                }
+            },
+            {"$unwind": "$poll"},
+            {
+                "$replaceRoot": {
+                    "newRoot": {"$mergeObjects": ["$poll", {"relevance": "$relevance"}]}
+                }
+            },
+            *self.rank_stages(skip=skip, limit=limit),
+        ]
+
+        return pipeline
+
+    async def aggregate_page(self, collection: str, pipeline: list) -> tuple[list[BSON], int]:
+        result: list = await self.polls_db[collection].aggregate(pipeline).to_list(length=1)
+
+        facet: dict = result[0] if result else {"items": [], "total": []}
+        total: int = facet["total"][0]["count"] if facet["total"] else 0
+
+        return facet["items"], total
+
+    async def search(
+        self, keyword: str, user_id: int | None, skip: int, limit: int
+    ) -> tuple[list[BSON], int]:
+        """
+        Retrieves a page of the polls matching a keyword, best first.
+
+        Returns the polls of the page and the number of ranked matches.
+        """
+        polls, total = await self.aggregate_page(
+            collection="polls",
+            pipeline=self.get_text_pipeline(
+                keyword=keyword, user_id=user_id, skip=skip, limit=limit
+            ),
+        )
+
+        if total:
+            return polls, total
+
+        grams: list = self.utils.query_grams(keyword=keyword)
+        if not grams:
+            return [], 0
+
+        return await self.aggregate_page(
+            collection="poll_search",
+            pipeline=self.get_grams_pipeline(grams=grams, user_id=user_id, skip=skip, limit=limit),
+        )
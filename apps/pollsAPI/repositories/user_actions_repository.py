@@ -3,12 +3,16 @@ from datetime import datetime
 from bson import BSON
 from bson.objectid import ObjectId
 
-from pymongo import UpdateOne
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from mdb_singleton import MongoDBSingletonAsync
+from utils.mongo import MongoRepository
 
+from .poll_results_repository import PollResultsRepository
+from .vote_counter_buffer import vote_counter_buffer
 
-class UserActionsRepository:
+
+class UserActionsRepository(MongoRepository):
     """
     Repository for managing user actions related to polls.
 
@@ -16,8 +20,8 @@ class UserActionsRepository:
     allowing for the retrieval and storage of user-specific actions such as voting, sharing, and bookmarking.
     """
 
-    client = MongoDBSingletonAsync().client
-    polls_db = client["polls_db"]
+    results_repository = PollResultsRepository()
+    vote_buffer = vote_counter_buffer
 
     async def get_user_actions(self, id: str, user_id: int, projection: dict = {"_id": 1}):
         """
@@ -35,185 +39,273 @@ class UserActionsRepository:
 
         return user_actions or None
 
+    async def get_many_user_actions(
+        self, ids: list[ObjectId], user_id: int, projection: dict = {"_id": 0}
+    ) -> dict:
+        """
+        Retrieves user-specific actions related to several polls in a single query.
+
+        Args:
+            ids (list[ObjectId]): The IDs of the polls.
+            user_id (int): The ID of the user for whom to retrieve actions.
+
+        Returns:
+            dict: A dictionary mapping each poll ID to the user actions found for it.
+        """
+        projection: dict = {**projection, "poll_id": 1}
+
+        results: list[BSON] = await self.polls_db.user_actions.find(
+            {"user_id": user_id, "poll_id": {"$in": ids}},
+            projection=projection,
+        ).to_list(length=None)
+
+        user_actions: dict = {}
+        for result in results:
+            user_actions[result.pop("poll_id")] = result
+
+        return user_actions
+
     async def create(self, id: str, user_id: int):
         await self.polls_db.user_actions.insert_one(
-            {"poll_id": ObjectId(id), "user_id": user_id},
+            {"poll_id": ObjectId(id), "user_id": user_id, "version": 1},
         )
 
         return ObjectId(id)
 
-    async def insert_vote(self, id: str, user_id: int, vote: str):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                # Update vote action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$set": {"has_voted": {"vote": vote, "voted_at": datetime.now()}}},
-                    upsert=True,
-                    session=session,
-                )
+    async def claim(self, id: str, user_id: int, action: str, value: dict) -> bool:
+        """
+        Sets an action on the user actions document only if it is not set yet.
 
-                await self.polls_db.polls.bulk_write(
-                    [
-                        # Add user ID to voters list in the poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id)},
-                            {"$push": {"voters": user_id}, "$inc": {"votes_counter": 1}},
-                        ),
-                        # Add count to voted counter in the poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id), "options.option_text": vote},
-                            {"$inc": {"options.$.votes": 1}},
-                        ),
-                    ],
-                    session=session,
-                )
+        The filter only matches a document without the action, so when the action is already
+        set the upsert tries to insert a second document for the same (poll_id, user_id) pair
+        and the unique index rejects it. Creating the document and checking the action take a
+        single round trip.
 
-                await session.commit_transaction()
-            await session.end_session()
-        return ObjectId(id)
+        The unique index also rejects the loser of two concurrent first actions of a user on a
+        poll (e.g. a vote and a share), whose action is not set. The update is then retried
+        without upsert on the document the winner created, and its result decides.
 
-    async def update_vote(self, id: str, user_id: int, vote: str, del_vote: str):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$set": {"has_voted": {"vote": vote, "voted_at": datetime.now()}}},
-                    session=session,
-                )
+        Args:
+            id (str): The ID of the poll.
+            user_id (int): The ID of the user.
+            action (str): The action field, 'has_voted', 'has_shared' or 'has_bookmarked'.
+            value (dict): The value of the action.
 
-                await self.polls_db.polls.bulk_write(
-                    [
-                        # Remove the previous vote in poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id), "options.option_text": del_vote},
-                            {"$inc": {"options.$.votes": -1}},
-                        ),
-                        # Add the new vote in poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id), "options.option_text": vote},
-                            {"$inc": {"options.$.votes": 1}},
-                        ),
-                    ],
-                    session=session,
-                )
+        Returns:
+            bool: Whether the action was claimed.
+        """
+        filter: dict = {"user_id": user_id, "poll_id": ObjectId(id), action: {"$exists": False}}
+        update: dict = {"$set": {action: value}, "$inc": {"version": 1}}
 
-                await session.commit_transaction()
-            await session.end_session()
-        return ObjectId(id)
+        try:
+            await self.polls_db.user_actions.update_one(filter, update, upsert=True)
 
-    async def delete_vote(self, id: str, user_id: int, del_vote: str):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                # Remove vote action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$unset": {"has_voted": ""}},
-                    session=session,
-                )
+        except DuplicateKeyError:
+            result = await self.polls_db.user_actions.update_one(filter, update)
+            return result.matched_count > 0
 
-                await self.polls_db.polls.bulk_write(
-                    [
-                        # Remove user ID to voters list in the poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id)},
-                            {"$pull": {"voters": user_id}, "$inc": {"votes_counter": -1}},
-                        ),
-                        # Remove the previous vote in poll document.
-                        UpdateOne(
-                            {"_id": ObjectId(id), "options.option_text": del_vote},
-                            {"$inc": {"options.$.votes": -1}},
-                        ),
-                    ],
-                    session=session,
-                )
+        return True
 
-                await session.commit_transaction()
-            await session.end_session()
-        return ObjectId(id)
+    async def release(self, id: str, user_id: int, action: str, update: dict = None) -> BSON | None:
+        """
+        Updates or removes an action on the user actions document only if it is set.
+
+        Args:
+            id (str): The ID of the poll.
+            user_id (int): The ID of the user.
+            action (str): The action field, 'has_voted', 'has_shared' or 'has_bookmarked'.
+            update (dict): The new value of the action, the action is removed if not provided.
+
+        Returns:
+            BSON: The previous value of the action, or None if the action was not set.
+        """
+        result: BSON = await self.polls_db.user_actions.find_one_and_update(
+            {"user_id": user_id, "poll_id": ObjectId(id), action: {"$exists": True}},
+            {
+                **({"$set": {action: update}} if update else {"$unset": {action: ""}}),
+                "$inc": {"version": 1},
+            },
+            projection={"_id": 0, action: 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        return result[action] if result else None
+
+    async def restore(self, id: str, user_id: int, action: str, value: dict | None):
+        """
+        Restores an action to its previous value when its counters could not be applied.
+        """
+        await self.polls_db.user_actions.update_one(
+            {"user_id": user_id, "poll_id": ObjectId(id)},
+            {
+                **({"$set": {action: value}} if value else {"$unset": {action: ""}}),
+                "$inc": {"version": 1},
+            },
+        )
+
+    async def inc_votes(self, id: str, votes: dict, votes_counter: int = 0):
+        """
+        Applies vote count deltas to the poll and results documents.
+
+        With the vote counter buffer enabled the deltas are only queued, otherwise they are
+        written with one update per document, in a transaction so both documents agree.
+        """
+        if self.vote_buffer.enabled:
+            self.vote_buffer.add(id=id, votes=votes, votes_counter=votes_counter)
+            return
+
+        inc, array_filters = self.results_repository.build_votes_inc(
+            votes=votes, votes_counter=votes_counter
+        )
+
+        if not inc:
+            return
 
-    async def share(self, id: str, user_id: int):
         async with await self.client.start_session() as session:
             async with session.start_transaction():
-                # Update share action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$set": {"has_shared": {"shared_at": datetime.now()}}},
-                    upsert=True,
-                    session=session,
-                )
-
-                # Add count to shared counter in the poll document.
                 await self.polls_db.polls.update_one(
                     {"_id": ObjectId(id)},
-                    {"$inc": {"shares_counter": 1}},
+                    {"$inc": {**inc, "version": 1}},
+                    array_filters=array_filters or None,
                     session=session,
                 )
+                await self.results_repository.inc_votes(
+                    id=id, votes=votes, votes_counter=votes_counter, session=session
+                )
 
                 await session.commit_transaction()
             await session.end_session()
+
+    async def insert_vote(self, id: str, user_id: int, vote: str) -> ObjectId | None:
+        """
+        Adds the vote of a user to a poll.
+
+        Returns:
+            ObjectId: The ID of the poll, or None if the user has already voted.
+        """
+        value: dict = {"vote": vote, "voted_at": datetime.now()}
+        if not await self.claim(id=id, user_id=user_id, action="has_voted", value=value):
+            return None
+
+        try:
+            await self.inc_votes(id=id, votes={vote: 1}, votes_counter=1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_voted", value=None)
+            raise
+
         return ObjectId(id)
 
-    async def unshare(self, id: str, user_id: int):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                # Remove share action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$unset": {"has_shared": ""}},
-                    session=session,
-                )
+    async def update_vote(self, id: str, user_id: int, vote: str) -> str | None:
+        """
+        Changes the vote of a user in a poll.
 
-                # Remove count to shared counter in the poll document.
-                await self.polls_db.polls.update_one(
-                    {"_id": ObjectId(id)},
-                    {"$inc": {"shares_counter": -1}},
-                    session=session,
-                )
+        Returns:
+            str: The previous vote, or None if the user has not voted.
+        """
+        value: dict = {"vote": vote, "voted_at": datetime.now()}
+        previous: BSON = await self.release(id=id, user_id=user_id, action="has_voted", update=value)
+
+        if previous is None:
+            return None
+
+        del_vote: str = previous["vote"]
+        if del_vote == vote:
+            return del_vote
+
+        try:
+            await self.inc_votes(id=id, votes={del_vote: -1, vote: 1})
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_voted", value=previous)
+            raise
+
+        return del_vote
+
+    async def delete_vote(self, id: str, user_id: int) -> str | None:
+        """
+        Removes the vote of a user from a poll.
+
+        Returns:
+            str: The removed vote, or None if the user has not voted.
+        """
+        previous: BSON = await self.release(id=id, user_id=user_id, action="has_voted")
+
+        if previous is None:
+            return None
+
+        del_vote: str = previous["vote"]
+
+        try:
+            await self.inc_votes(id=id, votes={del_vote: -1}, votes_counter=-1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_voted", value=previous)
+            raise
+
+        return del_vote
+
+    async def inc_counter(self, id: str, counter: str, delta: int):
+        await self.polls_db.polls.update_one(
+            {"_id": ObjectId(id)}, {"$inc": {counter: delta, "version": 1}}
+        )
+
+    async def share(self, id: str, user_id: int) -> ObjectId | None:
+        value: dict = {"shared_at": datetime.now()}
+        if not await self.claim(id=id, user_id=user_id, action="has_shared", value=value):
+            return None
+
+        try:
+            # Add count to shared counter in the poll document.
+            await self.inc_counter(id=id, counter="shares_counter", delta=1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_shared", value=None)
+            raise
 
-                await session.commit_transaction()
-            await session.end_session()
         return ObjectId(id)
 
-    async def bookmark(self, id: str, user_id: int):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                # Update bookmark action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$set": {"has_bookmarked": {"bookmarked_at": datetime.now()}}},
-                    upsert=True,
-                    session=session,
-                )
+    async def unshare(self, id: str, user_id: int) -> ObjectId | None:
+        previous: BSON = await self.release(id=id, user_id=user_id, action="has_shared")
+        if previous is None:
+            return None
 
-                # Add count to bookmarked counter in the poll document.
-                await self.polls_db.polls.update_one(
-                    {"_id": ObjectId(id)},
-                    {"$inc": {"bookmarks_counter": 1}},
-                    session=session,
-                )
+        try:
+            # Remove count to shared counter in the poll document.
+            await self.inc_counter(id=id, counter="shares_counter", delta=-1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_shared", value=previous)
+            raise
 
-                await session.commit_transaction()
-            await session.end_session()
         return ObjectId(id)
 
-    async def unbookmark(self, id: str, user_id: int):
-        async with await self.client.start_session() as session:
-            async with session.start_transaction():
-                # Remove bookmark action if user actions document exist.
-                await self.polls_db.user_actions.update_one(
-                    {"user_id": user_id, "poll_id": ObjectId(id)},
-                    {"$unset": {"has_bookmarked": ""}},
-                    session=session,
-                )
+    async def bookmark(self, id: str, user_id: int) -> ObjectId | None:
+        value: dict = {"bookmarked_at": datetime.now()}
+        if not await self.claim(id=id, user_id=user_id, action="has_bookmarked", value=value):
+            return None
 
-                # Remove count to bookmarked counter in the poll document.
-                await self.polls_db.polls.update_one(
-                    {"_id": ObjectId(id)},
-                    {"$inc": {"bookmarks_counter": -1}},
-                    session=session,
-                )
+        try:
+            # Add count to bookmarked counter in the poll document.
+            await self.inc_counter(id=id, counter="bookmarks_counter", delta=1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_bookmarked", value=None)
+            raise
+
+        return ObjectId(id)
+
+    async def unbookmark(self, id: str, user_id: int) -> ObjectId | None:
+        previous: BSON = await self.release(id=id, user_id=user_id, action="has_bookmarked")
+        if previous is None:
+            return None
+
+        try:
+            # Remove count to bookmarked counter in the poll document.
+            await self.inc_counter(id=id, counter="bookmarks_counter", delta=-1)
+
+        except Exception:
+            await self.restore(id=id, user_id=user_id, action="has_bookmarked", value=previous)
+            raise
 
-                await session.commit_transaction()
-            await session.end_session()
         return ObjectId(id)
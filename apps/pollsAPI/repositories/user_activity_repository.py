@@ -0,0 +1,170 @@
+from datetime import datetime
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from pymongo import DESCENDING
+
+from utils.mongo import MongoRepository
+
+
+class UserActivityRepository(MongoRepository):
+    """
+    Repository for the activity timeline of users (votes, shares and bookmarks).
+
+    The 'user_activity' collection holds one entry per user, action and poll, with the action
+    date and a summary of the poll (owner, privacy, title, category), so the history of a user
+    is filtered and paginated without joining the polls. Entries are written after the actions
+    in 'user_actions', which remain the source of truth, see 'get_backfill_pipeline'. The
+    summary may lag behind the poll, readers check the privacy of the polls they load.
+
+    Entry example:
+    { user_id: int, action: "has_voted", poll_id: ObjectId, at: datetime, poll: { ... } }
+    """
+
+    # Timelines of other users, a few seconds of staleness is fine.
+    read_route = "feeds"
+
+    # Date field of each action in the 'user_actions' documents.
+    ACTIONS: dict = {
+        "has_voted": "voted_at",
+        "has_shared": "shared_at",
+        "has_bookmarked": "bookmarked_at",
+    }
+
+    SUMMARY_FIELDS: tuple = ("user_id", "privacy", "title", "category", "created_at")
+
+    def summary(self, poll: dict) -> dict:
+        return {field: poll.get(field) for field in self.SUMMARY_FIELDS}
+
+    async def add(self, poll: dict, user_id: int, action: str, at: datetime | None = None):
+        """
+        Adds an action to the timeline of a user, or moves it to 'at' if it is already there.
+
+        The summary is only written with a new entry, the summary of an existing entry is kept
+        up to date by 'update_poll' and may be newer than the poll read by the caller.
+        """
+        await self.polls_db.user_activity.update_one(
+            {"user_id": user_id, "action": action, "poll_id": poll["_id"]},
+            {
+                "$set": {"at": at or datetime.now()},
+                "$setOnInsert": {"poll": self.summary(poll=poll)},
+            },
+            upsert=True,
+        )
+
+    async def remove(self, id: str, user_id: int, action: str):
+        await self.polls_db.user_activity.delete_one(
+            {"user_id": user_id, "action": action, "poll_id": ObjectId(id)}
+        )
+
+    async def update_poll(self, poll: dict):
+        """
+        Updates the poll summary of every entry of a poll.
+        """
+        await self.polls_db.user_activity.update_many(
+            {"poll_id": poll["_id"]}, {"$set": {"poll": self.summary(poll=poll)}}
+        )
+
+    async def delete_by_poll(self, id: str, session=None):
+        await self.polls_db.user_activity.delete_many({"poll_id": ObjectId(id)}, session=session)
+
+    def get_backfill_pipeline(self, action: str, user_id: int | None = None) -> list:
+        """
+        Builds the aggregation that rebuilds the entries of an action from 'user_actions'.
+
+        The result is merged into 'user_activity', existing entries are updated.
+        """
+        match: dict = {action: {"$exists": True}}
+        if user_id is not None:
+            match["user_id"] = user_id
+
+        pipeline: list = [
+            {"$match": match},
+            {
+                "$lookup": {
+                    "from": "polls",
+                    "localField": "poll_id",
+                    "foreignField": "_id",
+                    "pipeline": [{"$project": {field: 1 for field in self.SUMMARY_FIELDS}}],
+                    "as": "poll",
+                }
+            },
+            {"$unwind": "$poll"},
+            {
+                "$project": {
+                    "_id": 0,
+                    "user_id": 1,
+                    "action": action,
+                    "poll_id": 1,
+                    "at": f"${action}.{self.ACTIONS[action]}",
+                    "poll": {field: f"$poll.{field}" for field in self.SUMMARY_FIELDS},
+                }
+            },
+            {
+                "$merge": {
+                    "into": "user_activity",
+                    "on": ["user_id", "action", "poll_id"],
+                    "whenMatched": "merge",
+                    "whenNotMatched": "insert",
+                }
+            },
+        ]
+
+        return pipeline
+
+    def keyset_filter(self, after: tuple | None) -> dict:
+        if after is None:
+            return {}
+
+        at, id = after
+        return {"$or": [{"at": {"$lt": at}}, {"at": at, "poll_id": {"$lt": id}}]}
+
+    def timeline_filter(self, id: int, user_id: int, action: str) -> dict:
+        return {
+            "user_id": int(id),
+            "action": action,
+            "$or": [{"poll.privacy": "public"}, {"poll.user_id": user_id}],
+        }
+
+    async def count(self, id: int, user_id: int, action: str) -> int:
+        count: int = await self.polls_db.user_activity.count_documents(
+            self.timeline_filter(id=id, user_id=user_id, action=action)
+        )
+
+        return count
+
+    async def find(
+        self,
+        id: int,
+        user_id: int,
+        action: str,
+        after: tuple | None = None,
+        limit: int | None = None,
+        skip: int = 0,
+    ) -> list[BSON]:
+        """
+        Retrieves the timeline of a user for an action, newest first, as (poll_id, at) entries.
+
+        Polls private to another user than 'user_id' are left out.
+
+        Args:
+            id (int): The ID of the user whose timeline is read.
+            user_id (int): The ID of the user requesting the timeline.
+            action (str): 'has_voted', 'has_shared' or 'has_bookmarked'.
+            after (tuple): The (at, poll_id) pair of the last entry of the previous page.
+            limit (int): The maximum number of entries, all of them if not provided.
+            skip (int): The number of entries skipped, for offset pages.
+        """
+        filter: dict = self.timeline_filter(id=id, user_id=user_id, action=action)
+
+        keyset: dict = self.keyset_filter(after=after)
+        entries: list = await self.polls_db.user_activity.find(
+            {"$and": [filter, keyset]} if keyset else filter,
+            projection={"_id": 0, "poll_id": 1, "at": 1},
+            sort=[("at", DESCENDING), ("poll_id", DESCENDING)],
+            skip=skip,
+            limit=limit or 0,
+        ).to_list(length=limit)
+
+        return entries
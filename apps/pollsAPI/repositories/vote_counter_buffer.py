@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from django.conf import settings
+
+from pymongo import UpdateOne
+
+from utils.mongo import MongoRepository
+
+from .poll_results_repository import PollResultsRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class VoteCounterBuffer(MongoRepository):
+    """
+    Write-behind buffer for the vote counters of polls.
+
+    When enabled, the vote path only writes the user actions document and hands the counter
+    deltas to this buffer. Deltas are coalesced in memory per poll and per option, then flushed
+    as one unordered bulk of '$inc' updates per collection, in a transaction, every
+    'flush_interval_ms' milliseconds, when 'max_pending' votes are waiting, or on shutdown.
+
+    Counters read from the poll and results documents lag behind by at most one flush.
+    """
+
+    results_repository = PollResultsRepository()
+
+    def __init__(self, enabled: bool = False, flush_interval_ms: int = 200, max_pending: int = 500):
+        self.enabled = enabled
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max_pending
+
+        # { poll_id: { "votes_counter": int, "options": { option_text: int } } }
+        self.pending: dict = {}
+        self.pending_votes: int = 0
+
+        self._task: asyncio.Task | None = None
+        self._flushing: asyncio.Task | None = None
+
+    def add(self, id: str, votes: dict, votes_counter: int = 0):
+        """
+        Adds vote count deltas for a poll.
+
+        Args:
+            id (str): The ID of the poll.
+            votes (dict): The delta to apply to each option, keyed by option text.
+            votes_counter (int): The delta to apply to the total votes counter.
+        """
+        counters: dict = self.pending.setdefault(str(id), {"votes_counter": 0, "options": {}})
+        counters["votes_counter"] += votes_counter
+        for option_text, delta in votes.items():
+            counters["options"][option_text] = counters["options"].get(option_text, 0) + delta
+
+        self.pending_votes += 1
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+        if self.pending_votes >= self.max_pending:
+            self.start_flush()
+
+    def start_flush(self) -> asyncio.Task:
+        """
+        Starts a flush in its own task, or returns the one running, so flushes never overlap
+        and are not interrupted when the periodic task is cancelled.
+        """
+        if self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.create_task(self.flush())
+            self._flushing.add_done_callback(self.log_flush_error)
+
+        return self._flushing
+
+    def log_flush_error(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Vote counters flush failed, retrying on next interval.",
+                exc_info=task.exception(),
+            )
+
+    async def run(self):
+        """
+        Flushes the pending deltas periodically.
+        """
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await asyncio.wait([self.start_flush()])
+
+    def merge(self, pending: dict):
+        """
+        Merges deltas that could not be written back into the pending deltas.
+        """
+        for id, counters in pending.items():
+            current: dict = self.pending.setdefault(id, {"votes_counter": 0, "options": {}})
+            current["votes_counter"] += counters["votes_counter"]
+            for option_text, delta in counters["options"].items():
+                current["options"][option_text] = current["options"].get(option_text, 0) + delta
+
+    async def flush(self):
+        """
+        Writes the pending deltas to the poll and results documents.
+
+        Both bulk writes run in one transaction, so they are applied together or not at all.
+        If the transaction fails, the deltas are merged back so they are retried on the next
+        flush without counting any vote twice.
+        """
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, {}
+        pending_votes, self.pending_votes = self.pending_votes, 0
+
+        polls_operations: list = []
+        results_operations: list = []
+        for id, counters in pending.items():
+            inc, array_filters = self.results_repository.build_votes_inc(
+                votes=counters["options"], votes_counter=counters["votes_counter"]
+            )
+            if not inc:
+                continue
+
+            polls_operations.append(
+                UpdateOne(
+                    {"_id": ObjectId(id)},
+                    {"$inc": {**inc, "version": 1}},
+                    array_filters=array_filters or None,
+                )
+            )
+            results_operations.append(
+                UpdateOne(
+                    {"_id": ObjectId(id)},
+                    {"$inc": inc, "$set": {"updated_at": datetime.now()}},
+                    array_filters=array_filters or None,
+                )
+            )
+
+        if not polls_operations:
+            return
+
+        async def write(session):
+            await self.polls_db.polls.bulk_write(polls_operations, ordered=False, session=session)
+            await self.polls_db.poll_results.bulk_write(
+                results_operations, ordered=False, session=session
+            )
+
+        try:
+            # 'with_transaction' retries transient errors and commits with an unknown result.
+            async with await self.client.start_session() as session:
+                await session.with_transaction(write)
+
+        except Exception:
+            self.merge(pending=pending)
+            self.pending_votes += pending_votes
+            raise
+
+    async def close(self):
+        """
+        Stops the periodic flush and writes what is left.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._flushing is not None and not self._flushing.done():
+            await asyncio.wait([self._flushing])
+
+        await self.flush()
+
+
+vote_counter_buffer = VoteCounterBuffer(
+    enabled=settings.VOTE_BUFFER["ENABLED"],
+    flush_interval_ms=settings.VOTE_BUFFER["FLUSH_INTERVAL_MS"],
+    max_pending=settings.VOTE_BUFFER["MAX_PENDING"],
+)
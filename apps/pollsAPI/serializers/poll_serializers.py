@@ -12,7 +12,6 @@ class PollSerializer(serializers.Serializer):
         validated_data["user_id"] = self.context["user_id"]
         validated_data["created_at"] = datetime.now()
 
-        validated_data["voters"] = []
         validated_data["votes_counter"] = 0
         validated_data["shares_counter"] = 0
         validated_data["bookmarks_counter"] = 0
@@ -29,6 +28,15 @@ class PollSerializer(serializers.Serializer):
         return value
 
 
+class PollBatchSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.CharField(min_length=24, max_length=24),
+        min_length=1,
+        max_length=50,
+        required=True,
+    )
+
+
 class OptionsSerializer(serializers.Serializer):
     options = serializers.ListField(
         child=serializers.CharField(max_length=113, required=True), required=True
@@ -0,0 +1,90 @@
+import zlib
+
+from bson import json_util
+from bson.objectid import ObjectId
+
+from rest_framework.exceptions import ValidationError
+
+from apps.pollsAPI.repositories.export_repository import ExportRepository
+
+
+class ExportService:
+    """
+    Service class for exporting polls, user actions and comments as NDJSON.
+
+    Documents are serialized one per line with MongoDB Extended JSON and grouped in chunks of
+    about 'chunk_size' bytes, optionally gzip compressed, so memory stays constant whatever
+    the size of the collection.
+    """
+
+    repository = ExportRepository()
+
+    chunk_size: int = 64 * 1024
+
+    COLLECTIONS: tuple = ("polls", "user_actions", "comments")
+
+    def validate(self, collection: str, after: str | None = None):
+        """
+        Validates the export parameters.
+        """
+        if collection not in self.COLLECTIONS:
+            message: str = f"Invalid collection, expected one of: {', '.join(self.COLLECTIONS)}"
+            raise ValidationError(detail={"message": message})
+
+        if after and not ObjectId.is_valid(after):
+            message: str = "Invalid 'after' ID"
+            raise ValidationError(detail={"message": message})
+
+    def iter_documents(self, collection: str, user_id: int | None, after: str | None = None):
+        if collection == "polls":
+            return self.repository.iter_polls(user_id=user_id, after=after)
+
+        if collection == "user_actions":
+            return self.repository.iter_user_actions(user_id=user_id, after=after)
+
+        return self.repository.iter_comments(user_id=user_id, after=after)
+
+    async def stream(
+        self, collection: str, user_id: int | None, after: str | None = None, gzip: bool = False
+    ):
+        """
+        Streams a collection as NDJSON.
+
+        Args:
+            collection (str): 'polls', 'user_actions' or 'comments'.
+            user_id (int): The ID of the user, private polls of other users are left out.
+            after (str): Resume after the document with this ID.
+            gzip (bool): Whether to gzip compress the output.
+
+        Yields:
+            bytes: Chunks of the NDJSON output.
+
+        Note: Call 'validate' first, errors raised once the response has started cannot
+        change its status.
+        """
+        compressor = zlib.compressobj(wbits=31) if gzip else None
+        buffer: list = []
+        size: int = 0
+
+        async for document in self.iter_documents(collection=collection, user_id=user_id, after=after):
+            line: bytes = json_util.dumps(document).encode() + b"\n"
+            buffer.append(line)
+            size += len(line)
+
+            if size >= self.chunk_size:
+                chunk: bytes = b"".join(buffer)
+                buffer, size = [], 0
+
+                if compressor:
+                    chunk = compressor.compress(chunk)
+                    if not chunk:
+                        continue
+
+                yield chunk
+
+        chunk: bytes = b"".join(buffer)
+        if compressor:
+            chunk = compressor.compress(chunk) + compressor.flush()
+
+        if chunk:
+            yield chunk
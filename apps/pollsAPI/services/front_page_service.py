@@ -0,0 +1,231 @@
+import asyncio
+import re
+import weakref
+
+from bson import BSON
+
+from django.conf import settings
+
+from apps.pollsAPI.repositories.poll_list_repository import PollListRepository
+from apps.pollsAPI.repositories.poll_repository import PollRepository
+from apps.pollsAPI.services.poll_hydration_service import PollHydrationService
+from apps.pollsAPI.utils.poll_utils import PollUtils
+
+from utils.cache import get_region
+from utils.pagination import Pagination
+
+
+class FrontPageService:
+    """
+    Service class for the front page feed, the first pages of '/polls/all'.
+
+    The newest 'size' public polls are kept in the 'front_page' cache region, already in the
+    API shape with their owner profiles, together with the number of public polls. Pages within
+    that window are served from the cache, only the authenticated user actions are queried.
+
+    PollService applies its writes to the cached feed instead of dropping it. Writes are
+    serialized per event loop, and a feed loaded while a write ran is not stored. Counters
+    updated elsewhere (votes, shares, comments) lag behind by at most the region TTL, and so
+    do the writes made by other processes.
+    """
+
+    KEY = "polls"
+
+    # Fields refreshed by the region TTL instead of the change stream.
+    COUNTER_FIELDS: set = {
+        "votes_counter",
+        "shares_counter",
+        "bookmarks_counter",
+        "comments_counter",
+        "version",
+    }
+
+    repository = PollListRepository()
+    poll_repository = PollRepository()
+    hydration_service = PollHydrationService()
+    utils = PollUtils()
+    pagination = Pagination()
+    cache = get_region("front_page")
+
+    def __init__(self, size: int = 96):
+        self.size = size
+
+        # Incremented by every write, see 'load'.
+        self.generation: int = 0
+
+        self._loading: asyncio.Task | None = None
+        self._locks = weakref.WeakKeyDictionary()
+
+    def lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+
+        lock: asyncio.Lock | None = self._locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[loop] = lock
+
+        return lock
+
+    async def build_items(self, polls: list[BSON]) -> list[dict]:
+        """
+        Converts polls to the API shape and attaches their owner profiles.
+        """
+        polls: list[dict] = [await self.utils.simplify_poll_data(poll=poll) for poll in polls]
+        profiles: dict = await self.hydration_service.get_owners(
+            user_ids=[poll["user_id"] for poll in polls]
+        )
+
+        for poll in polls:
+            poll["user_profile"] = profiles.get(poll["user_id"])
+
+        return polls
+
+    async def load(self) -> dict:
+        """
+        Reads the feed from the database and caches it, unless a write ran meanwhile.
+        """
+        generation: int = self.generation
+
+        polls, total = await asyncio.gather(
+            self.repository.get_all(limit=self.size), self.repository.count_all()
+        )
+
+        feed: dict = {"polls": await self.build_items(polls=polls), "total": total}
+        if generation == self.generation:
+            await self.cache.aset(self.KEY, feed)
+
+        return feed
+
+    async def get_feed(self) -> dict:
+        """
+        Retrieves the cached feed, concurrent misses share a single load.
+        """
+        feed: dict | None = await self.cache.aget(self.KEY)
+        if feed is not None:
+            return feed
+
+        loop = asyncio.get_running_loop()
+        if self._loading is None or self._loading.done() or self._loading.get_loop() is not loop:
+            self._loading = loop.create_task(self.load())
+
+        return await asyncio.shield(self._loading)
+
+    async def get_page(self, page: int, page_size: int, user_id: int | None = None):
+        """
+        Retrieves a page of '/polls/all' from the cached feed.
+
+        Returns None when the page is beyond the cached window.
+        """
+        feed: dict = await self.get_feed()
+        data: dict | None = self.pagination.paginate_window(
+            object_list=feed["polls"], total_items=feed["total"], page=page, page_size=page_size
+        )
+
+        if data is None:
+            return None
+
+        user_actions: dict = await self.hydration_service.get_user_actions(
+            poll_ids=[poll["id"] for poll in data["items"]], user_id=user_id
+        )
+
+        items: list[dict] = []
+        for poll in data["items"]:
+            item: dict = {}
+            item["poll"] = poll
+            item["authenticated_user_actions"] = user_actions.get(poll["id"], {})
+            items.append(item)
+
+        data["items"] = items
+
+        return data
+
+    async def add(self, poll: BSON):
+        """
+        Adds a poll that has just been created to the cached feed.
+        """
+        async with self.lock():
+            self.generation += 1
+
+            feed: dict | None = await self.cache.aget(self.KEY)
+            if (feed is None) or (poll["privacy"] != "public"):
+                return
+
+            polls: list[dict] = await self.build_items(polls=[poll])
+            polls.extend(feed["polls"][: self.size - 1])
+
+            await self.cache.aset(self.KEY, {"polls": polls, "total": feed["total"] + 1})
+
+    async def refresh(self, previous: BSON):
+        """
+        Applies an update of a poll to the cached feed.
+
+        Args:
+            previous (BSON): The poll document before the update.
+        """
+        async with self.lock():
+            self.generation += 1
+
+            feed: dict | None = await self.cache.aget(self.KEY)
+            if feed is None:
+                return
+
+            id: str = str(previous["_id"])
+            poll: BSON | None = await self.poll_repository.get_by_id(id=id, raise_exception=False)
+
+            was_public: bool = previous["privacy"] == "public"
+            is_public: bool = poll is not None and poll["privacy"] == "public"
+
+            polls: list[dict] = list(feed["polls"])
+            total: int = feed["total"] + is_public - was_public
+
+            index: int | None = next((i for i, p in enumerate(polls) if p["id"] == id), None)
+            if index is None:
+                if is_public and not was_public:
+                    # The position of the poll in the feed is unknown, load it again.
+                    await self.cache.adelete(self.KEY)
+                    return
+
+            elif is_public:
+                polls[index] = (await self.build_items(polls=[poll]))[0]
+
+            else:
+                del polls[index]
+
+            await self.cache.aset(self.KEY, {"polls": polls, "total": total})
+
+    async def remove(self, poll: BSON):
+        """
+        Removes a poll that has just been deleted from the cached feed.
+        """
+        async with self.lock():
+            self.generation += 1
+
+            feed: dict | None = await self.cache.aget(self.KEY)
+            if (feed is None) or (poll["privacy"] != "public"):
+                return
+
+            id: str = str(poll["_id"])
+            polls: list[dict] = [p for p in feed["polls"] if p["id"] != id]
+
+            await self.cache.aset(self.KEY, {"polls": polls, "total": feed["total"] - 1})
+
+    def is_counter(self, path: str) -> bool:
+        return path in self.COUNTER_FIELDS or bool(re.fullmatch(r"options\.\d+\.votes", path))
+
+    def on_poll_change(self, change: dict):
+        """
+        Change stream handler, drops the local copy of the feed when a poll is created,
+        deleted or edited, so this process reads the feed patched by the writer again.
+        Counter and vote updates are left to the region TTL.
+        """
+        if change["operationType"] == "update":
+            description: dict = change["updateDescription"]
+            paths: list = [*description["updatedFields"], *description.get("removedFields", [])]
+
+            if all(self.is_counter(path=path) for path in paths):
+                return
+
+        self.cache.delete_local(self.KEY)
+
+
+front_page_feed = FrontPageService(size=settings.FRONT_PAGE["SIZE"])
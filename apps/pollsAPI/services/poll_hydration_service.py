@@ -0,0 +1,69 @@
+import asyncio
+
+from bson.objectid import ObjectId
+
+from apps.pollsAPI.repositories.user_actions_repository import UserActionsRepository
+from apps.pollsAPI.utils.poll_utils import PollUtils
+from apps.accountsAPI.services.user_profile_service import UserProfileService
+
+
+class PollHydrationService:
+    """
+    Service class for attaching owner profiles and user actions to a page of items.
+
+    This class resolves everything a page needs in bulk, one query for the owner profiles
+    and one for the authenticated user actions, running both concurrently instead of
+    issuing two queries per item.
+    """
+
+    user_actions_repository = UserActionsRepository()
+    user_profile_service = UserProfileService()
+    utils = PollUtils()
+
+    async def get_user_actions(self, poll_ids: list[str], user_id: int | None = None):
+        """
+        Retrieves the authenticated user actions for several polls, keyed by poll ID.
+        """
+        if (not user_id) or (not poll_ids):
+            return {}
+
+        projection: dict = {"_id": 0, "has_voted": 1, "has_shared": 1, "has_bookmarked": 1}
+        results: dict = await self.user_actions_repository.get_many_user_actions(
+            ids=[ObjectId(id) for id in set(poll_ids)], user_id=user_id, projection=projection
+        )
+
+        user_actions: dict = {}
+        for poll_id, result in results.items():
+            user_actions[str(poll_id)] = await self.utils.bson_to_json(bson=result)
+
+        return user_actions
+
+    async def get_owners(self, user_ids: list[int]):
+        """
+        Retrieves the owner profiles of several items, keyed by user ID.
+        """
+        if not user_ids:
+            return {}
+
+        return await self.user_profile_service.a_get_owners(user_ids=list(set(user_ids)))
+
+    async def hydrate(
+        self, user_ids: list[int], poll_ids: list[str] = [], user_id: int | None = None
+    ):
+        """
+        Resolves owner profiles and user actions for a page of items concurrently.
+
+        Args:
+            user_ids (list[int]): The IDs of the owners of the items.
+            poll_ids (list[str]): The IDs of the polls to retrieve user actions for.
+            user_id (int): The ID of the authenticated user, if any.
+
+        Returns:
+            tuple: The owner profiles keyed by user ID and the user actions keyed by poll ID.
+        """
+        profiles, user_actions = await asyncio.gather(
+            self.get_owners(user_ids=user_ids),
+            self.get_user_actions(poll_ids=poll_ids, user_id=user_id),
+        )
+
+        return profiles, user_actions
@@ -1,52 +1,61 @@
+from functools import partial
+
 from bson import BSON
-from bson.objectid import ObjectId
 
 from apps.pollsAPI.repositories.poll_list_repository import PollListRepository
-from apps.pollsAPI.repositories.user_actions_repository import UserActionsRepository
+from apps.pollsAPI.repositories.poll_search_repository import PollSearchRepository
+from apps.pollsAPI.repositories.user_activity_repository import UserActivityRepository
+from apps.pollsAPI.services.front_page_service import front_page_feed
+from apps.pollsAPI.services.poll_hydration_service import PollHydrationService
+from apps.pollsAPI.services.search_index_service import search_index
 from apps.pollsAPI.utils.poll_utils import PollUtils
-from apps.accountsAPI.services.user_profile_service import UserProfileService
 
 from utils.pagination import Pagination
 
 
 class PollListService:
     repository = PollListRepository()
-    user_actions_repository = UserActionsRepository()
-    user_profile_service = UserProfileService()
+    search_repository = PollSearchRepository()
+    activity_repository = UserActivityRepository()
+    hydration_service = PollHydrationService()
     utils = PollUtils()
     pagination = Pagination()
+    front_page = front_page_feed
+    search_index = search_index
 
-    async def filter_poll_list(self, polls: list[dict], user_id: int | None = None):
-        items: list[dict] = []
-        for poll in polls:
-            poll: dict = await self.utils.simplify_poll_data(poll=poll)
-            profile: dict = await self.user_profile_service.a_get_owner(user_id=poll["user_id"])
-            poll["user_profile"] = profile
+    async def filter_poll_list(self, polls: list[BSON], user_id: int | None = None):
+        """
+        Converts the polls of a page to the API shape and attaches owners and user actions.
 
-            user_actions: dict = {}
-            if user_id:
-                projection: dict = {"_id": 0, "has_voted": 1, "has_shared": 1, "has_bookmarked": 1}
-                result: BSON = await self.user_actions_repository.get_user_actions(
-                    id=ObjectId(poll["id"]), user_id=user_id, projection=projection
-                )
+        Called on the page items only, after pagination.
+        """
+        polls: list[dict] = [await self.utils.simplify_poll_data(poll=poll) for poll in polls]
 
-                if result != None:
-                    result: dict = await self.utils.bson_to_json(bson=result)
-                    user_actions = result
+        profiles, user_actions = await self.hydration_service.hydrate(
+            user_ids=[poll["user_id"] for poll in polls],
+            poll_ids=[poll["id"] for poll in polls],
+            user_id=user_id,
+        )
+
+        items: list[dict] = []
+        for poll in polls:
+            poll["user_profile"] = profiles.get(poll["user_id"])
 
             item: dict = {}
             item["poll"] = poll
-            item["authenticated_user_actions"] = user_actions
+            item["authenticated_user_actions"] = user_actions.get(poll["id"], {})
             items.append(item)
 
         return items
 
-    async def get_all(self, page: int, page_size: int, user_id: int | None = None):
-        polls: list[BSON] = await self.repository.get_all()
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
-
-        data: dict = await self.pagination.a_paginate(
-            object_list=polls, page=page, page_size=page_size
+    async def keyset_page(
+        self, polls: list[BSON], page_size: int, cursor: str, key: str, user_id: int | None = None
+    ):
+        """
+        Builds a keyset page from the raw query result.
+        """
+        data: dict = self.pagination.paginate_keyset(
+            object_list=polls, page_size=page_size, cursor=cursor, key=key
         )
 
         items = await self.filter_poll_list(polls=data["items"], user_id=user_id)
@@ -54,14 +63,26 @@ class PollListService:
 
         return data
 
-    async def get_by_keyword(
-        self, keyword: str, page: int, page_size: int, user_id: int | None = None
+    async def offset_page(
+        self,
+        fetch,
+        page: int,
+        page_size: int,
+        count: str,
+        count_key: str,
+        count_query,
+        user_id: int | None = None,
     ):
-        polls: list[BSON] = await self.repository.get_by_keyword(keyword=keyword, user_id=user_id)
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
-
-        data: dict = await self.pagination.a_paginate(
-            object_list=polls, page=page, page_size=page_size
+        """
+        Builds an offset page without counting the whole result, see 'Pagination'.
+        """
+        data: dict = await self.pagination.a_paginate_offset(
+            fetch=fetch,
+            page=page,
+            page_size=page_size,
+            count=count,
+            count_key=count_key,
+            count_query=count_query,
         )
 
         items = await self.filter_poll_list(polls=data["items"], user_id=user_id)
@@ -69,10 +90,43 @@ class PollListService:
 
         return data
 
-    async def get_by_user_id(self, id: int, page: int, page_size: int, user_id: int | None = None):
-        polls: list[BSON] = await self.repository.get_by_user_id(id=id, user_id=user_id)
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
+    async def get_all(
+        self,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
+    ):
+        if cursor is not None:
+            after: tuple = self.pagination.decode_cursor(cursor=cursor)
+            polls: list[BSON] = await self.repository.get_all(after=after, limit=page_size + 1)
+
+            return await self.keyset_page(
+                polls=polls, page_size=page_size, cursor=cursor, key="created_at", user_id=user_id
+            )
+
+        self.pagination.validate_count_mode(count=count, page=page)
 
+        # The first pages are served from the cached front page feed.
+        data: dict | None = await self.front_page.get_page(
+            page=page, page_size=page_size, user_id=user_id
+        )
+        if data is not None:
+            return data
+
+        if count != "exact":
+            return await self.offset_page(
+                fetch=self.repository.get_all,
+                page=page,
+                page_size=page_size,
+                count=count,
+                count_key="polls:all",
+                count_query=self.repository.count_all,
+                user_id=user_id,
+            )
+
+        polls: list[BSON] = await self.repository.get_all()
         data: dict = await self.pagination.a_paginate(
             object_list=polls, page=page, page_size=page_size
         )
@@ -82,27 +136,80 @@ class PollListService:
 
         return data
 
-    async def get_by_user_votes(
-        self, id: int, page: int, page_size: int, user_id: int | None = None
+    async def get_by_keyword(
+        self, keyword: str, page: int, page_size: int, user_id: int | None = None
     ):
-        polls: list[BSON] = await self.repository.get_by_user_votes(id=id, user_id=user_id)
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
-
-        data: dict = await self.pagination.a_paginate(
-            object_list=polls, page=page, page_size=page_size
-        )
-
-        items = await self.filter_poll_list(polls=data["items"], user_id=user_id)
+        """
+        Retrieves a page of the polls matching a keyword, ranked by the in-process search index
+        once built, by the search repository otherwise.
+        """
+        self.pagination.validate_page(page=page)
+        skip: int = self.pagination.get_offset(page=page, page_size=page_size)
+
+        if self.search_index.ready:
+            ids, total = self.search_index.search(keyword=keyword, skip=skip, limit=page_size + 1)
+
+            # The page is cut from the IDs, so 'has_next' does not depend on the filter below.
+            data: dict = self.pagination.paginate_offset(
+                object_list=ids, page=page, page_size=page_size, total_items=total
+            )
+
+            # Polls made private since they were indexed are left out.
+            polls: list[BSON] = [
+                poll
+                for poll in await self.repository.get_by_ids(ids=data["items"])
+                if poll["privacy"] == "public"
+            ]
+
+        else:
+            polls, total = await self.search_repository.search(
+                keyword=keyword, user_id=user_id, skip=skip, limit=page_size + 1
+            )
+
+            data: dict = self.pagination.paginate_offset(
+                object_list=polls, page=page, page_size=page_size, total_items=total
+            )
+            polls = data["items"]
+
+        items = await self.filter_poll_list(polls=polls, user_id=user_id)
         data["items"] = items
 
         return data
 
-    async def get_by_user_shares(
-        self, id: int, page: int, page_size: int, user_id: int | None = None
+    async def get_by_user_id(
+        self,
+        id: int,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ):
-        polls: list[BSON] = await self.repository.get_by_user_shares(id=id, user_id=user_id)
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
+        if cursor is not None:
+            after: tuple = self.pagination.decode_cursor(cursor=cursor)
+            polls: list[BSON] = await self.repository.get_by_user_id(
+                id=id, user_id=user_id, after=after, limit=page_size + 1
+            )
+
+            return await self.keyset_page(
+                polls=polls, page_size=page_size, cursor=cursor, key="created_at", user_id=user_id
+            )
+
+        self.pagination.validate_count_mode(count=count, page=page)
+        if count != "exact":
+            filter: dict = self.repository.user_filter(id=id, user_id=user_id)
+
+            return await self.offset_page(
+                fetch=partial(self.repository.get_by_user_id, id=id, user_id=user_id),
+                page=page,
+                page_size=page_size,
+                count=count,
+                count_key=f"polls:user:{id}:{user_id}",
+                count_query=partial(self.repository.count, filter=filter),
+                user_id=user_id,
+            )
 
+        polls: list[BSON] = await self.repository.get_by_user_id(id=id, user_id=user_id)
         data: dict = await self.pagination.a_paginate(
             object_list=polls, page=page, page_size=page_size
         )
@@ -112,29 +219,163 @@ class PollListService:
 
         return data
 
-    async def get_by_user_bookmarks(
-        self, id: int, page: int, page_size: int, user_id: int | None = None
+    async def get_by_user_activity(
+        self,
+        id: int,
+        action: str,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ):
-        polls: list[BSON] = await self.repository.get_by_user_bookmarks(id=id, user_id=user_id)
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
-
-        data: dict = await self.pagination.a_paginate(
-            object_list=polls, page=page, page_size=page_size
+        """
+        Retrieves the polls on which a user took an action, from the user activity timeline.
+
+        The timeline entries are paginated first, then only the polls of the page are loaded.
+        Entries are filtered on the poll summary they hold, which may be stale, so the privacy
+        of the loaded polls is checked again.
+        """
+        if cursor is not None:
+            after: tuple = self.pagination.decode_cursor(cursor=cursor)
+            entries: list[BSON] = await self.activity_repository.find(
+                id=id, user_id=user_id, action=action, after=after, limit=page_size + 1
+            )
+            data: dict = self.pagination.paginate_keyset(
+                object_list=entries, page_size=page_size, cursor=cursor, key="at", id_key="poll_id"
+            )
+
+        elif count != "exact":
+            self.pagination.validate_count_mode(count=count, page=page)
+
+            data: dict = await self.pagination.a_paginate_offset(
+                fetch=partial(self.activity_repository.find, id=id, user_id=user_id, action=action),
+                page=page,
+                page_size=page_size,
+                count=count,
+                count_key=f"activity:{action}:{id}:{user_id}",
+                count_query=partial(
+                    self.activity_repository.count, id=id, user_id=user_id, action=action
+                ),
+            )
+
+        else:
+            entries: list[BSON] = await self.activity_repository.find(
+                id=id, user_id=user_id, action=action
+            )
+            data: dict = await self.pagination.a_paginate(
+                object_list=entries, page=page, page_size=page_size
+            )
+
+        polls: list[BSON] = await self.repository.get_by_ids(
+            ids=[entry["poll_id"] for entry in data["items"]]
         )
-
-        items = await self.filter_poll_list(polls=data["items"], user_id=user_id)
+        polls = [
+            poll
+            for poll in polls
+            if await self.utils.check_poll_privacy(
+                user_id=user_id, poll=poll, raise_exception=False
+            )
+        ]
+
+        items = await self.filter_poll_list(polls=polls, user_id=user_id)
         data["items"] = items
 
         return data
 
+    async def get_by_user_votes(
+        self,
+        id: int,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
+    ):
+        return await self.get_by_user_activity(
+            id=id,
+            action="has_voted",
+            page=page,
+            page_size=page_size,
+            user_id=user_id,
+            cursor=cursor,
+            count=count,
+        )
+
+    async def get_by_user_shares(
+        self,
+        id: int,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
+    ):
+        return await self.get_by_user_activity(
+            id=id,
+            action="has_shared",
+            page=page,
+            page_size=page_size,
+            user_id=user_id,
+            cursor=cursor,
+            count=count,
+        )
+
+    async def get_by_user_bookmarks(
+        self,
+        id: int,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
+    ):
+        return await self.get_by_user_activity(
+            id=id,
+            action="has_bookmarked",
+            page=page,
+            page_size=page_size,
+            user_id=user_id,
+            cursor=cursor,
+            count=count,
+        )
+
     async def get_by_category(
-        self, category: str, page: int, page_size: int, user_id: int | None = None
+        self,
+        category: str,
+        page: int,
+        page_size: int,
+        user_id: int | None = None,
+        cursor: str | None = None,
+        count: str = "exact",
     ):
+        if cursor is not None:
+            after: tuple = self.pagination.decode_cursor(cursor=cursor)
+            polls: list[BSON] = await self.repository.get_by_category(
+                category=category, user_id=user_id, after=after, limit=page_size + 1
+            )
+
+            return await self.keyset_page(
+                polls=polls, page_size=page_size, cursor=cursor, key="created_at", user_id=user_id
+            )
+
+        self.pagination.validate_count_mode(count=count, page=page)
+        if count != "exact":
+            filter: dict = self.repository.category_filter(category=category, user_id=user_id)
+
+            return await self.offset_page(
+                fetch=partial(self.repository.get_by_category, category=category, user_id=user_id),
+                page=page,
+                page_size=page_size,
+                count=count,
+                count_key=f"polls:category:{category}:{user_id}",
+                count_query=partial(self.repository.count, filter=filter),
+                user_id=user_id,
+            )
+
         polls: list[BSON] = await self.repository.get_by_category(
             category=category, user_id=user_id
         )
-        polls: list[dict] = await self.utils.bson_to_json(bson=polls)
-
         data: dict = await self.pagination.a_paginate(
             object_list=polls, page=page, page_size=page_size
         )
@@ -0,0 +1,66 @@
+from bson import BSON
+
+from rest_framework.exceptions import NotFound
+
+from apps.pollsAPI.repositories.poll_results_repository import PollResultsRepository
+from apps.pollsAPI.utils.poll_utils import PollUtils
+
+from utils.cache import get_region
+
+
+class PollResultsService:
+    """
+    Service class for reading the vote tallies of polls.
+
+    Results are read from the compact 'poll_results' documents instead of the poll document,
+    and cached in the 'poll_results' cache region independently of the poll body.
+    """
+
+    repository = PollResultsRepository()
+    utils = PollUtils()
+    cache = get_region("poll_results")
+
+    async def get_by_poll_id(self, id: str, user_id: int | None = None):
+        """
+        Retrieves the vote tallies of a poll.
+
+        Args:
+            id (str): The ID of the poll.
+            user_id (int): The ID of the user requesting the results.
+        """
+        await self.utils.validate_id(id=id)
+
+        results: dict = await self.cache.aget(id)
+        if results is None:
+            document: BSON = await self.repository.get_by_poll_id(id=id)
+
+            if not document:
+                # Backfill polls created before the results collection existed.
+                document: BSON = await self.repository.rebuild(id=id)
+
+            if not document:
+                message: str = "Poll not found"
+                raise NotFound(detail={"message": message})
+
+            results: dict = await self.utils.simplify_poll_results_data(results=document)
+            await self.cache.aset(id, results)
+
+        await self.utils.check_poll_privacy(user_id=user_id, poll=results)
+
+        return results
+
+    async def invalidate(self, id: str):
+        """
+        Removes the cached results of a poll after a write.
+        """
+        await self.cache.adelete(str(id))
+
+    def on_poll_change(self, change: dict):
+        """
+        Change stream handler, removes the cached results of the changed poll in this process.
+        """
+        if change["operationType"] == "invalidate_all":
+            self.cache.clear()
+            return
+
+        self.cache.delete_local(str(change["documentKey"]["_id"]))
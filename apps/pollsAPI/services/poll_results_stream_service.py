@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+import time
+
+from bson import BSON
+
+from django.conf import settings
+
+from apps.pollsAPI.repositories.poll_results_repository import PollResultsRepository
+from apps.pollsAPI.utils.poll_utils import PollUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResultsChannel:
+    """
+    Upstream subscription to the results of one poll, shared by its connected clients.
+    """
+
+    def __init__(self, id: str):
+        self.id = id
+        self.queues: set[asyncio.Queue] = set()
+        self.results: dict | None = None
+
+        # Set by the change stream, the results are read again on the next tick.
+        self.dirty: bool = True
+        self.read_at: float = 0
+
+        self.task: asyncio.Task | None = None
+
+
+class PollResultsStreamService:
+    """
+    Service class for pushing the vote tallies of polls to connected clients.
+
+    Each poll with connected clients has a single channel in the process, which reads the
+    compact results document at most once per 'interval_ms' milliseconds and pushes it to
+    every client when it changed. When the change stream worker runs, the channel only reads
+    after a change of the poll, or every 'idle_read_seconds' as a safety net.
+
+    Each client holds at most one pending update, a newer one replaces it, so slow clients
+    only skip intermediate tallies.
+    """
+
+    repository = PollResultsRepository()
+    utils = PollUtils()
+
+    def __init__(
+        self,
+        interval_ms: int = 1000,
+        heartbeat_seconds: float = 15,
+        max_duration_seconds: float = 300,
+        idle_read_seconds: float = 30,
+        event_driven: bool = False,
+    ):
+        self.interval = interval_ms / 1000
+        self.heartbeat = heartbeat_seconds
+        self.max_duration = max_duration_seconds
+        self.idle_read = idle_read_seconds
+        self.event_driven = event_driven
+
+        # { poll_id: ResultsChannel }
+        self.channels: dict = {}
+
+    def offer(self, queue: asyncio.Queue, results: dict | None):
+        """
+        Puts the latest results in a client queue, dropping the pending ones.
+        """
+        if queue.full():
+            queue.get_nowait()
+
+        queue.put_nowait(results)
+
+    def subscribe(self, id: str) -> asyncio.Queue:
+        channel: ResultsChannel | None = self.channels.get(id)
+        if channel is None:
+            channel = ResultsChannel(id=id)
+            channel.task = asyncio.create_task(self.run(channel=channel))
+            self.channels[id] = channel
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        channel.queues.add(queue)
+
+        # Catch up with the channel, the caller may hold older results.
+        if channel.results is not None:
+            self.offer(queue=queue, results=channel.results)
+
+        return queue
+
+    def unsubscribe(self, id: str, queue: asyncio.Queue):
+        channel: ResultsChannel | None = self.channels.get(id)
+        if channel is None:
+            return
+
+        channel.queues.discard(queue)
+
+        if not channel.queues:
+            channel.task.cancel()
+            del self.channels[id]
+
+    async def read(self, channel: ResultsChannel) -> dict | None:
+        document: BSON | None = await self.repository.get_by_poll_id(id=channel.id)
+        if document is None:
+            return None
+
+        return await self.utils.simplify_poll_results_data(results=document)
+
+    async def run(self, channel: ResultsChannel):
+        """
+        Reads the results of a poll on every tick and pushes them when they changed.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+
+            idle: bool = time.monotonic() - channel.read_at < self.idle_read
+            if self.event_driven and not channel.dirty and idle:
+                continue
+
+            channel.dirty = False
+            channel.read_at = time.monotonic()
+
+            try:
+                results: dict | None = await self.read(channel=channel)
+
+            except Exception:
+                logger.exception("Poll results read failed, retrying on next tick.")
+                continue
+
+            if results == channel.results:
+                continue
+
+            channel.results = results
+            for queue in channel.queues:
+                self.offer(queue=queue, results=results)
+
+            # The poll has been deleted.
+            if results is None:
+                return
+
+    def on_poll_change(self, change: dict):
+        """
+        Change stream handler, marks the channel of the changed poll to be read again.
+        """
+        if change["operationType"] == "invalidate_all":
+            for channel in self.channels.values():
+                channel.dirty = True
+            return
+
+        channel: ResultsChannel | None = self.channels.get(str(change["documentKey"]["_id"]))
+        if channel is not None:
+            channel.dirty = True
+
+    def format_event(self, event: str, data: dict | None = None) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+    async def stream(self, id: str, results: dict, user_id: int | None = None):
+        """
+        Yields the results of a poll as server-sent events.
+
+        The stream ends after 'max_duration' seconds, when the poll is deleted or when it
+        becomes private to another user. Browsers reconnect on their own after the 'retry'
+        delay, which also releases the channels of clients that left.
+
+        Args:
+            id (str): The ID of the poll.
+            results (dict): The current results, already checked for privacy.
+            user_id (int): The ID of the user connected.
+        """
+        loop = asyncio.get_running_loop()
+        deadline: float = loop.time() + self.max_duration
+        queue: asyncio.Queue = self.subscribe(id=id)
+
+        try:
+            yield f"retry: {int(self.interval * 1000)}\n"
+            yield self.format_event(event="results", data=results)
+
+            while True:
+                timeout: float = min(self.heartbeat, deadline - loop.time())
+                if timeout <= 0:
+                    return
+
+                try:
+                    update: dict | None = await asyncio.wait_for(queue.get(), timeout=timeout)
+
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if update is None:
+                    yield self.format_event(event="deleted")
+                    return
+
+                allowed: bool = await self.utils.check_poll_privacy(
+                    user_id=user_id, poll=update, raise_exception=False
+                )
+                if not allowed:
+                    return
+
+                if update != results:
+                    results = update
+                    yield self.format_event(event="results", data=results)
+
+        finally:
+            self.unsubscribe(id=id, queue=queue)
+
+
+poll_results_stream_service = PollResultsStreamService(
+    interval_ms=settings.RESULTS_STREAM["INTERVAL_MS"],
+    heartbeat_seconds=settings.RESULTS_STREAM["HEARTBEAT_SECONDS"],
+    max_duration_seconds=settings.RESULTS_STREAM["MAX_DURATION_SECONDS"],
+    event_driven=settings.CHANGE_STREAMS["ENABLED"],
+)
@@ -1,16 +1,32 @@
+import asyncio
+import logging
+
 from bson.objectid import ObjectId
 from bson import BSON
 
+from rest_framework.exceptions import ValidationError
+
 from apps.pollsAPI.repositories.user_actions_repository import UserActionsRepository
 from apps.pollsAPI.serializers.poll_serializers import (
     PollSerializer,
+    PollBatchSerializer,
     OptionsSerializer,
     OptionSerializer,
 )
 from apps.pollsAPI.repositories.poll_repository import PollRepository
+from apps.pollsAPI.repositories.user_activity_repository import UserActivityRepository
+from apps.pollsAPI.services.front_page_service import front_page_feed
+from apps.pollsAPI.services.poll_list_service import PollListService
+from apps.pollsAPI.services.poll_results_service import PollResultsService
+from apps.pollsAPI.services.search_index_service import search_index
 from apps.pollsAPI.utils.poll_utils import PollUtils
 from apps.pollsAPI.utils.poll_option_utils import PollOptionUtils
+from apps.pollsAPI.utils.projections import VERSION_PROJECTION
 from apps.accountsAPI.services.user_profile_service import UserProfileService
+from utils.http_cache import make_etag
+
+
+logger = logging.getLogger(__name__)
 
 
 class PollService:
@@ -26,7 +42,12 @@ class PollService:
     utils = PollUtils()
     option_utils = PollOptionUtils()
     user_actions_repository = UserActionsRepository()
+    activity_repository = UserActivityRepository()
     user_profile_service = UserProfileService()
+    results_service = PollResultsService()
+    front_page = front_page_feed
+    search_index = search_index
+    list_service = PollListService()
 
     async def create(self, data: dict, user_id: int):
         """
@@ -52,6 +73,9 @@ class PollService:
         poll: dict = poll_serializer.save()
 
         object_id: ObjectId = await self.repository.create(data=poll)
+        await self.front_page.add(poll=poll)
+        self.search_index.add(poll=poll)
+
         return object_id
 
     async def get_by_id(self, id: str, user_id: int | None = None):
@@ -66,8 +90,7 @@ class PollService:
         poll: BSON = await self.repository.get_by_id(id=id)
         await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
 
-        poll: dict = await self.utils.bson_to_json(bson=poll)
-        poll = await self.utils.simplify_poll_data(poll=poll)
+        poll: dict = await self.utils.simplify_poll_data(poll=poll)
         user_profile: dict = await self.user_profile_service.a_get_owner(user_id=poll["user_id"])
         poll["user_profile"] = user_profile
 
@@ -84,6 +107,91 @@ class PollService:
 
         return poll, user_actions
 
+    async def get_actions_version(self, id: str, user_id: int | None = None) -> int:
+        if not user_id:
+            return 0
+
+        result: BSON = await self.user_actions_repository.get_user_actions(
+            id=id, user_id=user_id, projection={"_id": 0, "version": 1}
+        )
+
+        return result.get("version", 0) if result else 0
+
+    async def get_etag(self, id: str, user_id: int | None = None) -> str | None:
+        """
+        Computes the ETag of a poll detail without building it.
+
+        The ETag combines the 'version' of the poll, incremented by every write to the poll
+        document, and the 'version' of the user actions document of the user, so it only takes
+        two projected lookups by index. The owner profile is not part of it, a renamed owner
+        shows up with the next write to the poll.
+
+        Returns:
+            str: The ETag, or None if the poll does not exist or the user cannot see it.
+        """
+        if not ObjectId.is_valid(id):
+            return None
+
+        poll, actions_version = await asyncio.gather(
+            self.repository.get_by_id(id=id, raise_exception=False, projection=VERSION_PROJECTION),
+            self.get_actions_version(id=id, user_id=user_id),
+        )
+
+        if poll is None:
+            return None
+
+        if not await self.utils.check_poll_privacy(
+            user_id=user_id, poll=poll, raise_exception=False
+        ):
+            return None
+
+        return make_etag(id, poll.get("version", 0), user_id or 0, actions_version)
+
+    async def get_many(self, ids: list[str], user_id: int | None = None):
+        """
+        Retrieves several polls by their IDs with one query, including user-specific actions.
+
+        Privacy rules are applied to each poll, the polls that do not exist or that the user
+        cannot see are listed apart instead of failing the whole request.
+
+        Args:
+            ids (list[str]): The IDs of the polls to retrieve, at most 50.
+            user_id (int): The ID of the user requesting the polls.
+
+        Returns:
+            dict: The polls keyed by ID, and the IDs not found or not authorized.
+        """
+        batch_serializer = PollBatchSerializer(data={"ids": ids})
+        batch_serializer.is_valid(raise_exception=True)
+
+        ids: list[str] = list(dict.fromkeys(batch_serializer.validated_data["ids"]))
+        if not all(ObjectId.is_valid(id) for id in ids):
+            message: str = "Invalid poll ID"
+            raise ValidationError(detail={"message": message})
+
+        polls: list[BSON] = await self.repository.get_many(ids=[ObjectId(id) for id in ids])
+
+        found: set = set()
+        allowed: list[BSON] = []
+        for poll in polls:
+            found.add(str(poll["_id"]))
+
+            if await self.utils.check_poll_privacy(
+                user_id=user_id, poll=poll, raise_exception=False
+            ):
+                allowed.append(poll)
+
+        items: list[dict] = await self.list_service.filter_poll_list(polls=allowed, user_id=user_id)
+        items_by_id: dict = {item["poll"]["id"]: item for item in items}
+
+        data: dict = {
+            "items": {id: items_by_id[id] for id in ids if id in items_by_id},
+            "not_found": [id for id in ids if id not in found],
+            "not_authorized": [id for id in ids if id in found and id not in items_by_id],
+        }
+
+        return data
+
     async def update(self, id: str, data: dict, user_id: int):
         """
         Updates a poll, including adding and removing options.
@@ -128,6 +236,21 @@ class PollService:
             add_options=add_options,
             del_options=del_options,
         )
+        await self.results_service.invalidate(id=id)
+        await self.front_page.refresh(previous=poll)
+
+        # Keep the poll summary of the activity timelines up to date. The poll is already saved,
+        # a failure is only logged and repaired with 'python manage.py backfill_user_activity'.
+        summary: dict = {**poll, **poll_serializer.validated_data}
+        if any(poll.get(field) != summary.get(field) for field in ("privacy", "title", "category")):
+            try:
+                await self.activity_repository.update_poll(poll=summary)
+
+            except Exception:
+                logger.exception("User activity of poll %s not updated.", id)
+
+        if any(poll.get(field) != summary.get(field) for field in self.search_index.INDEXED_FIELDS):
+            self.search_index.add(poll=summary)
 
         return object_id
 
@@ -144,6 +267,10 @@ class PollService:
         await self.utils.is_owner(object=poll, user_id=user_id)
 
         object_id: ObjectId = await self.repository.delete(id=id, poll=poll)
+        await self.results_service.invalidate(id=id)
+        await self.front_page.remove(poll=poll)
+        self.search_index.remove(id=id)
+
         return object_id
 
     async def add_option(self, id: str, user_id: int, data: dict):
@@ -162,6 +289,9 @@ class PollService:
         )
 
         object_id: ObjectId = await self.repository.add_option(id=id, option=option)
+        await self.results_service.invalidate(id=id)
+        await self.front_page.refresh(previous=poll)
+
         return object_id
 
     async def del_option(self, id: str, data: dict, user_id: int):
@@ -180,4 +310,7 @@ class PollService:
         option_serializer.is_valid(raise_exception=True)
 
         object_id: ObjectId = await self.repository.del_option(id=id, option=option)
+        await self.results_service.invalidate(id=id)
+        await self.front_page.refresh(previous=poll)
+
         return object_id
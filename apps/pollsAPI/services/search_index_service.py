@@ -0,0 +1,342 @@
+import asyncio
+import heapq
+import logging
+import math
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+
+from bson import BSON
+from bson.objectid import ObjectId
+
+from django.conf import settings
+
+from apps.pollsAPI.repositories.poll_repository import PollRepository
+from apps.pollsAPI.utils.projections import SEARCH_INDEX_PROJECTION
+from apps.pollsAPI.utils.search_utils import SearchUtils
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchIndexService:
+    """
+    In-process inverted index of the public polls, the 'memory' search backend.
+
+    Each term maps to two parallel arrays, the numbers of the documents containing it and the
+    term frequencies, in increasing document order. A poll gets a new document number every
+    time it is indexed, its previous number is left as a tombstone, and the posting lists are
+    compacted once tombstones make up a quarter of the documents.
+
+    The index is built by a streaming scan of the polls at startup, PollService applies the
+    writes of this process and the change stream those of the other processes. Queries are
+    answered while it builds by the Mongo backend. Matches are ranked by BM25 over the title,
+    description and category, plus the same recency decay as PollSearchRepository, and the
+    last word of a query also matches as a prefix.
+
+    Other processes' writes only reach the index through the change stream, so with several
+    workers the 'memory' backend requires CHANGE_STREAMS_ENABLED (see PollsConfig).
+    """
+
+    repository = PollRepository()
+    utils = SearchUtils()
+
+    K1: float = 1.2
+    B: float = 0.75
+    RECENCY_WEIGHT: float = 0.5
+    RECENCY_HALF_LIFE_DAYS: float = 30
+
+    # Share of tombstones that triggers a compaction.
+    COMPACT_RATIO: float = 0.25
+
+    # Fields whose update changes the index.
+    INDEXED_FIELDS: set = {"title", "description", "category", "privacy"}
+
+    def __init__(self, enabled: bool = False, batch_size: int = 1000):
+        self.enabled = enabled
+        self.batch_size = batch_size
+        self.ready: bool = False
+        self.reset()
+
+        # IDs written while the index builds, the scan keeps their newer entries.
+        self._touched: set | None = None
+        self._building: asyncio.Task | None = None
+        self._tasks: set = set()
+
+    def reset(self):
+        # { term: (array of document numbers, array of term frequencies) }
+        self.postings: dict[str, tuple[array, array]] = {}
+
+        # Per document number: poll ID (None once removed), creation timestamp, length.
+        self.ids: list[ObjectId | None] = []
+        self.created_at: array = array("d")
+        self.lengths: array = array("I")
+
+        # { poll_id: document number }
+        self.numbers: dict[ObjectId, int] = {}
+
+        self.total_length: int = 0
+        self.removed: int = 0
+        self.build_seconds: float | None = None
+        self._terms: list[str] | None = None
+
+    def add(self, poll: dict):
+        """
+        Indexes a public poll, or removes a poll that is no longer public.
+        """
+        if not self.enabled:
+            return
+
+        if self._touched is not None:
+            self._touched.add(poll["_id"])
+
+        self.discard(id=poll["_id"])
+        if poll.get("privacy") != "public":
+            return
+
+        frequencies: dict = {}
+        for field in self.utils.FIELDS:
+            for term in self.utils.tokenize(text=poll.get(field)):
+                frequencies[term] = frequencies.get(term, 0) + 1
+
+        number: int = len(self.ids)
+        for term, frequency in frequencies.items():
+            entry: tuple | None = self.postings.get(term)
+            if entry is None:
+                entry = (array("I"), array("H"))
+                self.postings[term] = entry
+                if self._terms is not None:
+                    insort(self._terms, term)
+
+            entry[0].append(number)
+            entry[1].append(min(frequency, 0xFFFF))
+
+        length: int = sum(frequencies.values())
+        self.ids.append(poll["_id"])
+        self.created_at.append(poll["created_at"].timestamp())
+        self.lengths.append(length)
+        self.numbers[poll["_id"]] = number
+        self.total_length += length
+
+    def remove(self, id: str | ObjectId):
+        if not self.enabled:
+            return
+
+        id = ObjectId(id)
+        if self._touched is not None:
+            self._touched.add(id)
+
+        self.discard(id=id)
+
+    def discard(self, id: ObjectId):
+        number: int | None = self.numbers.pop(id, None)
+        if number is None:
+            return
+
+        self.ids[number] = None
+        self.total_length -= self.lengths[number]
+        self.removed += 1
+
+        if self.removed > len(self.ids) * self.COMPACT_RATIO:
+            self.compact()
+
+    def compact(self):
+        """
+        Renumbers the live documents and drops the tombstones from the posting lists.
+        """
+        mapping: dict = {}
+        ids: list = []
+        created_at: array = array("d")
+        lengths: array = array("I")
+
+        for number, id in enumerate(self.ids):
+            if id is None:
+                continue
+
+            mapping[number] = len(ids)
+            ids.append(id)
+            created_at.append(self.created_at[number])
+            lengths.append(self.lengths[number])
+
+        postings: dict = {}
+        for term, (numbers, frequencies) in self.postings.items():
+            kept: tuple = (array("I"), array("H"))
+            for number, frequency in zip(numbers, frequencies):
+                if number in mapping:
+                    kept[0].append(mapping[number])
+                    kept[1].append(frequency)
+
+            if kept[0]:
+                postings[term] = kept
+
+        self.postings = postings
+        self.ids = ids
+        self.created_at = created_at
+        self.lengths = lengths
+        self.numbers = {id: number for number, id in enumerate(ids)}
+        self.removed = 0
+        self._terms = None
+
+    def expand(self, prefix: str) -> list[str]:
+        """
+        Returns the indexed terms starting with a prefix.
+        """
+        if self._terms is None:
+            self._terms = sorted(self.postings)
+
+        terms: list = []
+        index: int = bisect_left(self._terms, prefix)
+        while index < len(self._terms) and self._terms[index].startswith(prefix):
+            terms.append(self._terms[index])
+            index += 1
+
+        return terms
+
+    def search(self, keyword: str, skip: int, limit: int) -> tuple[list[ObjectId], int]:
+        """
+        Ranks the public polls matching a keyword.
+
+        Returns the IDs of the polls of the page, best first, and the number of matches.
+        """
+        words: list = self.utils.tokenize(text=keyword)
+        documents: int = len(self.numbers)
+        if not words or not documents:
+            return [], 0
+
+        # The last word may still be typed. A single letter would match most of the corpus, it
+        # is only expanded from 'MIN_EDGE' letters on.
+        terms: set = set(words)
+        if len(words[-1]) >= self.utils.MIN_EDGE:
+            terms.update(self.expand(prefix=words[-1]))
+
+        average_length: float = max(self.total_length / documents, 1)
+        scores: dict = {}
+
+        for term in terms:
+            entry: tuple | None = self.postings.get(term)
+            if entry is None:
+                continue
+
+            numbers, frequencies = entry
+            idf: float = math.log(1 + (documents - len(numbers) + 0.5) / (len(numbers) + 0.5))
+
+            for number, frequency in zip(numbers, frequencies):
+                if self.ids[number] is None:
+                    continue
+
+                relative_length: float = self.lengths[number] / average_length
+                norm: float = self.K1 * (1 - self.B + self.B * relative_length)
+                score: float = idf * frequency * (self.K1 + 1) / (frequency + norm)
+                scores[number] = scores.get(number, 0) + score
+
+        now: float = time.time()
+        half_life: float = self.RECENCY_HALF_LIFE_DAYS * 24 * 60 * 60
+        for number in scores:
+            age: float = max(0, now - self.created_at[number])
+            scores[number] += self.RECENCY_WEIGHT / (1 + age / half_life)
+
+        best: list = heapq.nlargest(skip + limit, scores, key=scores.__getitem__)
+
+        return [self.ids[number] for number in best[skip:]], len(scores)
+
+    async def build(self):
+        """
+        Builds the index from a streaming scan of the public polls.
+        """
+        started_at: float = time.monotonic()
+        self.ready = False
+        self.reset()
+        self._touched = set()
+
+        try:
+            async for poll in self.repository.scan_public(
+                projection=SEARCH_INDEX_PROJECTION, batch_size=self.batch_size
+            ):
+                if poll["_id"] not in self._touched:
+                    self.add(poll=poll)
+
+        finally:
+            self._touched = None
+
+        if self.removed:
+            self.compact()
+
+        self.build_seconds = time.monotonic() - started_at
+        self.ready = True
+
+        logger.info("Search index built: %s", self.stats())
+
+    def rebuild(self):
+        if self._building is not None and not self._building.done():
+            self._building.cancel()
+
+        self._building = asyncio.create_task(self.build())
+
+    async def start(self):
+        if self.enabled:
+            self.rebuild()
+
+    async def close(self):
+        if self._building is not None and not self._building.done():
+            self._building.cancel()
+
+    async def reindex(self, id: ObjectId):
+        poll: BSON | None = await self.repository.get_by_id(
+            id=str(id), raise_exception=False, projection=SEARCH_INDEX_PROJECTION
+        )
+
+        if poll is None:
+            self.remove(id=id)
+        else:
+            self.add(poll=poll)
+
+    def on_poll_change(self, change: dict):
+        """
+        Change stream handler, indexes the polls created, edited or deleted by other processes.
+        """
+        if not self.enabled:
+            return
+
+        if change["operationType"] == "invalidate_all":
+            self.rebuild()
+            return
+
+        if change["operationType"] == "update":
+            fields: set = {
+                path.split(".")[0] for path in change["updateDescription"]["updatedFields"]
+            }
+            if not fields & self.INDEXED_FIELDS:
+                return
+
+        task: asyncio.Task = asyncio.create_task(self.reindex(id=change["documentKey"]["_id"]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def stats(self) -> dict:
+        """
+        Returns the size of the index, the bytes of its arrays and containers, and the
+        duration of the last build.
+        """
+        postings: int = sum(
+            sys.getsizeof(term) + sys.getsizeof(entry) + sum(map(sys.getsizeof, entry))
+            for term, entry in self.postings.items()
+        )
+        documents: int = (
+            sys.getsizeof(self.ids)
+            + sys.getsizeof(self.numbers)
+            + len(self.numbers) * sys.getsizeof(ObjectId())
+            + sys.getsizeof(self.created_at)
+            + sys.getsizeof(self.lengths)
+        )
+
+        return {
+            "documents": len(self.numbers),
+            "terms": len(self.postings),
+            "postings": sum(len(numbers) for numbers, _ in self.postings.values()),
+            "bytes": sys.getsizeof(self.postings) + postings + documents,
+            "build_seconds": self.build_seconds,
+        }
+
+
+search_index = SearchIndexService(enabled=settings.SEARCH["BACKEND"] == "memory")
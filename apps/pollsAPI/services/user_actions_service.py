@@ -1,37 +1,76 @@
+import logging
+
 from bson import BSON
 from bson.objectid import ObjectId
 
 from rest_framework.exceptions import ValidationError
 
 from apps.pollsAPI.repositories.user_actions_repository import UserActionsRepository
+from apps.pollsAPI.repositories.user_activity_repository import UserActivityRepository
 from apps.pollsAPI.repositories.poll_repository import PollRepository
+from apps.pollsAPI.services.poll_results_service import PollResultsService
 from apps.pollsAPI.utils.poll_utils import PollUtils
+from apps.pollsAPI.utils.projections import SUMMARY_PROJECTION
+
+
+logger = logging.getLogger(__name__)
 
 
 class UserActionsService:
+    """
+    Service class for the actions of users on polls: votes, shares and bookmarks.
+
+    Each action is claimed or released with a single conditional write on the user actions
+    document, and the counters of the poll are only applied when that write succeeds.
+    The user activity timeline is updated last.
+    """
+
     repository = UserActionsRepository()
+    activity_repository = UserActivityRepository()
     poll_repository = PollRepository()
+    results_service = PollResultsService()
     utils = PollUtils()
 
-    async def vote_add(self, id: str, user_id: int, vote: str):
+    async def check_poll(self, id: str, user_id: int) -> BSON:
+        """
+        Checks that a poll exists and that the user can access it, loading only its summary.
+        """
         await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
+        poll: BSON = await self.poll_repository.get_by_id(id=id, projection=SUMMARY_PROJECTION)
         await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
 
-        projection: dict = {"_id": 0, "poll_id": 1, "has_voted": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        return poll
 
-        if result is None:
-            # Create a user actions document if it doesn't exist.
-            await self.repository.create(id=id, user_id=user_id)
+    async def record_activity(self, poll: BSON, user_id: int, action: str, added: bool = True):
+        """
+        Adds or removes an action in the user activity timeline.
 
-        elif "has_vote" in result:
+        The action is already stored, a failure is only logged and the timeline is repaired
+        with 'python manage.py backfill_user_activity'.
+        """
+        try:
+            if added:
+                await self.activity_repository.add(poll=poll, user_id=user_id, action=action)
+            else:
+                await self.activity_repository.remove(
+                    id=str(poll["_id"]), user_id=user_id, action=action
+                )
+
+        except Exception:
+            logger.exception("User activity of user %s not recorded.", user_id)
+
+    async def vote_add(self, id: str, user_id: int, vote: str):
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
+
+        object_id: ObjectId = await self.repository.insert_vote(id=id, user_id=user_id, vote=vote)
+
+        if object_id is None:
             message: str = "The user has already voted in this poll."
             raise ValidationError(detail={"message": message})
 
-        object_id: ObjectId = await self.repository.insert_vote(id=id, user_id=user_id, vote=vote)
+        await self.results_service.invalidate(id=id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_voted")
+
         return object_id
 
     async def vote_read(self, id: str, user_id: int):
@@ -42,125 +81,85 @@ class UserActionsService:
             id=ObjectId(id), user_id=user_id, projection=projection
         )
 
-        vote: str = result["has_voted"]["vote"] if result else ""
+        vote: str = result["has_voted"]["vote"] if result and "has_voted" in result else ""
         return vote
 
     async def vote_update(self, id: str, user_id: int, vote: str):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        projection: dict = {"_id": 0, "poll_id": 1, "has_voted": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        del_vote: str = await self.repository.update_vote(id=id, user_id=user_id, vote=vote)
 
-        if (result is None) or (not result["has_voted"]):
+        if del_vote is None:
             message: str = "The user has not voted in this poll."
             raise ValidationError(detail={"message": message})
 
-        del_vote: str = result["has_voted"]["vote"]
+        await self.results_service.invalidate(id=id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_voted")
 
-        object_id: ObjectId = await self.repository.update_vote(
-            id=id, user_id=user_id, vote=vote, del_vote=del_vote
-        )
-
-        return object_id
+        return ObjectId(id)
 
     async def vote_delete(self, id: str, user_id: int):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        projection: dict = {"_id": 0, "poll_id": 1, "has_voted": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        del_vote: str = await self.repository.delete_vote(id=id, user_id=user_id)
 
-        if (result is None) or (not result["has_voted"]):
+        if del_vote is None:
             message: str = "The user has not voted in this poll."
             raise ValidationError(detail={"message": message})
 
-        del_vote: str = result["has_voted"]["vote"]
+        await self.results_service.invalidate(id=id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_voted", added=False)
 
-        object_id: ObjectId = await self.repository.delete_vote(
-            id=id, user_id=user_id, del_vote=del_vote
-        )
-
-        return object_id
+        return ObjectId(id)
 
     async def share(self, id: str, user_id: int):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
-
-        projection: dict = {"_id": 0, "poll_id": 1, "has_shared": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        if result is None:
-            # Create a user actions document if it doesn't exist.
-            await self.repository.create(id=id, user_id=user_id)
+        object_id: ObjectId = await self.repository.share(id=id, user_id=user_id)
 
-        elif "has_shared" in result:
+        if object_id is None:
             message: str = "The user has already shared in this poll."
             raise ValidationError(detail={"message": message})
 
-        object_id: ObjectId = await self.repository.share(id=id, user_id=user_id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_shared")
+
         return object_id
 
     async def unshare(self, id: str, user_id: int):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        projection: dict = {"_id": 0, "poll_id": 1, "has_shared": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        object_id: ObjectId = await self.repository.unshare(id=id, user_id=user_id)
 
-        if (result is None) or (not result["has_shared"]):
+        if object_id is None:
             message: str = "The user has not shared in this poll."
             raise ValidationError(detail={"message": message})
 
-        object_id: ObjectId = await self.repository.unshare(id=id, user_id=user_id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_shared", added=False)
+
         return object_id
 
     async def bookmark(self, id: str, user_id: int):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
-
-        projection: dict = {"_id": 0, "poll_id": 1, "has_bookmarked": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        if result is None:
-            # Create a user actions document if it doesn't exist.
-            await self.repository.create(id=id, user_id=user_id)
+        object_id: ObjectId = await self.repository.bookmark(id=id, user_id=user_id)
 
-        elif "has_bookmarked" in result:
+        if object_id is None:
             message: str = "The user has already bookmarked this poll."
             raise ValidationError(detail={"message": message})
 
-        object_id: ObjectId = await self.repository.bookmark(id=id, user_id=user_id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_bookmarked")
+
         return object_id
 
     async def unbookmark(self, id: str, user_id: int):
-        await self.utils.validate_id(id=id)
-        poll: BSON = await self.poll_repository.get_by_id(id=id)
-        await self.utils.check_poll_privacy(user_id=user_id, poll=poll)
+        poll: BSON = await self.check_poll(id=id, user_id=user_id)
 
-        projection: dict = {"_id": 0, "poll_id": 1, "has_bookmarked": 1}
-        result: BSON = await self.repository.get_user_actions(
-            id=ObjectId(id), user_id=user_id, projection=projection
-        )
+        object_id: ObjectId = await self.repository.unbookmark(id=id, user_id=user_id)
 
-        if (result is None) or (not result["has_bookmarked"]):
+        if object_id is None:
             message: str = "The user has not bookmarked in this poll."
             raise ValidationError(detail={"message": message})
 
-        object_id: ObjectId = await self.repository.unbookmark(id=id, user_id=user_id)
+        await self.record_activity(poll=poll, user_id=user_id, action="has_bookmarked", added=False)
+
         return object_id
@@ -1,9 +1,12 @@
 from django.urls import path
 
 from .views.poll_view import PollAPIView
+from .views.poll_batch_view import PollBatchAPIView
 
 from .views.poll_option_view import PollOptionAPIView
 from .views.poll_vote_view import PollVoteAPIView
+from .views.poll_results_view import PollResultsAPIView
+from .views.poll_results_stream_view import PollResultsStreamAPIView
 from .views.poll_share_view import PollShareAPIView
 from .views.poll_bookmark_view import PollBookmarkAPIView
 from .views.poll_comment_view import PollCommentAPIView
@@ -20,6 +23,7 @@ from .views.poll_list_by_category_view import PollListByCategoryAPIView
 from .views.categories_view import CategoriesAPIView
 from .views.poll_list_by_keyword_view import PollListByKeywordAPIView
 from .views.poll_list_all_view import PollListAllAPIView
+from .views.poll_export_view import PollExportAPIView
 
 urlpatterns = [
     # CRUD Poll.
@@ -33,6 +37,11 @@ urlpatterns = [
         view=PollAPIView.as_view(),
         name="poll",
     ),
+    path(
+        route="polls/batch",
+        view=PollBatchAPIView.as_view(),
+        name="polls_batch",
+    ),
     # Option manager.
     path(
         route="poll/<str:id>/option",
@@ -45,6 +54,17 @@ urlpatterns = [
         view=PollVoteAPIView.as_view(),
         name="poll_vote",
     ),
+    # Results.
+    path(
+        route="poll/<str:id>/results",
+        view=PollResultsAPIView.as_view(),
+        name="poll_results",
+    ),
+    path(
+        route="poll/<str:id>/results/stream",
+        view=PollResultsStreamAPIView.as_view(),
+        name="poll_results_stream",
+    ),
     # Share manager.
     path(
         route="poll/<str:id>/share",
@@ -118,4 +138,10 @@ urlpatterns = [
         view=PollListAllAPIView.as_view(),
         name="polls_all",
     ),
+    # Export.
+    path(
+        route="export/<str:collection>",
+        view=PollExportAPIView.as_view(),
+        name="export",
+    ),
 ]
@@ -0,0 +1,233 @@
+import time
+
+from bson.objectid import ObjectId
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.database import Database
+
+
+# Indexes required by the hot queries, by collection.
+# Keys follow the equality, sort, range order of the queries they serve.
+INDEXES: dict[str, list[IndexModel]] = {
+    "polls": [
+        # PollListRepository.get_all.
+        IndexModel(
+            [("privacy", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="privacy_1_created_at_-1__id_-1",
+            background=True,
+        ),
+        # PollListRepository.get_by_category.
+        IndexModel(
+            [
+                ("category", ASCENDING),
+                ("privacy", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ],
+            name="category_1_privacy_1_created_at_-1__id_-1",
+            background=True,
+        ),
+        # PollListRepository.get_by_user_id.
+        IndexModel(
+            [
+                ("user_id", ASCENDING),
+                ("privacy", ASCENDING),
+                ("created_at", DESCENDING),
+                ("_id", DESCENDING),
+            ],
+            name="user_id_1_privacy_1_created_at_-1__id_-1",
+            background=True,
+        ),
+        # PollSearchRepository.search, text tier.
+        IndexModel(
+            [("title", "text"), ("description", "text"), ("category", "text")],
+            name="title_text_description_text_category_text",
+            background=True,
+        ),
+    ],
+    "comments": [
+        # PollCommentListRepository.get_by_poll_id.
+        IndexModel(
+            [("poll_id", ASCENDING), ("created_at", DESCENDING)],
+            name="poll_id_1_created_at_-1",
+            background=True,
+        ),
+    ],
+    "user_actions": [
+        # UserActionsRepository, one document per user and poll.
+        IndexModel(
+            [("poll_id", ASCENDING), ("user_id", ASCENDING)],
+            name="poll_id_1_user_id_1",
+            unique=True,
+            background=True,
+        ),
+    ],
+    "user_activity": [
+        # UserActivityRepository.add, one entry per user, action and poll.
+        IndexModel(
+            [("user_id", ASCENDING), ("action", ASCENDING), ("poll_id", ASCENDING)],
+            name="user_id_1_action_1_poll_id_1",
+            unique=True,
+            background=True,
+        ),
+        # UserActivityRepository.find.
+        IndexModel(
+            [
+                ("user_id", ASCENDING),
+                ("action", ASCENDING),
+                ("at", DESCENDING),
+                ("poll_id", DESCENDING),
+            ],
+            name="user_id_1_action_1_at_-1_poll_id_-1",
+            background=True,
+        ),
+        # UserActivityRepository.update_poll and delete_by_poll.
+        IndexModel([("poll_id", ASCENDING)], name="poll_id_1", background=True),
+    ],
+    "poll_search": [
+        # PollSearchRepository.search, n-gram tier.
+        IndexModel([("grams", ASCENDING)], name="grams_1", background=True),
+    ],
+}
+
+
+# Representative shapes of the hot queries, used to verify the plans with explain().
+# { name: (collection, filter, sort) }
+HOT_QUERIES: dict[str, tuple] = {
+    "polls by privacy": (
+        "polls",
+        {"privacy": "public"},
+        [("created_at", DESCENDING), ("_id", DESCENDING)],
+    ),
+    "polls by category": (
+        "polls",
+        {"category": "", "$or": [{"privacy": "public"}, {"privacy": "private", "user_id": 0}]},
+        [("created_at", DESCENDING), ("_id", DESCENDING)],
+    ),
+    "polls by user": (
+        "polls",
+        {"user_id": 0, "$or": [{"privacy": "public"}, {"privacy": "private", "user_id": 0}]},
+        [("created_at", DESCENDING), ("_id", DESCENDING)],
+    ),
+    "user actions by poll": (
+        "user_actions",
+        {"user_id": 0, "poll_id": ObjectId("0" * 24)},
+        None,
+    ),
+    "user activity": (
+        "user_activity",
+        {
+            "user_id": 0,
+            "action": "has_voted",
+            "$or": [{"poll.privacy": "public"}, {"poll.user_id": 0}],
+        },
+        [("at", DESCENDING), ("poll_id", DESCENDING)],
+    ),
+    "search n-grams": (
+        "poll_search",
+        {
+            "grams": {"$in": ["e:po", "t:pol"]},
+            "$or": [{"privacy": "public"}, {"privacy": "private", "user_id": 0}],
+        },
+        None,
+    ),
+    "comments by poll": (
+        "comments",
+        {"poll_id": ObjectId("0" * 24)},
+        [("created_at", DESCENDING)],
+    ),
+}
+
+
+def get_missing_indexes(db: Database) -> dict[str, list[IndexModel]]:
+    """
+    Returns the declared indexes that do not exist in the database, by collection.
+    """
+    missing: dict = {}
+
+    for collection, indexes in INDEXES.items():
+        existing: dict = db[collection].index_information()
+        absent: list = [i for i in indexes if i.document["name"] not in existing]
+
+        if absent:
+            missing[collection] = absent
+
+    return missing
+
+
+def get_unused_indexes(db: Database) -> dict[str, list[str]]:
+    """
+    Returns the indexes that have not been used since the server started, by collection.
+    """
+    unused: dict = {}
+
+    for collection in INDEXES:
+        stats: list = list(db[collection].aggregate([{"$indexStats": {}}]))
+        names: list = [s["name"] for s in stats if s["name"] != "_id_" and not s["accesses"]["ops"]]
+
+        if names:
+            unused[collection] = names
+
+    return unused
+
+
+def get_query_plans(db: Database) -> dict[str, str]:
+    """
+    Returns the winning plan of each hot query, as the index name or 'COLLSCAN'.
+    """
+    plans: dict = {}
+
+    for name, (collection, filter, sort) in HOT_QUERIES.items():
+        cursor = db[collection].find(filter, limit=1)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        plan: dict = cursor.explain()["queryPlanner"]["winningPlan"]
+        plans[name] = ", ".join(sorted(find_plan_indexes(plan))) or "COLLSCAN"
+
+    return plans
+
+
+def find_plan_indexes(plan: dict) -> set[str]:
+    """
+    Collects the index names used by the stages of a query plan.
+    """
+    names: set = set()
+
+    if "indexName" in plan:
+        names.add(plan["indexName"])
+
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            names |= find_plan_indexes(plan[key])
+
+    for stage in plan.get("inputStages", []):
+        names |= find_plan_indexes(stage)
+
+    return names
+
+
+class IndexCheck:
+    """
+    Cached check of the required indexes, used by the health check.
+
+    A passing result is kept for 'ttl' seconds, a failing one is checked again on every call.
+    """
+
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self.checked_at: float | None = None
+
+    def is_ready(self, db: Database) -> bool:
+        if self.checked_at is not None and time.monotonic() - self.checked_at < self.ttl:
+            return True
+
+        if get_missing_indexes(db=db):
+            self.checked_at = None
+            return False
+
+        self.checked_at = time.monotonic()
+        return True
+
+
+index_check = IndexCheck()
@@ -8,14 +8,8 @@ from .poll_utils import PollUtils
 class PollCommentUtils(PollUtils):
     
 
-    async def simplify_poll_comment_data(self, comment: dict):
+    async def simplify_poll_comment_data(self, comment: BSON):
         """
-        Simplifies poll comment data by converting MongoDB-specific fields.
+        Converts a comment document to the API shape ('id', 'created_at' and 'poll_id' as strings).
         """
-        comment['id'] = comment['_id']['$oid']
-        del comment['_id']
-        comment['created_at'] = comment['created_at']['$date']
-        comment['poll_id'] = comment['poll_id']['$oid']
-        
-
-        return comment
+        return await self.encode(bson=comment)
@@ -13,15 +13,17 @@ class PollUtils(Utils):
     tailored for tasks related to polls. It inherits common utility methods from the 'Utils' class.
     """
 
-    async def simplify_poll_data(self, poll: dict):
+    async def simplify_poll_data(self, poll: BSON):
         """
-        Simplifies poll data by converting MongoDB-specific fields.
+        Converts a poll document to the API shape ('id' and 'created_at' as strings).
         """
-        poll["id"] = poll["_id"]["$oid"]
-        del poll["_id"]
-        poll["created_at"] = poll["created_at"]["$date"]
+        return await self.encode(bson=poll)
 
-        return poll
+    async def simplify_poll_results_data(self, results: BSON):
+        """
+        Converts a results document to the API shape ('id' and 'updated_at' as strings).
+        """
+        return await self.encode(bson=results)
 
     async def check_poll_privacy(
         self, user_id: int, poll: dict | BSON, ownerOnly: bool = False, raise_exception: bool = True
@@ -0,0 +1,35 @@
+# Projection applied to every read of poll documents.
+# Voter membership lives in the 'user_actions' collection, legacy 'voters' arrays are never loaded.
+# The 'version' write counter is internal, only read through 'VERSION_PROJECTION'.
+POLL_PROJECTION = {"voters": 0, "version": 0}
+
+# Projection of the search results, drops the ranking fields, the legacy 'voters' arrays and the
+# 'version' write counter.
+SEARCH_PROJECTION = {"voters": 0, "version": 0, "relevance": 0, "score": 0}
+
+# Projection of the fields indexed by the keyword search, see 'SearchUtils.FIELDS'.
+SEARCH_INDEX_PROJECTION = {
+    "_id": 1,
+    "user_id": 1,
+    "privacy": 1,
+    "created_at": 1,
+    "title": 1,
+    "description": 1,
+    "category": 1,
+}
+
+# Projection for privacy checks, enough for 'PollUtils.check_poll_privacy'.
+PRIVACY_PROJECTION = {"_id": 1, "user_id": 1, "privacy": 1}
+
+# Projection for the validator of the poll detail, privacy fields and write counter.
+VERSION_PROJECTION = {"_id": 1, "user_id": 1, "privacy": 1, "version": 1}
+
+# Projection for the poll summary of the user activity timeline, includes the privacy fields.
+SUMMARY_PROJECTION = {
+    "_id": 1,
+    "user_id": 1,
+    "privacy": 1,
+    "title": 1,
+    "category": 1,
+    "created_at": 1,
+}
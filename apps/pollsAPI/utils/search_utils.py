@@ -0,0 +1,70 @@
+import re
+import unicodedata
+
+from .utils import Utils
+
+
+class SearchUtils(Utils):
+    """
+    Text normalization and n-grams of the poll search.
+
+    Poll texts are indexed as edge n-grams of their words (prefix matching) and trigrams of the
+    padded words (typo tolerance). A query is matched on the edge n-gram of each whole word and
+    on the trigrams of its words, see 'PollSearchRepository'.
+    """
+
+    FIELDS: tuple = ("title", "description", "category")
+
+    MIN_EDGE: int = 2
+    MAX_EDGE: int = 12
+
+    # Bound on the grams of a single poll, long descriptions are truncated.
+    MAX_GRAMS: int = 1024
+
+    def normalize(self, text: str) -> str:
+        """
+        Lowercases a text and strips its accents.
+        """
+        text = unicodedata.normalize("NFKD", text.lower())
+        return "".join(char for char in text if not unicodedata.combining(char))
+
+    def tokenize(self, text: str) -> list[str]:
+        return re.findall(r"\w+", self.normalize(text=text or ""))
+
+    def edge_grams(self, word: str) -> list[str]:
+        sizes: range = range(self.MIN_EDGE, min(len(word), self.MAX_EDGE) + 1)
+        return [f"e:{word[:size]}" for size in sizes]
+
+    def trigrams(self, word: str) -> list[str]:
+        padded: str = f"  {word} "
+        return [f"t:{padded[i:i + 3]}" for i in range(len(padded) - 2)]
+
+    def document_grams(self, poll: dict) -> list[str]:
+        """
+        Builds the n-grams indexed for a poll.
+        """
+        grams: dict = {}
+        for field in self.FIELDS:
+            for word in self.tokenize(text=poll.get(field)):
+                for gram in (*self.edge_grams(word=word), *self.trigrams(word=word)):
+                    grams[gram] = None
+
+                if len(grams) >= self.MAX_GRAMS:
+                    return list(grams)[: self.MAX_GRAMS]
+
+        return list(grams)
+
+    def query_grams(self, keyword: str) -> list[str]:
+        """
+        Builds the n-grams matched for a query, empty when it has no word to match.
+        """
+        grams: dict = {}
+        for word in self.tokenize(text=keyword):
+            if len(word) < self.MIN_EDGE:
+                continue
+
+            grams[f"e:{word[: self.MAX_EDGE]}"] = None
+            for gram in self.trigrams(word=word):
+                grams[gram] = None
+
+        return list(grams)
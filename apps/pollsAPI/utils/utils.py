@@ -1,7 +1,9 @@
-from bson import json_util, BSON
+from bson import BSON
 
 from rest_framework.exceptions import ValidationError, PermissionDenied
 
+from utils.encoders import encode_document, to_extended_json
+
 
 class Utils:
     """
@@ -12,9 +14,15 @@ class Utils:
         """
         Converts a BSON document to a JSON-formatted dictionary.
         """
-        json: dict = json_util._json_convert(bson)
+        json: dict = to_extended_json(bson)
         return json
 
+    async def encode(self, bson: BSON) -> dict:
+        """
+        Converts a BSON document to the API shape in a single pass, see 'encode_document'.
+        """
+        return encode_document(bson)
+
     async def validate_id(self, id: str, raise_exception: bool = True):
         """
         Validates the format of a poll ID.
@@ -0,0 +1,71 @@
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework.authentication import SessionAuthentication
+
+from adrf.views import APIView
+
+from apps.pollsAPI.services.poll_service import PollService
+
+
+class PollBatchAPIView(APIView):
+    """
+    API view for retrieving several polls at once.
+
+    This view returns the details of up to 50 polls in one request, with the same content
+    as GET /poll/{id} for each of them, fetched with a single query.
+
+    Endpoint:
+    - POST /polls/batch: Retrieve the details of several polls.
+
+    Authentication:
+    - SessionAuthentication: Optional, user actions are included for authenticated users.
+
+    Permissions:
+    - AllowAny: Accessible to any user. Private polls are only visible to their owner.
+
+    Request Format:
+    - POST: Send a JSON object with the list of poll IDs.
+
+    Response:
+    - items: The polls keyed by ID, as { "poll": {...}, "authenticated_user_actions": {...} }.
+    - not_found: The IDs of the polls that do not exist.
+    - not_authorized: The IDs of the private polls of other users.
+
+    Example Usage:
+    ```
+    # Retrieve two polls
+    POST /polls/batch
+    headers: { "X-CSRFToken": csrftoken }
+    body: {
+        "ids": ["6123456789abcdef01234567", "6123456789abcdef01234568"]
+    }
+    ```
+    """
+
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [AllowAny]
+
+    service = PollService()
+
+    async def post(self, request, *args, **kwargs):
+        """
+        Retrieve the details of several polls.
+
+        Args:
+            request: The HTTP request object.
+
+        Returns:
+            Response: A response containing the polls keyed by ID.
+        """
+        user_id: int = request.user.id
+        ids: list | None = request.data.get("ids") if isinstance(request.data, dict) else None
+
+        try:
+            data: dict = await self.service.get_many(ids=ids, user_id=user_id)
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(data=data, status=status.HTTP_200_OK)
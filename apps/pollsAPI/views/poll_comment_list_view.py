@@ -1,10 +1,9 @@
-from rest_framework import status
-from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_comment_list_service import PollCommentListService
+from utils.http_cache import conditional_response
 
 
 class PollCommentListAPIVIew(APIView):
@@ -25,6 +24,8 @@ class PollCommentListAPIVIew(APIView):
     Query Parameters:
     - page (int): The page number for paginated results (default is 1).
     - page_size (int): The number of comments to include per page (default is 4).
+    - count (str): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals from the comments counter of the poll).
 
     Usage:
     - To retrieve a list of comments for a poll, send a GET request to /poll/{id}/comments/.
@@ -60,10 +61,11 @@ class PollCommentListAPIVIew(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
         data: dict = await self.service.get_by_poll_id(
-            poll_id=id, page=page, page_size=page_size, user_id=user_id
+            poll_id=id, page=page, page_size=page_size, user_id=user_id, count=count
         )
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
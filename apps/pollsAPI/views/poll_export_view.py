@@ -0,0 +1,75 @@
+from django.http import StreamingHttpResponse
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from adrf.views import APIView
+
+from apps.pollsAPI.services.export_service import ExportService
+
+
+class PollExportAPIView(APIView):
+    """
+    API view for exporting polls, user actions (votes, shares, bookmarks) and comments.
+
+    The collection is streamed as NDJSON, one MongoDB Extended JSON document per line sorted by
+    '_id', without loading it in memory. Private polls of other users, and the user actions
+    and comments on them, are left out.
+
+    Endpoint:
+    - GET /export/{collection}: Stream a collection, 'polls', 'user_actions' or 'comments'.
+
+    Permissions:
+    - IsAdminUser: Only accessible to staff users.
+
+    Query Parameters:
+    - after (str): Resume the export after the document with this ID, the last '_id' received.
+    - gzip (str): 'true' to gzip compress the output.
+
+    Example Usage:
+    ```
+    # Export all polls
+    GET /export/polls
+
+    # Resume a gzip compressed export of the comments
+    GET /export/comments?after=6123456789abcdef01234567&gzip=true
+    ```
+    """
+
+    permission_classes = [IsAdminUser]
+
+    service = ExportService()
+
+    async def get(self, request, collection: str, *args, **kwargs):
+        """
+        Stream a collection as NDJSON.
+
+        Args:
+            request: The HTTP request object.
+            collection (str): The collection to export.
+
+        Returns:
+            StreamingHttpResponse: The NDJSON output, optionally gzip compressed.
+        """
+        user_id: int = request.user.id
+        after: str | None = request.GET.get("after")
+        gzip: bool = request.GET.get("gzip") == "true"
+
+        try:
+            self.service.validate(collection=collection, after=after)
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        stream = self.service.stream(collection=collection, user_id=user_id, after=after, gzip=gzip)
+        filename: str = f"{collection}.ndjson.gz" if gzip else f"{collection}.ndjson"
+
+        response = StreamingHttpResponse(
+            streaming_content=stream,
+            content_type="application/gzip" if gzip else "application/x-ndjson",
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+        return response
@@ -1,9 +1,11 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_list_service import PollListService
+from utils.http_cache import conditional_response
 
 
 class PollListAllAPIView(APIView):
@@ -18,6 +20,10 @@ class PollListAllAPIView(APIView):
     Query Parameters:
     - page (optional): The page number for paginated results (default is 1).
     - page_size (optional): The number of polls to include per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Permissions:
     - AllowAny: No authentication is required; the endpoint is accessible by anyone.
@@ -36,6 +42,10 @@ class PollListAllAPIView(APIView):
 
     # Retrieve the second page of all polls with 10 polls per page
     GET /polls/all?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/all?cursor=
+    GET /polls/all?cursor=<next_cursor>
     ```
 
     Note: This endpoint provides public access to all polls and supports pagination.
@@ -57,8 +67,16 @@ class PollListAllAPIView(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_all(page=page, page_size=page_size, user_id=user_id)
+        try:
+            data: dict = await self.service.get_all(
+                page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
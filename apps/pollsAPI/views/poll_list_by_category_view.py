@@ -1,9 +1,11 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_list_service import PollListService
+from utils.http_cache import conditional_response
 
 
 class PollListByCategoryAPIView(APIView):
@@ -25,6 +27,10 @@ class PollListByCategoryAPIView(APIView):
     Query Parameters:
     - page (int): The page number for pagination (default is 1).
     - page_size (int): The number of items per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Usage:
     - To retrieve a list of polls based on a category, send a GET request to /polls/category/{category}/.
@@ -38,6 +44,10 @@ class PollListByCategoryAPIView(APIView):
 
     # Retrieve polls with custom pagination settings (page=2, page_size=10)
     GET /polls/category/technology/?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/category/technology?cursor=
+    GET /polls/category/technology?cursor=<next_cursor>
     ```
 
     Note: The 'category' parameter in the URL represents the category used to filter polls.
@@ -61,10 +71,16 @@ class PollListByCategoryAPIView(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_by_category(
-            category=category, page=page, page_size=page_size, user_id=user_id
-        )
+        try:
+            data: dict = await self.service.get_by_category(
+                category=category, page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
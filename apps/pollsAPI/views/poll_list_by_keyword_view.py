@@ -5,6 +5,7 @@ from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_list_service import PollListService
+from utils.http_cache import conditional_response
 
 
 class PollListByKeywordAPIView(APIView):
@@ -40,6 +41,8 @@ class PollListByKeywordAPIView(APIView):
     ```
 
     Note: The 'query' parameter in the URL represents the keyword used to filter polls.
+    Results are ranked by relevance, popularity and recency. When no poll contains the words of the
+    query, polls are matched on word prefixes and close spellings instead.
     """
 
     permission_classes = [AllowAny]
@@ -66,11 +69,11 @@ class PollListByKeywordAPIView(APIView):
                 message: str = "Keyword is not provided"
                 raise ValidationError({"message": message})
 
+            data: dict = await self.service.get_by_keyword(
+                keyword=keyword, page=page, page_size=page_size, user_id=user_id
+            )
+
         except ValidationError as error:
             return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        data: dict = await self.service.get_by_keyword(
-            keyword=keyword, page=page, page_size=page_size, user_id=user_id
-        )
-
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
@@ -1,9 +1,11 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_list_service import PollListService
+from utils.http_cache import conditional_response
 
 
 class PollListByUserIdAPIView(APIView):
@@ -22,6 +24,10 @@ class PollListByUserIdAPIView(APIView):
     Query Parameters:
     - page (int): The page number for pagination (default is 1).
     - page_size (int): The number of items per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Usage:
     - To retrieve a list of polls created by a user, send a GET request to /polls/user/{id}.
@@ -34,6 +40,10 @@ class PollListByUserIdAPIView(APIView):
 
     # Retrieve polls with custom pagination settings (page=2, page_size=10)
     GET /polls/user/123?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/user/123?cursor=
+    GET /polls/user/123?cursor=<next_cursor>
     ```
 
     Note: The 'id' in the URL represents the ID of the user whose polls are being retrieved.
@@ -56,13 +66,19 @@ class PollListByUserIdAPIView(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_by_user_id(
-            id=id, page=page, page_size=page_size, user_id=user_id
-        )
+        try:
+            data: dict = await self.service.get_by_user_id(
+                id=id, page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
 
 
 class PollListByUserVotesAPIView(APIView):
@@ -81,6 +97,10 @@ class PollListByUserVotesAPIView(APIView):
     Query Parameters:
     - page (int): The page number for pagination (default is 1).
     - page_size (int): The number of items per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Usage:
     - To retrieve a list of polls voted on by a user, send a GET request to /polls/user/{id}/votes.
@@ -93,6 +113,10 @@ class PollListByUserVotesAPIView(APIView):
 
     # Retrieve polls with custom pagination settings (page=2, page_size=10)
     GET /polls/user/123/votes?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/user/123/votes?cursor=
+    GET /polls/user/123/votes?cursor=<next_cursor>
     ```
 
     Note: The 'id' in the URL represents the ID of the user whose voted polls are being retrieved.
@@ -116,13 +140,19 @@ class PollListByUserVotesAPIView(APIView):
 
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_by_user_votes(
-            id=id, page=page, page_size=page_size, user_id=user_id
-        )
+        try:
+            data: dict = await self.service.get_by_user_votes(
+                id=id, page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
 
 
 class PollListByUserSharesAPIView(APIView):
@@ -141,6 +171,10 @@ class PollListByUserSharesAPIView(APIView):
     Query Parameters:
     - page (int): The page number for pagination (default is 1).
     - page_size (int): The number of items per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Usage:
     - To retrieve a list of polls shared by a user, send a GET request to /polls/user/{id}/shares.
@@ -153,6 +187,10 @@ class PollListByUserSharesAPIView(APIView):
 
     # Retrieve polls with custom pagination settings (page=2, page_size=10)
     GET /polls/user/123/shares?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/user/123/shares?cursor=
+    GET /polls/user/123/shares?cursor=<next_cursor>
     ```
 
     Note: The 'id' in the URL represents the ID of the user whose shared polls are being retrieved.
@@ -175,13 +213,19 @@ class PollListByUserSharesAPIView(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_by_user_shares(
-            id=id, page=page, page_size=page_size, user_id=user_id
-        )
+        try:
+            data: dict = await self.service.get_by_user_shares(
+                id=id, page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
 
 
 class PollListByUserBookmarksAPIView(APIView):
@@ -200,6 +244,10 @@ class PollListByUserBookmarksAPIView(APIView):
     Query Parameters:
     - page (int): The page number for pagination (default is 1).
     - page_size (int): The number of items per page (default is 4).
+    - cursor (optional): Switches to cursor pagination. Empty for the first page, then the
+      'next_cursor' of the previous response. When provided, 'page' is ignored.
+    - count (optional): How totals are computed, 'exact' (default), 'none' (no totals, only
+      'has_next') or 'cached' (totals refreshed in the background, None until counted).
 
     Usage:
     - To retrieve a list of polls bookmarked by a user, send a GET request to /polls/user/{id}/bookmarks.
@@ -212,6 +260,10 @@ class PollListByUserBookmarksAPIView(APIView):
 
     # Retrieve polls with custom pagination settings (page=2, page_size=10)
     GET /polls/user/123/bookmarks?page=2&page_size=10
+
+    # Retrieve polls with cursor pagination (first page, then the returned 'next_cursor')
+    GET /polls/user/123/bookmarks?cursor=
+    GET /polls/user/123/bookmarks?cursor=<next_cursor>
     ```
 
     Note: The 'id' in the URL represents the ID of the user whose bookmarked polls are being retrieved.
@@ -234,10 +286,16 @@ class PollListByUserBookmarksAPIView(APIView):
         """
         page: int = int(request.GET.get("page", "1"))
         page_size: int = int(request.GET.get("page_size", "4"))
+        cursor: str | None = request.GET.get("cursor")
+        count: str = request.GET.get("count", "exact")
         user_id: int = request.user.id
 
-        data: dict = await self.service.get_by_user_bookmarks(
-            id=id, page=page, page_size=page_size, user_id=user_id
-        )
+        try:
+            data: dict = await self.service.get_by_user_bookmarks(
+                id=id, page=page, page_size=page_size, user_id=user_id, cursor=cursor, count=count
+            )
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(data=data, status=status.HTTP_200_OK)
+        return conditional_response(request=request, data=data)
@@ -0,0 +1,81 @@
+from django.http import StreamingHttpResponse
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from adrf.views import APIView
+
+from apps.pollsAPI.services.poll_results_service import PollResultsService
+from apps.pollsAPI.services.poll_results_stream_service import poll_results_stream_service
+
+
+class PollResultsStreamAPIView(APIView):
+    """
+    API view for following the results of a poll live, as server-sent events.
+
+    The current results are sent first, then a 'results' event each time the vote tallies
+    change, at most once per second (settings.RESULTS_STREAM). Every client watching a poll
+    in the same process shares one upstream read of its results.
+
+    Endpoint:
+    - GET /poll/{id}/results/stream: Stream the vote counts of each option of a poll.
+
+    Permissions:
+    - AllowAny: Accessible to any user. Private polls are only visible to their owner.
+
+    Path Parameters:
+    - id (str): The unique identifier of the poll.
+
+    Events:
+    - results: The results, same shape as GET /poll/{id}/results.
+    - deleted: The poll has been deleted, the stream ends.
+
+    Example Usage:
+    ```
+    const source = new EventSource("/poll/6123456789abcdef01234567/results/stream");
+    source.addEventListener("results", (event) => render(JSON.parse(event.data)));
+    ```
+
+    Note: The stream is closed after a few minutes, EventSource reconnects on its own.
+    """
+
+    permission_classes = [AllowAny]
+
+    service = PollResultsService()
+    stream_service = poll_results_stream_service
+
+    async def get(self, request, id: str, *args, **kwargs):
+        """
+        Stream the results of a poll.
+
+        Args:
+            request: The HTTP request object.
+            id (str): The unique identifier of the poll.
+
+        Returns:
+            StreamingHttpResponse: The results as server-sent events.
+        """
+        user_id: int = request.user.id
+
+        try:
+            results: dict = await self.service.get_by_poll_id(id=id, user_id=user_id)
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        except PermissionDenied as error:
+            return Response(data=error.detail, status=status.HTTP_403_FORBIDDEN)
+
+        except NotFound as error:
+            return Response(data=error.detail, status=status.HTTP_404_NOT_FOUND)
+
+        stream = self.stream_service.stream(id=id, results=results, user_id=user_id)
+
+        response = StreamingHttpResponse(streaming_content=stream, content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Disables response buffering in nginx.
+        response["X-Accel-Buffering"] = "no"
+
+        return response
@@ -0,0 +1,65 @@
+from rest_framework import status
+from rest_framework.exceptions import ValidationError, PermissionDenied, NotFound
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from adrf.views import APIView
+
+from apps.pollsAPI.services.poll_results_service import PollResultsService
+
+
+class PollResultsAPIView(APIView):
+    """
+    API view for retrieving the results of a poll.
+
+    This view returns only the vote tallies of a poll, read from its results document,
+    without loading the full poll, the owner profile or the user actions.
+
+    Endpoint:
+    - GET /poll/{id}/results: Retrieve the vote counts of each option of a poll.
+
+    Permissions:
+    - AllowAny: Accessible to any user. Private polls are only visible to their owner.
+
+    Path Parameters:
+    - id (str): The unique identifier of the poll.
+
+    Example Usage:
+    ```
+    # Retrieve the results of a poll with ID '6123456789abcdef01234567'
+    GET /poll/6123456789abcdef01234567/results
+    ```
+
+    Note: The 'id' parameter in the URL represents the unique identifier of the poll.
+    """
+
+    permission_classes = [AllowAny]
+
+    service = PollResultsService()
+
+    async def get(self, request, id: str, *args, **kwargs):
+        """
+        Retrieve the results of a poll.
+
+        Args:
+            request: The HTTP request object.
+            id (str): The unique identifier of the poll.
+
+        Returns:
+            Response: A response containing the vote counts of the poll.
+        """
+        user_id: int = request.user.id
+
+        try:
+            results: dict = await self.service.get_by_poll_id(id=id, user_id=user_id)
+
+        except ValidationError as error:
+            return Response(data=error.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        except PermissionDenied as error:
+            return Response(data=error.detail, status=status.HTTP_403_FORBIDDEN)
+
+        except NotFound as error:
+            return Response(data=error.detail, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(data={"results": results}, status=status.HTTP_200_OK)
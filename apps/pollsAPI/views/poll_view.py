@@ -9,6 +9,7 @@ from rest_framework.authentication import SessionAuthentication
 from adrf.views import APIView
 
 from apps.pollsAPI.services.poll_service import PollService
+from utils.http_cache import etag_matches, not_modified, set_etag
 
 
 class PollAPIView(APIView):
@@ -114,6 +115,9 @@ class PollAPIView(APIView):
         """
         Retrieve details of a specific poll.
 
+        Responses carry an 'ETag' derived from the poll and user actions versions. A request
+        with a matching 'If-None-Match' header gets a 304 without the poll being loaded.
+
         Args:
             request: The HTTP request object.
             id (str): The unique identifier of the poll to be retrieved.
@@ -123,6 +127,10 @@ class PollAPIView(APIView):
         """
         user_id: int = request.user.id
 
+        etag: str | None = await self.service.get_etag(id=id, user_id=user_id)
+        if etag and etag_matches(request=request, etag=etag):
+            return not_modified(etag=etag)
+
         try:
             poll, user_actions = await self.service.get_by_id(id=id, user_id=user_id)
 
@@ -135,11 +143,13 @@ class PollAPIView(APIView):
         except NotFound as error:
             return Response(data=error.detail, status=status.HTTP_404_NOT_FOUND)
 
-        return Response(
+        response = Response(
             data={"poll": poll, "authenticated_user_actions": user_actions},
             status=status.HTTP_200_OK,
         )
 
+        return set_etag(response=response, etag=etag) if etag else response
+
     async def patch(self, request, id: str, *args, **kwargs):
         """
         Update details of a specific poll.
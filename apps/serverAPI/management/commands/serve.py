@@ -0,0 +1,64 @@
+import importlib.util
+
+import uvicorn
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Serves the API with uvicorn, configured from settings.ASGI_SERVER.
+
+    Each worker is a process with its own event loop, uvloop and httptools are used when
+    installed. On SIGTERM or SIGINT workers stop accepting connections, finish in-flight
+    requests (up to 'TIMEOUT_GRACEFUL_SHUTDOWN' seconds) and run the lifespan shutdown
+    handlers, which flush the vote counters buffer and close the MongoDB clients.
+
+    Usage:
+    python manage.py serve
+    python manage.py serve --workers 4 --port 8080
+    """
+
+    help = "Serves the API over ASGI with uvicorn."
+
+    def add_arguments(self, parser):
+        config: dict = settings.ASGI_SERVER
+
+        parser.add_argument("--host", default=config["HOST"])
+        parser.add_argument("--port", type=int, default=config["PORT"])
+        parser.add_argument("--workers", type=int, default=config["WORKERS"])
+
+    def handle(self, *args, **options):
+        config: dict = settings.ASGI_SERVER
+
+        loop: str = config["LOOP"]
+        if loop == "auto":
+            loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+        http: str = config["HTTP"]
+        if http == "auto":
+            http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+        module, attribute = settings.ASGI_APPLICATION.rsplit(".", 1)
+
+        self.stdout.write(
+            f"Serving {settings.ASGI_APPLICATION} on {options['host']}:{options['port']} "
+            f"with {options['workers']} workers (loop: {loop}, http: {http})."
+        )
+
+        uvicorn.run(
+            f"{module}:{attribute}",
+            host=options["host"],
+            port=options["port"],
+            workers=options["workers"],
+            loop=loop,
+            http=http,
+            lifespan="on",
+            backlog=config["BACKLOG"],
+            limit_concurrency=config["LIMIT_CONCURRENCY"],
+            timeout_keep_alive=config["TIMEOUT_KEEP_ALIVE"],
+            timeout_graceful_shutdown=config["TIMEOUT_GRACEFUL_SHUTDOWN"],
+            proxy_headers=True,
+            forwarded_allow_ips=config["FORWARDED_ALLOW_IPS"],
+        )
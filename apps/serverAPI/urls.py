@@ -1,6 +1,8 @@
 from django.urls import path
 
 from .views.health_check_view import HealthCheckAPIView
+from .views.cache_stats_view import CacheStatsAPIView
+from .views.mongo_pool_stats_view import MongoPoolStatsAPIView
 
 
 urlpatterns = [
@@ -9,4 +11,14 @@ urlpatterns = [
         view=HealthCheckAPIView.as_view(),
         name="health_check",
     ),
+    path(
+        route="cache/stats",
+        view=CacheStatsAPIView.as_view(),
+        name="cache_stats",
+    ),
+    path(
+        route="mongo/pool/stats",
+        view=MongoPoolStatsAPIView.as_view(),
+        name="mongo_pool_stats",
+    ),
 ]
@@ -0,0 +1,27 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.authentication import SessionAuthentication
+
+from utils.cache import get_stats
+
+
+class CacheStatsAPIView(APIView):
+    """
+    API view for retrieving the counters of the in-process cache regions.
+
+    Endpoint:
+    - GET /cache/stats: Retrieve size, hits, misses and evictions of each cache region.
+
+    Permissions:
+    - IsAdminUser: Only accessible to staff users.
+
+    Note: The counters are per process, since the local tier lives in each worker.
+    """
+
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(data=get_stats(), status=status.HTTP_200_OK)
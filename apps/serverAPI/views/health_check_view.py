@@ -1,8 +1,37 @@
+from pymongo.errors import PyMongoError
+
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from utils.mongo import get_probe_database
+
+from apps.pollsAPI.utils.indexes import index_check
+
 
 class HealthCheckAPIView(APIView):
+    """
+    API view for the health check of the server.
+
+    Responds with a 503 status when the indexes required by the hot queries are missing,
+    run 'python manage.py ensure_mongo_indexes' to create them, and when MongoDB cannot be
+    reached within MONGO_HEALTH_CHECK_TIMEOUT_MS. A passing index check is cached for a few
+    minutes.
+    """
+
     def get(self, request, *args, **kwargs):
+        polls_db = get_probe_database()
+
+        try:
+            ready: bool = index_check.is_ready(db=polls_db)
+
+        except PyMongoError:
+            ready = False
+
+        if not ready:
+            message: str = "Required MongoDB indexes are missing."
+            return Response(
+                data={"message": message}, status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
         return Response(status=status.HTTP_200_OK)
@@ -0,0 +1,27 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+from rest_framework.authentication import SessionAuthentication
+
+from utils.mongo import pool_stats
+
+
+class MongoPoolStatsAPIView(APIView):
+    """
+    API view for retrieving the MongoDB connection pool counters.
+
+    Endpoint:
+    - GET /mongo/pool/stats: Retrieve created, closed, in use and failed checkouts per server.
+
+    Permissions:
+    - IsAdminUser: Only accessible to staff users.
+
+    Note: The counters are per process, each worker has its own pools.
+    """
+
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(data=pool_stats.stats(), status=status.HTTP_200_OK)
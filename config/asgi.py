@@ -2,6 +2,7 @@
 ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with ``python manage.py serve``, see settings.ASGI_SERVER.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
@@ -11,6 +12,15 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from utils.lifespan import LifespanMiddleware, on_shutdown
+from utils.mongo import close_clients
+
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+# Registered before Django sets up so it runs after the other shutdown handlers,
+# which may still write to MongoDB.
+on_shutdown(close_clients)
+
+django_application = get_asgi_application()
+
+application = LifespanMiddleware(django_application)
@@ -89,6 +89,9 @@ TEMPLATES = [
     },
 ]
 
+# The API is served over ASGI ('python manage.py serve'), the poll views are async.
+# WSGI is kept for tooling, async views run through async_to_sync adapters there.
+ASGI_APPLICATION = "config.asgi.application"
 WSGI_APPLICATION = "config.wsgi.application"
 
 
@@ -149,6 +152,147 @@ if not DEBUG:
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
+# Cache settings.
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "votingapp"),
+    },
+}
+
+# In-process LRU regions (utils.cache), optionally backed by a CACHES alias shared across processes.
+CACHE_REGIONS = {
+    "owners": {
+        "MAXSIZE": int(os.getenv("OWNERS_CACHE_MAXSIZE", "4096")),
+        "TTL": int(os.getenv("OWNERS_CACHE_TTL", "300")),
+        "SHARED_ALIAS": os.getenv("OWNERS_CACHE_SHARED_ALIAS") or None,
+        # Renames reach every worker: at once through versions kept in the shared tier, or
+        # without a shared tier, within LOCAL_TTL seconds when several workers run.
+        "VERSIONED": True,
+        "LOCAL_TTL": int(os.getenv("OWNERS_CACHE_LOCAL_TTL", "5")),
+    },
+    "poll_results": {
+        "MAXSIZE": int(os.getenv("POLL_RESULTS_CACHE_MAXSIZE", "2048")),
+        "TTL": int(os.getenv("POLL_RESULTS_CACHE_TTL", "2")),
+        "SHARED_ALIAS": os.getenv("POLL_RESULTS_CACHE_SHARED_ALIAS") or None,
+    },
+    "counts": {
+        "MAXSIZE": int(os.getenv("COUNTS_CACHE_MAXSIZE", "4096")),
+        "TTL": int(os.getenv("COUNTS_CACHE_TTL", "3600")),
+        "SHARED_ALIAS": os.getenv("COUNTS_CACHE_SHARED_ALIAS") or None,
+    },
+    "front_page": {
+        "MAXSIZE": 1,
+        "TTL": int(os.getenv("FRONT_PAGE_CACHE_TTL", "30")),
+        "SHARED_ALIAS": os.getenv("FRONT_PAGE_CACHE_SHARED_ALIAS") or None,
+    },
+}
+
+# Cached totals of the 'count=cached' pagination mode (utils.pagination), counted again
+# in the background once older than COUNT_REFRESH_SECONDS.
+
+PAGINATION = {
+    "COUNT_REFRESH_SECONDS": int(os.getenv("PAGINATION_COUNT_REFRESH_SECONDS", "60")),
+}
+
+# Keyword search (apps/pollsAPI/repositories/poll_search_repository.py).
+# Only the CANDIDATES most relevant polls of a query are ranked and paginated.
+
+SEARCH = {
+    "CANDIDATES": int(os.getenv("SEARCH_CANDIDATES", "500")),
+    # 'mongo', or 'memory' for the in-process index of the public polls built at startup
+    # (apps/pollsAPI/services/search_index_service.py), Mongo answers while it builds.
+    "BACKEND": os.getenv("SEARCH_BACKEND", "mongo"),
+}
+
+# Front page feed (apps/pollsAPI/services/front_page_service.py).
+# The newest SIZE public polls of '/polls/all' are served from the 'front_page' cache region.
+
+FRONT_PAGE = {
+    "SIZE": int(os.getenv("FRONT_PAGE_SIZE", "96")),
+}
+
+
+# MongoDB client settings (utils/mongo.py).
+
+MONGO = {
+    "URI": os.getenv("MONGO_URI"),
+    "DATABASE": os.getenv("MONGO_DATABASE", "polls_db"),
+    "MAX_POOL_SIZE": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+    "MIN_POOL_SIZE": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+    "MAX_IDLE_TIME_MS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "0")) or None,
+    "WAIT_QUEUE_TIMEOUT_MS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "0")) or None,
+    "SERVER_SELECTION_TIMEOUT_MS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+    # Connection, selection and socket timeout of the health check client, which fails fast.
+    "HEALTH_CHECK_TIMEOUT_MS": int(os.getenv("MONGO_HEALTH_CHECK_TIMEOUT_MS", "2000")),
+    # Comma separated, e.g. "zstd,snappy,zlib", zstd and snappy need extra packages.
+    "COMPRESSORS": os.getenv("MONGO_COMPRESSORS", ""),
+    "READ_PREFERENCE": os.getenv("MONGO_READ_PREFERENCE", "primary"),
+    "APP_NAME": os.getenv("MONGO_APP_NAME", "votingapp"),
+    # Read preference per repository route ('MongoRepository.read_route'), repositories
+    # without a route (votes, ownership checks, user actions) read from READ_PREFERENCE.
+    # MAX_STALENESS_SECONDS must be at least 90, 0 disables it.
+    "READ_ROUTES": {
+        "feeds": {
+            "MODE": os.getenv("MONGO_FEEDS_READ_PREFERENCE", "secondaryPreferred"),
+            "MAX_STALENESS_SECONDS": int(os.getenv("MONGO_FEEDS_MAX_STALENESS_SECONDS", "90")),
+        },
+    },
+}
+
+
+# ASGI server settings ('python manage.py serve').
+# LOOP and HTTP 'auto' use uvloop and httptools when they are installed.
+
+ASGI_SERVER = {
+    "HOST": os.getenv("SERVER_HOST", "0.0.0.0"),
+    "PORT": int(os.getenv("PORT", "8000")),
+    "WORKERS": int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+    "LOOP": os.getenv("SERVER_LOOP", "auto"),
+    "HTTP": os.getenv("SERVER_HTTP", "auto"),
+    "BACKLOG": int(os.getenv("SERVER_BACKLOG", "2048")),
+    "LIMIT_CONCURRENCY": int(os.getenv("SERVER_LIMIT_CONCURRENCY", "0")) or None,
+    "TIMEOUT_KEEP_ALIVE": int(os.getenv("SERVER_TIMEOUT_KEEP_ALIVE", "5")),
+    "TIMEOUT_GRACEFUL_SHUTDOWN": int(os.getenv("SERVER_TIMEOUT_GRACEFUL_SHUTDOWN", "30")),
+    "FORWARDED_ALLOW_IPS": os.getenv("SERVER_FORWARDED_ALLOW_IPS", "127.0.0.1"),
+}
+
+
+# Write-behind vote counters settings.
+# When enabled, vote counters are coalesced in memory and flushed in bulk every
+# FLUSH_INTERVAL_MS milliseconds or MAX_PENDING votes, and on shutdown.
+
+VOTE_BUFFER = {
+    "ENABLED": os.getenv("VOTE_BUFFER_ENABLED", "False") == "True",
+    "FLUSH_INTERVAL_MS": int(os.getenv("VOTE_BUFFER_FLUSH_INTERVAL_MS", "200")),
+    "MAX_PENDING": int(os.getenv("VOTE_BUFFER_MAX_PENDING", "500")),
+}
+
+
+# Live poll results (apps/pollsAPI/services/poll_results_stream_service.py).
+# Each poll streamed by a process is read at most once per INTERVAL_MS milliseconds,
+# connections are closed after MAX_DURATION_SECONDS and clients reconnect.
+
+RESULTS_STREAM = {
+    "INTERVAL_MS": int(os.getenv("RESULTS_STREAM_INTERVAL_MS", "1000")),
+    "HEARTBEAT_SECONDS": int(os.getenv("RESULTS_STREAM_HEARTBEAT_SECONDS", "15")),
+    "MAX_DURATION_SECONDS": int(os.getenv("RESULTS_STREAM_MAX_DURATION_SECONDS", "300")),
+}
+
+
+# Change stream cache invalidation (utils/change_streams.py), requires a replica set.
+# Every process tails the subscribed collections and invalidates its caches, the resume
+# token is saved under NAME every SAVE_INTERVAL_MS milliseconds.
+
+CHANGE_STREAMS = {
+    "ENABLED": os.getenv("CHANGE_STREAMS_ENABLED", "False") == "True",
+    "NAME": os.getenv("CHANGE_STREAMS_NAME", "default"),
+    "SAVE_INTERVAL_MS": int(os.getenv("CHANGE_STREAMS_SAVE_INTERVAL_MS", "1000")),
+}
+
+
 # Sessions settings.
 
 SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
@@ -185,14 +329,12 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "utils.renderers.APIJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
     "ALLOWED_VERSIONS": ["v1", "v2"],
     "DEFAULT_VERSION": "v1",
 }
 
-
-import atexit
-from mdb_singleton import MongoDBSingleton
-
-# Register connection closure on application exit
-atexit.register(MongoDBSingleton.close_all_connections)
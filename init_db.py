@@ -3,11 +3,13 @@ from dotenv import load_dotenv
 from pymongo import MongoClient
 from pymongo.database import Database
 
+from apps.pollsAPI.utils.indexes import INDEXES
+
 load_dotenv()
 
 MONGO_URI: str = os.getenv("MONGO_URI")
 client: MongoClient = MongoClient(MONGO_URI)
-polls_db: Database = client["polls_db"]
+polls_db: Database = client[os.getenv("MONGO_DATABASE", "polls_db")]
 
 
 def create_collection():
@@ -20,19 +22,24 @@ def create_collection():
     if "user_actions" not in polls_db.list_collection_names():
         polls_db.create_collection(name="user_actions")
 
+    if "poll_results" not in polls_db.list_collection_names():
+        polls_db.create_collection(name="poll_results")
+
+    if "user_activity" not in polls_db.list_collection_names():
+        polls_db.create_collection(name="user_activity")
+
+    if "poll_search" not in polls_db.list_collection_names():
+        polls_db.create_collection(name="poll_search")
 
-def create_index_text():
-    before_indexes = polls_db.polls.index_information()
 
-    clave_text_index = "title_text_description_text_category_text"
-    text_index_exists = clave_text_index in before_indexes
+def create_indexes():
+    # The full index set is declared in 'apps.pollsAPI.utils.indexes',
+    # 'python manage.py ensure_mongo_indexes' also reports the plans of the hot queries.
+    for collection, indexes in INDEXES.items():
+        polls_db[collection].create_indexes(indexes)
 
-    if not text_index_exists:
-        polls_db.polls.create_index(
-            [("title", "text"), ("description", "text"), ("category", "text")]
-        )
-        print("Text index created successfully.")
+    print("Indexes created successfully.")
 
 
 create_collection()
-create_index_text()
+create_indexes()
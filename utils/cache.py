@@ -0,0 +1,356 @@
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheRegion:
+    """
+    Named two-tier cache.
+
+    The local tier is a bounded in-process LRU where every entry expires after 'ttl' seconds.
+    The optional shared tier is a Django cache alias (see CACHES), so entries computed by one
+    process can be reused by the others. Deleting a key clears it from both tiers.
+
+    In a 'versioned' region, deletes are also seen by the local tiers of the other processes:
+    - with a shared tier, deleting a key writes a new version of it there, and local hits are
+      only served while the version they were stored with is still the shared one.
+    - without one, each process only clears its own local tier, so when the server runs several
+      'processes' local entries expire after 'local_ttl' seconds instead of 'ttl'.
+
+    Hit and miss counters are kept per region to size the local tier.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 60,
+        shared_alias: str = None,
+        versioned: bool = False,
+        local_ttl: float = None,
+        processes: int = 1,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.shared_alias = shared_alias
+        self.versioned = versioned
+
+        self.local_ttl = ttl
+        if versioned and not shared_alias and processes > 1 and local_ttl is not None:
+            self.local_ttl = min(ttl, local_ttl)
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    @property
+    def checks_versions(self) -> bool:
+        return self.versioned and self.shared_alias is not None
+
+    def shared_key(self, key) -> str:
+        return f"{self.name}:{key}"
+
+    def version_key(self, key) -> str:
+        return f"{self.name}:version:{key}"
+
+    def _get_local(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at, version = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _set_local(self, key, value, version=None):
+        self._entries[key] = (value, time.monotonic() + self.local_ttl, version)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Retrieves a value from the local tier, then from the shared tier.
+        """
+        found: dict = self.get_many([key])
+        return found.get(key, default)
+
+    def _get_many_local(self, keys: list) -> tuple[dict, list]:
+        entries: dict = {}
+        missing: list = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._get_local(key)
+                if entry is not None:
+                    entries[key] = entry
+                else:
+                    missing.append(key)
+
+        return entries, missing
+
+    def _shared_request(self, keys: list, missing: list) -> tuple[dict, list]:
+        """
+        Returns the shared keys of the missing values, and every shared key to read: those and
+        the versions of all the keys in a versioned region.
+        """
+        shared_keys: dict = {self.shared_key(key): key for key in missing}
+        request: list = list(shared_keys)
+        if self.checks_versions:
+            request += [self.version_key(key) for key in keys]
+
+        return shared_keys, request
+
+    def _merge(self, keys: list, entries: dict, shared_keys: dict, values: dict) -> dict:
+        """
+        Builds the result of a lookup from the local entries and the shared values read.
+
+        In a versioned region, local entries whose version is no longer the shared one are
+        dropped and count as misses.
+        """
+        found: dict = {}
+
+        with self._lock:
+            for key, entry in entries.items():
+                if self.checks_versions and values.get(self.version_key(key)) != entry[2]:
+                    self._entries.pop(key, None)
+                    continue
+
+                self.local_hits += 1
+                found[key] = entry[0]
+
+            for shared_key, key in shared_keys.items():
+                if shared_key not in values:
+                    continue
+
+                self.shared_hits += 1
+                self._set_local(key, values[shared_key], values.get(self.version_key(key)))
+                found[key] = values[shared_key]
+
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def get_many(self, keys: list) -> dict:
+        """
+        Retrieves several values at once. Keys that are not cached are left out of the result.
+        """
+        entries, missing = self._get_many_local(keys)
+
+        values: dict = {}
+        shared_keys, request = self._shared_request(keys=keys, missing=missing)
+        if request and self.shared is not None:
+            values = self.shared.get_many(request)
+
+        return self._merge(keys=keys, entries=entries, shared_keys=shared_keys, values=values)
+
+    async def aget(self, key, default=None):
+        """
+        Async version of 'get', the local tier is read on the event loop without a thread hop.
+        """
+        found: dict = await self.aget_many([key])
+        return found.get(key, default)
+
+    async def aget_many(self, keys: list) -> dict:
+        """
+        Async version of 'get_many', only the shared tier lookup leaves the event loop.
+        """
+        entries, missing = self._get_many_local(keys)
+
+        values: dict = {}
+        shared_keys, request = self._shared_request(keys=keys, missing=missing)
+        if request and self.shared is not None:
+            values = await self.shared.aget_many(request)
+
+        return self._merge(keys=keys, entries=entries, shared_keys=shared_keys, values=values)
+
+    def _set_many_local(self, data: dict, versions: dict):
+        with self._lock:
+            for key, value in data.items():
+                self._set_local(key, value, versions.get(self.version_key(key)))
+
+    async def aset(self, key, value):
+        await self.aset_many({key: value})
+
+    async def aset_many(self, data: dict):
+        if not data:
+            return
+
+        versions: dict = {}
+        if self.checks_versions:
+            versions = await self.shared.aget_many([self.version_key(key) for key in data])
+
+        self._set_many_local(data=data, versions=versions)
+
+        if self.shared is not None:
+            values: dict = {self.shared_key(key): value for key, value in data.items()}
+            await self.shared.aset_many(values, timeout=self.ttl)
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def set_many(self, data: dict):
+        if not data:
+            return
+
+        versions: dict = {}
+        if self.checks_versions:
+            versions = self.shared.get_many([self.version_key(key) for key in data])
+
+        self._set_many_local(data=data, versions=versions)
+
+        if self.shared is not None:
+            values: dict = {self.shared_key(key): value for key, value in data.items()}
+            self.shared.set_many(values, timeout=self.ttl)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self.shared is not None:
+            self.shared.delete(self.shared_key(key))
+
+        # Local entries live at most 'ttl' seconds, so does the version that outdates them.
+        if self.checks_versions:
+            self.shared.set(self.version_key(key), uuid.uuid4().hex, timeout=self.ttl)
+
+    async def adelete(self, key):
+        """
+        Async version of 'delete', only the shared tier writes leave the event loop.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self.shared is not None:
+            await self.shared.adelete(self.shared_key(key))
+
+        if self.checks_versions:
+            await self.shared.aset(self.version_key(key), uuid.uuid4().hex, timeout=self.ttl)
+
+    def delete_local(self, key):
+        """
+        Removes a key from the local tier only, the shared tier is left to the writer.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Clears the local tier. Shared entries expire on their own.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits: int = self.local_hits + self.shared_hits
+            requests: int = hits + self.misses
+
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "local_ttl": self.local_ttl,
+                "shared_alias": self.shared_alias,
+                "versioned": self.versioned,
+                "hits": hits,
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(hits / requests, 4) if requests else None,
+            }
+
+
+REGIONS: dict[str, CacheRegion] = {}
+_regions_lock = threading.Lock()
+
+
+def get_region(name: str) -> CacheRegion:
+    """
+    Returns the cache region with the given name, creating it from settings.CACHE_REGIONS.
+    """
+    with _regions_lock:
+        if name not in REGIONS:
+            config: dict = getattr(settings, "CACHE_REGIONS", {}).get(name, {})
+            REGIONS[name] = CacheRegion(
+                name=name,
+                maxsize=config.get("MAXSIZE", 1024),
+                ttl=config.get("TTL", 60),
+                shared_alias=config.get("SHARED_ALIAS"),
+                versioned=config.get("VERSIONED", False),
+                local_ttl=config.get("LOCAL_TTL"),
+                processes=settings.ASGI_SERVER["WORKERS"],
+            )
+
+        return REGIONS[name]
+
+
+def get_stats() -> dict:
+    """
+    Returns the counters of every cache region in use.
+    """
+    return {name: region.stats() for name, region in REGIONS.items()}
+
+
+class CountCache:
+    """
+    Totals of queries, served from a cache region and refreshed in the background.
+
+    A total older than 'refresh_after' seconds is still returned while a single task per key
+    counts again, so no request waits for a count. Unknown totals are None until counted.
+    """
+
+    def __init__(self, region: CacheRegion, refresh_after: float = 60):
+        self.region = region
+        self.refresh_after = refresh_after
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    async def get(self, key: str, count) -> int | None:
+        """
+        Args:
+            key (str): The key of the total.
+            count: A coroutine function returning the exact total.
+        """
+        entry: tuple | None = await self.region.aget(key)
+
+        if entry is None or time.time() - entry[1] > self.refresh_after:
+            if key not in self._refreshing:
+                self._refreshing[key] = asyncio.create_task(self.refresh(key=key, count=count))
+
+        return entry[0] if entry is not None else None
+
+    async def refresh(self, key: str, count):
+        try:
+            total: int = await count()
+            await self.region.aset(key, (total, time.time()))
+
+        except Exception:
+            logger.exception("Count of '%s' failed.", key)
+
+        finally:
+            self._refreshing.pop(key, None)
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from django.conf import settings
+
+from pymongo.errors import OperationFailure, PyMongoError
+
+from utils.mongo import MongoRepository
+
+
+logger = logging.getLogger(__name__)
+
+# { collection: [handler] }
+SUBSCRIBERS: dict[str, list] = {}
+
+# Server error codes of a resume token that is no longer in the oplog.
+HISTORY_LOST_CODES: tuple = (136, 280, 286)
+
+
+def subscribe(collection: str, handler):
+    """
+    Registers a function called with every change event of a collection.
+
+    Handlers run on the event loop of the worker and must be quick, typically deleting
+    cache entries. They also receive the events of writes made by the current process.
+    """
+    SUBSCRIBERS.setdefault(collection, []).append(handler)
+    return handler
+
+
+class ChangeStreamWorker(MongoRepository):
+    """
+    Tails a change stream on the subscribed collections and fans the events out to the
+    subscribed handlers, so write paths do not have to know which caches to invalidate
+    and every process keeps its local cache tier coherent.
+
+    The resume token is saved in the 'change_stream_tokens' collection every
+    'save_interval_ms' milliseconds and on shutdown, a restarted worker replays the
+    events it missed. If the token is no longer in the oplog, every subscribed handler
+    receives an 'invalidate_all' event and the stream starts over from now.
+
+    Change streams require a replica set.
+    """
+
+    def __init__(self, enabled: bool = False, name: str = "default", save_interval_ms: int = 1000):
+        self.enabled = enabled
+        self.name = name
+        self.save_interval = save_interval_ms / 1000
+
+        self.resume_token: dict | None = None
+        self.saved_token: dict | None = None
+        self.saved_at: float = 0
+
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        if self.enabled and SUBSCRIBERS:
+            self._task = asyncio.create_task(self.run())
+
+    async def get_token(self) -> dict | None:
+        document: dict | None = await self.polls_db.change_stream_tokens.find_one(
+            {"_id": self.name}
+        )
+        return document["token"] if document else None
+
+    async def save_token(self):
+        if self.resume_token is None or self.resume_token == self.saved_token:
+            return
+
+        await self.polls_db.change_stream_tokens.update_one(
+            {"_id": self.name},
+            {"$set": {"token": self.resume_token, "updated_at": datetime.now()}},
+            upsert=True,
+        )
+
+        self.saved_token = self.resume_token
+        self.saved_at = time.monotonic()
+
+    def dispatch(self, change: dict):
+        collection: str | None = change.get("ns", {}).get("coll")
+
+        handlers: list = SUBSCRIBERS.get(collection, [])
+        if change["operationType"] == "invalidate_all":
+            handlers = [handler for handlers in SUBSCRIBERS.values() for handler in handlers]
+
+        for handler in handlers:
+            try:
+                handler(change)
+
+            except Exception:
+                logger.exception("Change stream handler failed.")
+
+    async def watch(self):
+        """
+        Tails the change stream until it fails or the worker is cancelled.
+        """
+        pipeline: list = [
+            {"$match": {"ns.coll": {"$in": list(SUBSCRIBERS)}}},
+            {"$project": {"operationType": 1, "ns": 1, "documentKey": 1, "updateDescription": 1}},
+        ]
+
+        async with self.polls_db.watch(
+            pipeline, resume_after=self.resume_token, max_await_time_ms=1000
+        ) as stream:
+            while stream.alive:
+                change: dict | None = await stream.try_next()
+                if change is not None:
+                    self.dispatch(change=change)
+
+                # Also moves forward when idle (post batch resume token).
+                self.resume_token = stream.resume_token
+
+                if time.monotonic() - self.saved_at >= self.save_interval:
+                    await self.save_token()
+
+    async def run(self):
+        loaded: bool = False
+
+        while True:
+            try:
+                if not loaded:
+                    self.resume_token = await self.get_token()
+                    self.saved_token = self.resume_token
+                    loaded = True
+
+                await self.watch()
+
+            except OperationFailure as error:
+                if error.code not in HISTORY_LOST_CODES:
+                    logger.exception("Change stream failed, restarting.")
+                    await asyncio.sleep(1)
+                    continue
+
+                logger.warning("Change stream resume token lost, invalidating all caches.")
+                self.resume_token = None
+                self.dispatch(change={"operationType": "invalidate_all"})
+
+            except PyMongoError:
+                logger.exception("Change stream failed, restarting.")
+                await asyncio.sleep(1)
+
+    async def close(self):
+        """
+        Stops tailing and saves the last resume token.
+        """
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        await self.save_token()
+
+
+change_stream_worker = ChangeStreamWorker(
+    enabled=settings.CHANGE_STREAMS["ENABLED"],
+    name=settings.CHANGE_STREAMS["NAME"],
+    save_interval_ms=settings.CHANGE_STREAMS["SAVE_INTERVAL_MS"],
+)
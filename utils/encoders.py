@@ -0,0 +1,84 @@
+import math
+from datetime import datetime
+
+from bson import json_util
+from bson.objectid import ObjectId
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def format_datetime(value: datetime) -> str | None:
+    """
+    Formats a datetime like the relaxed Extended JSON '$date' of 'bson.json_util'.
+
+    Returns None for dates json_util represents as '$numberLong' (before 1970).
+    """
+    if value.tzinfo is not None:
+        if value.utcoffset():
+            return None
+        value = value.replace(tzinfo=None)
+
+    if value < EPOCH:
+        return None
+
+    millis: int = value.microsecond // 1000
+    fraction: str = ".%03d" % millis if millis else ""
+
+    return f"{value.strftime('%Y-%m-%dT%H:%M:%S')}{fraction}Z"
+
+
+def to_extended_json(value):
+    """
+    Converts a BSON value to relaxed Extended JSON in a single pass.
+
+    Same output as 'bson.json_util._json_convert', with fast paths for the types found in
+    polls and comments, other BSON types are delegated to json_util.
+    """
+    if isinstance(value, dict):
+        return {key: to_extended_json(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [to_extended_json(item) for item in value]
+
+    if value is None or isinstance(value, (str, int)):
+        return value
+
+    if isinstance(value, float) and math.isfinite(value):
+        # json_util wraps NaN and Infinity in '$numberDouble'.
+        return value
+
+    if isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+
+    if isinstance(value, datetime):
+        date: str | None = format_datetime(value)
+        if date is not None:
+            return {"$date": date}
+
+    return json_util._json_convert(value)
+
+
+def encode_document(document: dict) -> dict:
+    """
+    Converts a BSON document to the API shape in a single pass.
+
+    '_id' is renamed to 'id', top-level ObjectId and datetime values are flattened to strings
+    and nested values are converted to Extended JSON.
+    """
+    data: dict = {}
+
+    for key, value in document.items():
+        if isinstance(value, ObjectId):
+            value = str(value)
+
+        elif isinstance(value, datetime):
+            date: str | None = format_datetime(value)
+            value = date if date is not None else to_extended_json(value)["$date"]
+
+        else:
+            value = to_extended_json(value)
+
+        data["id" if key == "_id" else key] = value
+
+    return data
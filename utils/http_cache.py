@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from django.utils.cache import patch_vary_headers
+
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(*parts) -> str:
+    """
+    Builds a strong ETag from the parts identifying a representation.
+    """
+    raw: str = ":".join(str(part) for part in parts)
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def make_data_etag(data) -> str:
+    """
+    Builds a strong ETag from the data of a response, for responses without a version.
+    """
+    raw: str = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return make_etag(raw)
+
+
+def etag_matches(request, etag: str) -> bool:
+    """
+    Checks the 'If-None-Match' header of a request against an ETag (weak comparison).
+    """
+    header: str | None = request.headers.get("If-None-Match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """
+    Adds the validation headers to a response.
+
+    Representations depend on the session user, caches must revalidate them per cookie.
+    """
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    patch_vary_headers(response, ("Cookie",))
+
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return set_etag(response=Response(status=status.HTTP_304_NOT_MODIFIED), etag=etag)
+
+
+def conditional_response(request, data, etag: str | None = None) -> Response:
+    """
+    Answers with 304 when the client holds the current representation, with 200 otherwise.
+
+    Args:
+        request: The HTTP request object.
+        data: The response data.
+        etag (str): The ETag of the data, derived from the data if not provided.
+    """
+    etag = etag or make_data_etag(data=data)
+    if etag_matches(request=request, etag=etag):
+        return not_modified(etag=etag)
+
+    return set_etag(response=Response(data=data, status=status.HTTP_200_OK), etag=etag)
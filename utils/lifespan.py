@@ -0,0 +1,65 @@
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+STARTUP_HANDLERS: list = []
+SHUTDOWN_HANDLERS: list = []
+
+
+def on_startup(handler):
+    """
+    Registers a coroutine function to run when the ASGI server starts.
+    """
+    STARTUP_HANDLERS.append(handler)
+    return handler
+
+
+def on_shutdown(handler):
+    """
+    Registers a coroutine function to run when the ASGI server shuts down.
+    """
+    SHUTDOWN_HANDLERS.append(handler)
+    return handler
+
+
+class LifespanMiddleware:
+    """
+    ASGI middleware handling the 'lifespan' protocol, which Django's ASGI handler rejects.
+
+    Startup handlers run before the server accepts requests, shutdown handlers run in reverse
+    order once the server stops accepting them, on the same event loop as the requests.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            return await self.app(scope, receive, send)
+
+        while True:
+            message: dict = await receive()
+
+            if message["type"] == "lifespan.startup":
+                try:
+                    for handler in STARTUP_HANDLERS:
+                        await handler()
+
+                except Exception as error:
+                    logger.exception("Lifespan startup failed.")
+                    await send({"type": "lifespan.startup.failed", "message": str(error)})
+                    return
+
+                await send({"type": "lifespan.startup.complete"})
+
+            elif message["type"] == "lifespan.shutdown":
+                for handler in reversed(SHUTDOWN_HANDLERS):
+                    try:
+                        await handler()
+
+                    except Exception:
+                        logger.exception("Lifespan shutdown handler failed.")
+
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,274 @@
+import asyncio
+import atexit
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient, monitoring, read_preferences
+from pymongo.database import Database
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """
+    Connection pool listener (CMAP events) keeping counters per server address.
+
+    'in_use' is the number of connections checked out right now, 'checkout_failed' counts
+    the operations that timed out waiting for a connection ('WAIT_QUEUE_TIMEOUT_MS').
+    """
+
+    COUNTERS: tuple = (
+        "created",
+        "closed",
+        "in_use",
+        "checkouts",
+        "checkout_failed",
+        "cleared",
+    )
+
+    def __init__(self):
+        self._stats: dict = {}
+        self._lock = threading.Lock()
+
+    def _inc(self, address: tuple, counter: str, delta: int = 1):
+        key: str = "%s:%s" % address
+        with self._lock:
+            stats: dict = self._stats.setdefault(key, dict.fromkeys(self.COUNTERS, 0))
+            stats[counter] += delta
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {address: dict(stats) for address, stats in self._stats.items()}
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._inc(event.address, "cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._inc(event.address, "created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._inc(event.address, "closed")
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        self._inc(event.address, "checkout_failed")
+
+    def connection_checked_out(self, event):
+        self._inc(event.address, "checkouts")
+        self._inc(event.address, "in_use")
+
+    def connection_checked_in(self, event):
+        self._inc(event.address, "in_use", -1)
+
+
+pool_stats = PoolStats()
+
+_clients: dict = {}
+_sync_client: MongoClient | None = None
+_probe_client: MongoClient | None = None
+_lock = threading.Lock()
+
+
+def get_client_options() -> dict:
+    """
+    Builds the MongoClient keyword arguments from settings.MONGO.
+    """
+    config: dict = settings.MONGO
+
+    options: dict = {
+        "maxPoolSize": config["MAX_POOL_SIZE"],
+        "minPoolSize": config["MIN_POOL_SIZE"],
+        "serverSelectionTimeoutMS": config["SERVER_SELECTION_TIMEOUT_MS"],
+        "readPreference": config["READ_PREFERENCE"],
+        "appname": config["APP_NAME"],
+        "event_listeners": [pool_stats],
+    }
+
+    if config["MAX_IDLE_TIME_MS"]:
+        options["maxIdleTimeMS"] = config["MAX_IDLE_TIME_MS"]
+
+    if config["WAIT_QUEUE_TIMEOUT_MS"]:
+        options["waitQueueTimeoutMS"] = config["WAIT_QUEUE_TIMEOUT_MS"]
+
+    if config["COMPRESSORS"]:
+        options["compressors"] = config["COMPRESSORS"]
+
+    return options
+
+
+def get_client() -> AsyncIOMotorClient:
+    """
+    Returns the Motor client of the running event loop, creating it on first use.
+
+    A Motor client is bound to the loop it first runs on, so each loop (one per ASGI worker,
+    one per 'asyncio.run' in commands) gets its own client and connection pool.
+    """
+    loop = asyncio.get_running_loop()
+
+    client: AsyncIOMotorClient | None = _clients.get(loop)
+    if client is None:
+        with _lock:
+            client = _clients.get(loop)
+            if client is None:
+                # Drop the clients of loops that are gone.
+                for closed in [l for l in _clients if l.is_closed()]:
+                    _clients.pop(closed).close()
+
+                client = AsyncIOMotorClient(settings.MONGO["URI"], **get_client_options())
+                _clients[loop] = client
+
+    return client
+
+
+def get_sync_client() -> MongoClient:
+    """
+    Returns the process wide PyMongo client, for management commands and sync views.
+    """
+    global _sync_client
+
+    if _sync_client is None:
+        with _lock:
+            if _sync_client is None:
+                _sync_client = MongoClient(settings.MONGO["URI"], **get_client_options())
+
+    return _sync_client
+
+
+def get_probe_client() -> MongoClient:
+    """
+    Returns the process wide PyMongo client of the health check.
+
+    It has its own small pool and short timeouts, so a probe fails within
+    HEALTH_CHECK_TIMEOUT_MS when MongoDB is unreachable instead of waiting for the server
+    selection timeout of the application clients.
+    """
+    global _probe_client
+
+    if _probe_client is None:
+        with _lock:
+            if _probe_client is None:
+                timeout: int = settings.MONGO["HEALTH_CHECK_TIMEOUT_MS"]
+                options: dict = {
+                    **get_client_options(),
+                    "maxPoolSize": 1,
+                    "minPoolSize": 0,
+                    "serverSelectionTimeoutMS": timeout,
+                    "connectTimeoutMS": timeout,
+                    "socketTimeoutMS": timeout,
+                }
+                _probe_client = MongoClient(settings.MONGO["URI"], **options)
+
+    return _probe_client
+
+
+READ_PREFERENCE_MODES: dict = {
+    "primary": read_preferences.Primary,
+    "primaryPreferred": read_preferences.PrimaryPreferred,
+    "secondary": read_preferences.Secondary,
+    "secondaryPreferred": read_preferences.SecondaryPreferred,
+    "nearest": read_preferences.Nearest,
+}
+
+
+def get_read_preference(route: str | None):
+    """
+    Builds the read preference of a route from settings.MONGO["READ_ROUTES"].
+
+    Returns None, the client default, for no route or an unknown one.
+    """
+    config: dict | None = settings.MONGO["READ_ROUTES"].get(route) if route else None
+    if config is None:
+        return None
+
+    if config["MODE"] not in READ_PREFERENCE_MODES:
+        message: str = f"Unknown read preference '{config['MODE']}' for route '{route}'."
+        raise ImproperlyConfigured(message)
+
+    max_staleness: int = config["MAX_STALENESS_SECONDS"]
+    if 0 < max_staleness < 90:
+        message: str = f"MAX_STALENESS_SECONDS of route '{route}' must be at least 90."
+        raise ImproperlyConfigured(message)
+
+    mode = READ_PREFERENCE_MODES[config["MODE"]]
+    if mode is read_preferences.Primary:
+        return mode()
+
+    return mode(max_staleness=max_staleness or -1)
+
+
+def get_database(client: AsyncIOMotorClient | MongoClient, read_route: str | None = None):
+    return client.get_database(
+        settings.MONGO["DATABASE"], read_preference=get_read_preference(route=read_route)
+    )
+
+
+def get_sync_database() -> Database:
+    return get_database(client=get_sync_client())
+
+
+def get_probe_database() -> Database:
+    return get_database(client=get_probe_client())
+
+
+async def close_clients():
+    """
+    Closes the Motor client of the running event loop, used on ASGI lifespan shutdown.
+    """
+    client: AsyncIOMotorClient | None = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        client.close()
+
+
+@atexit.register
+def close_all_clients():
+    global _sync_client, _probe_client
+
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+        if _probe_client is not None:
+            _probe_client.close()
+            _probe_client = None
+
+
+class MongoRepository:
+    """
+    Base class for the MongoDB repositories.
+
+    'client' and 'polls_db' resolve the client of the running event loop on each access,
+    nothing connects at import time.
+
+    'read_route' names an entry of settings.MONGO["READ_ROUTES"] applied to 'polls_db',
+    for reads that tolerate replication lag. Transactions always read from the primary.
+    """
+
+    read_route: str | None = None
+
+    @property
+    def client(self) -> AsyncIOMotorClient:
+        return get_client()
+
+    @property
+    def polls_db(self):
+        return get_database(client=self.client, read_route=self.read_route)
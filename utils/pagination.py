@@ -1,8 +1,36 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+
+from bson import json_util
+from bson.objectid import ObjectId
+from django.conf import settings
 from django.core.paginator import Paginator
 from asgiref.sync import sync_to_async
 
+from rest_framework.exceptions import ValidationError
+
+from utils.cache import CountCache, get_region
+
 
 class Pagination:
+    """
+    Pagination of list results.
+
+    Offset pages support three 'count' modes:
+    - exact: the whole result is loaded and counted, 'total_items' and 'total_pages' are exact.
+    - none: only page_size + 1 rows are fetched, 'has_next' comes from the extra row and the
+      totals are None.
+    - cached: same as 'none', with the totals of 'counts', refreshed in the background.
+    """
+
+    COUNT_MODES: tuple = ("exact", "none", "cached")
+
+    counts = CountCache(
+        region=get_region("counts"),
+        refresh_after=settings.PAGINATION["COUNT_REFRESH_SECONDS"],
+    )
+
     def paginate(self, object_list: list, page: int, page_size: int):
         items: list = []
         message: str = ""
@@ -45,3 +73,228 @@ class Pagination:
         return await sync_to_async(self.paginate)(
             object_list=object_list, page=page, page_size=page_size
         )
+
+    def validate_count_mode(self, count: str, page: int):
+        if count not in self.COUNT_MODES:
+            message: str = "Invalid count mode"
+            raise ValidationError(detail={"message": message})
+
+        if count != "exact":
+            self.validate_page(page=page)
+
+    def validate_page(self, page: int):
+        if page < 1:
+            message: str = "Invalid page"
+            raise ValidationError(detail={"message": message})
+
+    def get_offset(self, page: int, page_size: int) -> int:
+        return (page - 1) * page_size
+
+    def paginate_offset(
+        self, object_list: list, page: int, page_size: int, total_items: int | None = None
+    ):
+        """
+        Builds a page from an offset query that fetched up to page_size + 1 rows.
+
+        Args:
+            object_list (list): The rows returned by the offset query.
+            page (int): The page number.
+            page_size (int): The number of items per page.
+            total_items (int): The size of the whole result if known, used for the totals.
+        """
+        message: str = ""
+
+        has_next: bool = len(object_list) > page_size
+        items: list = object_list[:page_size]
+
+        total_pages: int | None = None
+        if total_items is not None:
+            total_pages = max(1, -(-total_items // page_size))
+
+        if not items and page == 1:
+            message = "No result found"
+        elif not has_next:
+            message = "No more results"
+
+        data: dict = {
+            "items": items,
+            "message": message,
+            "paginator": {
+                "page": page,
+                "total_items": total_items,
+                "total_pages": total_pages,
+                "has_previous": page > 1,
+                "has_next": has_next,
+            },
+        }
+
+        return data
+
+    async def a_paginate_offset(
+        self,
+        fetch,
+        page: int,
+        page_size: int,
+        count: str = "none",
+        count_key: str | None = None,
+        count_query=None,
+        total_items: int | None = None,
+    ):
+        """
+        Fetches and builds an offset page without counting the result.
+
+        Args:
+            fetch: A coroutine function taking 'skip' and 'limit' and returning the rows.
+            page (int): The page number.
+            page_size (int): The number of items per page.
+            count (str): The count mode, 'none' or 'cached'.
+            count_key (str): The key of the cached total.
+            count_query: A coroutine function returning the exact total, run in the background.
+            total_items (int): A total already known, e.g. a counter of the parent document.
+        """
+        offset: int = self.get_offset(page=page, page_size=page_size)
+        rows: list = await fetch(skip=offset, limit=page_size + 1)
+
+        if count == "cached" and total_items is None and count_query is not None:
+            total_items = await self.counts.get(key=count_key, count=count_query)
+
+        if count != "cached":
+            total_items = None
+
+        return self.paginate_offset(
+            object_list=rows, page=page, page_size=page_size, total_items=total_items
+        )
+
+    def paginate_window(self, object_list: list, total_items: int, page: int, page_size: int):
+        """
+        Builds a page like 'paginate' from the first items of a result of known size.
+
+        Returns None when the page is not fully held in object_list, the caller then falls
+        back to the whole result.
+
+        Args:
+            object_list (list): The first items of the result, in order.
+            total_items (int): The size of the whole result.
+            page (int): The page number.
+            page_size (int): The number of items per page.
+        """
+        if page < 1 or page_size < 1:
+            return None
+
+        total_pages: int = max(1, -(-total_items // page_size))
+        if page > total_pages:
+            return None
+
+        start: int = (page - 1) * page_size
+        end: int = min(start + page_size, total_items)
+        if end > len(object_list):
+            return None
+
+        message: str = ""
+        has_previous: bool = False
+        has_next: bool = False
+
+        if total_items == 0:
+            message = "No result found"
+        else:
+            has_previous = page > 1
+            has_next = page < total_pages
+
+            if not has_next:
+                message = "No more results"
+
+        data: dict = {
+            "items": object_list[start:end],
+            "message": message,
+            "paginator": {
+                "page": page,
+                "total_items": total_items,
+                "total_pages": total_pages,
+                "has_previous": has_previous,
+                "has_next": has_next,
+            },
+        }
+
+        return data
+
+    def encode_cursor(self, value, id) -> str:
+        """
+        Encodes a sort key value and a tiebreaker ID into an opaque cursor.
+        """
+        raw: str = json_util.dumps([value, id])
+        cursor: str = urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        return cursor
+
+    def decode_cursor(self, cursor: str, raise_exception: bool = True) -> tuple | None:
+        """
+        Decodes an opaque cursor into its (value, id) pair.
+
+        An empty cursor means the first page and decodes to None. The value must be a scalar or
+        a datetime and the ID an ObjectId or an integer, cursors are used in query filters.
+        """
+        if not cursor:
+            return None
+
+        try:
+            padding: str = "=" * (-len(cursor) % 4)
+            raw: str = urlsafe_b64decode(cursor + padding).decode()
+            value, id = json_util.loads(raw)
+
+            if isinstance(value, bool) or not isinstance(value, (str, int, float, datetime)):
+                raise ValueError("Invalid cursor value")
+
+            if isinstance(id, bool) or not isinstance(id, (ObjectId, int)):
+                raise ValueError("Invalid cursor ID")
+
+        except (BinasciiError, UnicodeDecodeError, ValueError, TypeError):
+            if raise_exception:
+                message: str = "Invalid cursor"
+                raise ValidationError(detail={"message": message})
+
+            return None
+
+        return value, id
+
+    def paginate_keyset(
+        self, object_list: list, page_size: int, cursor: str, key: str, id_key: str = "_id"
+    ):
+        """
+        Builds a page from a keyset query result.
+
+        The query must be sorted by (key, id_key) and fetch up to page_size + 1 rows,
+        the extra row only tells if there is a next page.
+
+        Args:
+            object_list (list): The rows returned by the keyset query.
+            page_size (int): The number of items per page.
+            cursor (str): The cursor used to fetch the rows ("" for the first page).
+            key (str): The field the query is sorted by.
+            id_key (str): The unique field used as tiebreaker.
+        """
+        message: str = ""
+
+        has_next: bool = len(object_list) > page_size
+        items: list = object_list[:page_size]
+
+        next_cursor: str | None = None
+        if has_next:
+            last: dict = items[-1]
+            next_cursor = self.encode_cursor(value=last[key], id=last[id_key])
+
+        if not items and not cursor:
+            message = "No result found"
+        elif not has_next:
+            message = "No more results"
+
+        data: dict = {
+            "items": items,
+            "message": message,
+            "paginator": {
+                "page_size": page_size,
+                "cursor": cursor,
+                "next_cursor": next_cursor,
+                "has_next": has_next,
+            },
+        }
+
+        return data
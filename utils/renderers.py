@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from utils.encoders import format_datetime
+
+
+class APIJSONEncoder(JSONEncoder):
+    """
+    JSON encoder turning ObjectId and datetime values into their API shape while rendering,
+    so BSON values left in a response do not need an extra conversion pass.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, ObjectId):
+            return str(obj)
+
+        if isinstance(obj, datetime):
+            date: str | None = format_datetime(obj)
+            if date is not None:
+                return date
+
+        return super().default(obj)
+
+
+class APIJSONRenderer(JSONRenderer):
+    encoder_class = APIJSONEncoder